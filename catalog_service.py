@@ -2525,6 +2525,9 @@ def derive_ship_stats_from_parts(
     }
 
 
+_G0_M_S2 = 9.80665  # standard gravity
+
+
 def compute_wet_mass_kg(dry_mass_kg: float, fuel_kg: float) -> float:
     return max(0.0, float(dry_mass_kg or 0.0)) + max(0.0, float(fuel_kg or 0.0))
 
@@ -2534,7 +2537,7 @@ def compute_acceleration_gs(dry_mass_kg: float, fuel_kg: float, thrust_kn: float
     if wet_mass_kg <= 0.0:
         return 0.0
     thrust_n = max(0.0, float(thrust_kn or 0.0)) * 1000.0
-    return thrust_n / (wet_mass_kg * 9.80665)
+    return thrust_n / (wet_mass_kg * _G0_M_S2)
 
 
 def normalize_shipyard_item_ids(raw_parts: Any) -> List[str]:
@@ -2567,8 +2570,7 @@ def compute_delta_v_remaining_m_s(dry_mass_kg: float, fuel_kg: float, isp_s: flo
     isp = max(0.0, float(isp_s or 0.0))
     if dry <= 0.0 or fuel <= 0.0 or isp <= 0.0:
         return 0.0
-    g0 = 9.80665
-    return isp * g0 * math.log((dry + fuel) / dry)
+    return isp * _G0_M_S2 * math.log1p(fuel / dry)
 
 
 def compute_fuel_needed_for_delta_v_kg(dry_mass_kg: float, fuel_kg: float, isp_s: float, dv_m_s: float) -> float:
@@ -2581,10 +2583,8 @@ def compute_fuel_needed_for_delta_v_kg(dry_mass_kg: float, fuel_kg: float, isp_s
     if dry <= 0.0 or fuel <= 0.0 or isp <= 0.0:
         return fuel + 1.0
 
-    g0 = 9.80665
-    m0 = dry + fuel
-    mf = m0 / math.exp(dv / (isp * g0))
-    used = m0 - mf
+    # m0 - m0/exp(x) == -m0 * expm1(-x), without the cancellation at small dv.
+    used = -(dry + fuel) * math.expm1(-dv / (isp * _G0_M_S2))
     return max(0.0, min(used, fuel))
 
 
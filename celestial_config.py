@@ -845,6 +845,26 @@ def compute_body_state(
     return _compute_body_state_recursive(bodies_by_id, body_id, game_time_s)
 
 
+def compute_body_states(
+    config: Dict[str, Any],
+    body_id: str,
+    game_times_s: Sequence[float],
+) -> List[Optional[Tuple[Vec3, Vec3]]]:
+    """Batch form of compute_body_state for one body at many times.
+
+    The body index is built once for the whole batch.  A time whose state
+    cannot be computed yields None in its slot instead of raising.
+    """
+    bodies_by_id = _build_bodies_by_id(config)
+    states: List[Optional[Tuple[Vec3, Vec3]]] = []
+    for t in game_times_s:
+        try:
+            states.append(_compute_body_state_recursive(bodies_by_id, body_id, t))
+        except Exception:
+            states.append(None)
+    return states
+
+
 def _compute_body_state_recursive(
     bodies_by_id: Dict[str, Dict[str, Any]],
     body_id: str,
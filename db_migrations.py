@@ -1110,6 +1110,13 @@ def _migration_0031_inventory_quantity_guards(conn: sqlite3.Connection) -> None:
     """)
 
 
+def _migration_0032_ships_arrives_at_index(conn: sqlite3.Connection) -> None:
+    """Partial index over in-transit ships so settle_arrivals skips docked ones."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ships_arrives_at ON ships(arrives_at) WHERE arrives_at IS NOT NULL"
+    )
+
+
 def _migrations() -> List[Migration]:
     return [
         Migration("0001_initial", "Create core gameplay/auth tables", _migration_0001_initial),
@@ -1143,6 +1150,7 @@ def _migrations() -> List[Migration]:
     Migration("0029_unified_research_tree", "Reset research unlocks for unified research tree, auto-unlock starter_corp", _migration_0029_unified_research_tree),
     Migration("0030_water_is_fuel", "Merge water cargo stacks into ships.fuel_kg", _migration_0030_water_is_fuel),
     Migration("0031_inventory_quantity_guards", "Add DB triggers to prevent negative inventory quantities", _migration_0031_inventory_quantity_guards),
+    Migration("0032_ships_arrives_at_index", "Add partial index on ships.arrives_at for arrival settling", _migration_0032_ships_arrives_at_index),
     ]
 
 
@@ -6,6 +6,7 @@ Extracted from main.py — handles:
   /api/time
   /api/transfer_quote
   /api/transfer_quote_advanced
+  /api/ships/{ship_id}
   /api/ships/{ship_id}/transfer
   /api/ships/{ship_id}/inventory/jettison
   /api/ships/{ship_id}/deconstruct
@@ -855,6 +856,147 @@ def api_transfer_quote_advanced(
     return result
 
 
+_SHIP_STATE_COLUMNS = """
+    id,name,shape,color,size_px,notes_json,
+    location_id,from_location_id,to_location_id,departed_at,arrives_at,
+    dv_planned_m_s,dock_slot,
+    parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s,
+    corp_id,
+    transit_from_x,transit_from_y,transit_to_x,transit_to_y,
+    trajectory_json,
+    orbit_json,maneuver_json,orbit_body_id,
+    orbit_predictions_json
+"""
+
+
+def _ship_payload(m, conn: sqlite3.Connection, r, *, is_own: bool, corp_name: str) -> Dict[str, Any]:
+    """Serialize one ships row the way /api/state reports it.
+
+    Detailed fields (parts, cargo, notes, power) are only included when
+    ``is_own`` is set.
+    """
+    ship_corp_id = r["corp_id"] or None
+    raw_parts, _raw_cargo = m.split_ship_parts_and_cargo(r["parts_json"] or "[]")
+    parts = m.normalize_parts(raw_parts)
+    fuel_kg = max(0.0, float(r["fuel_kg"] or 0.0))
+    stats = m.derive_ship_stats_from_parts(
+        parts,
+        current_fuel_kg=fuel_kg,
+    )
+
+    ship_data = {
+        "id": r["id"],
+        "name": r["name"],
+        "shape": r["shape"],
+        "color": r["color"],
+        "size_px": r["size_px"],
+        "location_id": r["location_id"],
+        "from_location_id": r["from_location_id"],
+        "to_location_id": r["to_location_id"],
+        "departed_at": r["departed_at"],
+        "arrives_at": r["arrives_at"],
+        "status": _ship_status(r),
+        "corp_id": ship_corp_id,
+        "is_own": is_own,
+        "corp_name": corp_name,
+        # Basic stats exposed for all ships (tooltip, Δv bar, mass display)
+        "dry_mass_kg": stats["dry_mass_kg"],
+        "fuel_kg": stats["fuel_kg"],
+        "total_mass_kg": stats["dry_mass_kg"] + stats["fuel_kg"],
+        "thrust_kn": stats["thrust_kn"],
+        "delta_v_remaining_m_s": m.compute_delta_v_remaining_m_s(
+            stats["dry_mass_kg"],
+            stats["fuel_kg"],
+            stats["isp_s"],
+        ),
+    }
+
+    # Attach snapshot coordinates for in-transit ships
+    if r["arrives_at"] and r["transit_from_x"] is not None:
+        ship_data["transit_from_x"] = r["transit_from_x"]
+        ship_data["transit_from_y"] = r["transit_from_y"]
+        ship_data["transit_to_x"] = r["transit_to_x"]
+        ship_data["transit_to_y"] = r["transit_to_y"]
+
+    # Attach trajectory polyline for in-transit ships
+    # New format: flat [[x,y], ...] array.  Legacy format was [{from_id, to_id, points}, ...]
+    if r["arrives_at"] and r["trajectory_json"]:
+        try:
+            traj = json.loads(r["trajectory_json"])
+            if traj:
+                # Normalise legacy leg-object format to flat point list
+                if isinstance(traj, list) and traj and isinstance(traj[0], dict):
+                    flat = []
+                    for seg in traj:
+                        flat.extend(seg.get("points") or [])
+                    ship_data["trajectory"] = flat if flat else None
+                else:
+                    ship_data["trajectory"] = traj
+        except (json.JSONDecodeError, TypeError):
+            pass
+
+    # Backfill: generate trajectory from orbit predictions for ships
+    # that have predictions but no stored trajectory polyline.
+    if r["arrives_at"] and not ship_data.get("trajectory") and r["orbit_predictions_json"]:
+        try:
+            preds_raw = json.loads(r["orbit_predictions_json"])
+            if preds_raw:
+                gen_traj = _trajectory_from_orbit_predictions(preds_raw)
+                if gen_traj:
+                    ship_data["trajectory"] = gen_traj
+        except Exception:
+            pass
+
+    # Flag interplanetary transfers for frontend rendering
+    if r["arrives_at"] and r["from_location_id"] and r["to_location_id"]:
+        ship_data["is_interplanetary"] = _is_interplanetary(
+            str(r["from_location_id"]), str(r["to_location_id"])
+        )
+
+    # Orbit model data (Phase 2)
+    if r["orbit_json"]:
+        try:
+            ship_data["orbit"] = json.loads(r["orbit_json"])
+        except (json.JSONDecodeError, TypeError):
+            pass
+    if r["maneuver_json"]:
+        try:
+            maneuvers = json.loads(r["maneuver_json"])
+            if maneuvers:
+                ship_data["maneuvers"] = maneuvers
+        except (json.JSONDecodeError, TypeError):
+            pass
+    if r["orbit_body_id"]:
+        ship_data["orbit_body_id"] = r["orbit_body_id"]
+    if r["orbit_predictions_json"]:
+        try:
+            preds = json.loads(r["orbit_predictions_json"])
+            if preds:
+                ship_data["orbit_predictions"] = preds
+        except (json.JSONDecodeError, TypeError):
+            pass
+
+    # Only include detailed data for own ships
+    if is_own:
+        cargo_stacks = m.get_ship_cargo_stacks(conn, str(r["id"]))
+        resource_catalog = catalog_service.load_resource_catalog()
+        cargo_summary = m.compute_ship_cargo_summary(parts, cargo_stacks, resource_catalog)
+        inventory_items = m.compute_ship_inventory_resources(str(r["id"]), cargo_stacks)
+        ship_data.update({
+            "notes": json.loads(r["notes_json"] or "[]"),
+            "dv_planned_m_s": r["dv_planned_m_s"],
+            "dock_slot": r["dock_slot"],
+            "parts": parts,
+            "cargo_stacks": cargo_stacks,
+            "inventory_items": inventory_items,
+            "cargo_summary": cargo_summary,
+            "isp_s": stats["isp_s"],
+            "power_balance": catalog_service.compute_power_balance(parts),
+        })
+
+    return ship_data
+
+
 @router.get("/api/state")
 def api_state(request: Request, conn: sqlite3.Connection = Depends(get_db)) -> Dict[str, Any]:
     m = _main()
@@ -875,19 +1017,7 @@ def api_state(request: Request, conn: sqlite3.Connection = Depends(get_db)) -> D
         pass  # table may not exist yet
 
     rows = conn.execute(
-        """
-        SELECT id,name,shape,color,size_px,notes_json,
-               location_id,from_location_id,to_location_id,departed_at,arrives_at,
-                 dv_planned_m_s,dock_slot,
-                 parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s,
-                 corp_id,
-                 transit_from_x,transit_from_y,transit_to_x,transit_to_y,
-                 trajectory_json,
-                 orbit_json,maneuver_json,orbit_body_id,
-                 orbit_predictions_json
-        FROM ships
-        ORDER BY id
-        """
+        f"SELECT {_SHIP_STATE_COLUMNS} FROM ships ORDER BY id"
     ).fetchall()
 
     ships = []
@@ -895,126 +1025,8 @@ def api_state(request: Request, conn: sqlite3.Connection = Depends(get_db)) -> D
         ship_corp_id = r["corp_id"] or None
         is_admin = user.get("is_admin") if hasattr(user, "get") else user["is_admin"]
         is_own = (my_corp_id is not None and ship_corp_id == my_corp_id) or (my_corp_id is None and is_admin)
-
-        raw_parts, _raw_cargo = m.split_ship_parts_and_cargo(r["parts_json"] or "[]")
-        parts = m.normalize_parts(raw_parts)
-        fuel_kg = max(0.0, float(r["fuel_kg"] or 0.0))
-        stats = m.derive_ship_stats_from_parts(
-            parts,
-            current_fuel_kg=fuel_kg,
-        )
-
-        ship_data = {
-            "id": r["id"],
-            "name": r["name"],
-            "shape": r["shape"],
-            "color": r["color"],
-            "size_px": r["size_px"],
-            "location_id": r["location_id"],
-            "from_location_id": r["from_location_id"],
-            "to_location_id": r["to_location_id"],
-            "departed_at": r["departed_at"],
-            "arrives_at": r["arrives_at"],
-            "status": _ship_status(r),
-            "corp_id": ship_corp_id,
-            "is_own": is_own,
-            "corp_name": _org_name_map.get(ship_corp_id, "") if ship_corp_id else "",
-            # Basic stats exposed for all ships (tooltip, Δv bar, mass display)
-            "dry_mass_kg": stats["dry_mass_kg"],
-            "fuel_kg": stats["fuel_kg"],
-            "total_mass_kg": stats["dry_mass_kg"] + stats["fuel_kg"],
-            "thrust_kn": stats["thrust_kn"],
-            "delta_v_remaining_m_s": m.compute_delta_v_remaining_m_s(
-                stats["dry_mass_kg"],
-                stats["fuel_kg"],
-                stats["isp_s"],
-            ),
-        }
-
-        # Attach snapshot coordinates for in-transit ships
-        if r["arrives_at"] and r["transit_from_x"] is not None:
-            ship_data["transit_from_x"] = r["transit_from_x"]
-            ship_data["transit_from_y"] = r["transit_from_y"]
-            ship_data["transit_to_x"] = r["transit_to_x"]
-            ship_data["transit_to_y"] = r["transit_to_y"]
-
-        # Attach trajectory polyline for in-transit ships
-        # New format: flat [[x,y], ...] array.  Legacy format was [{from_id, to_id, points}, ...]
-        if r["arrives_at"] and r["trajectory_json"]:
-            try:
-                traj = json.loads(r["trajectory_json"])
-                if traj:
-                    # Normalise legacy leg-object format to flat point list
-                    if isinstance(traj, list) and traj and isinstance(traj[0], dict):
-                        flat = []
-                        for seg in traj:
-                            flat.extend(seg.get("points") or [])
-                        ship_data["trajectory"] = flat if flat else None
-                    else:
-                        ship_data["trajectory"] = traj
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        # Backfill: generate trajectory from orbit predictions for ships
-        # that have predictions but no stored trajectory polyline.
-        if r["arrives_at"] and not ship_data.get("trajectory") and r["orbit_predictions_json"]:
-            try:
-                preds_raw = json.loads(r["orbit_predictions_json"])
-                if preds_raw:
-                    gen_traj = _trajectory_from_orbit_predictions(preds_raw)
-                    if gen_traj:
-                        ship_data["trajectory"] = gen_traj
-            except Exception:
-                pass
-
-        # Flag interplanetary transfers for frontend rendering
-        if r["arrives_at"] and r["from_location_id"] and r["to_location_id"]:
-            ship_data["is_interplanetary"] = _is_interplanetary(
-                str(r["from_location_id"]), str(r["to_location_id"])
-            )
-
-        # Orbit model data (Phase 2)
-        if r["orbit_json"]:
-            try:
-                ship_data["orbit"] = json.loads(r["orbit_json"])
-            except (json.JSONDecodeError, TypeError):
-                pass
-        if r["maneuver_json"]:
-            try:
-                maneuvers = json.loads(r["maneuver_json"])
-                if maneuvers:
-                    ship_data["maneuvers"] = maneuvers
-            except (json.JSONDecodeError, TypeError):
-                pass
-        if r["orbit_body_id"]:
-            ship_data["orbit_body_id"] = r["orbit_body_id"]
-        if r["orbit_predictions_json"]:
-            try:
-                preds = json.loads(r["orbit_predictions_json"])
-                if preds:
-                    ship_data["orbit_predictions"] = preds
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        # Only include detailed data for own ships
-        if is_own:
-            cargo_stacks = m.get_ship_cargo_stacks(conn, str(r["id"]))
-            resource_catalog = catalog_service.load_resource_catalog()
-            cargo_summary = m.compute_ship_cargo_summary(parts, cargo_stacks, resource_catalog)
-            inventory_items = m.compute_ship_inventory_resources(str(r["id"]), cargo_stacks)
-            ship_data.update({
-                "notes": json.loads(r["notes_json"] or "[]"),
-                "dv_planned_m_s": r["dv_planned_m_s"],
-                "dock_slot": r["dock_slot"],
-                "parts": parts,
-                "cargo_stacks": cargo_stacks,
-                "inventory_items": inventory_items,
-                "cargo_summary": cargo_summary,
-                "isp_s": stats["isp_s"],
-                "power_balance": catalog_service.compute_power_balance(parts),
-            })
-
-        ships.append(ship_data)
+        corp_name = _org_name_map.get(ship_corp_id, "") if ship_corp_id else ""
+        ships.append(_ship_payload(m, conn, r, is_own=is_own, corp_name=corp_name))
 
     user_info = {}
     if my_corp_id:
@@ -1039,6 +1051,38 @@ def api_state(request: Request, conn: sqlite3.Connection = Depends(get_db)) -> D
     }
 
 
+@router.get("/api/ships/{ship_id}")
+def api_ship(ship_id: str, request: Request, conn: sqlite3.Connection = Depends(get_db)) -> Dict[str, Any]:
+    """Single-ship view of /api/state, without serializing the whole fleet."""
+    m = _main()
+    now_s = game_now_s()
+    user = require_login(conn, request)
+    m.settle_arrivals(conn, now_s)
+    conn.commit()
+
+    r = conn.execute(
+        f"SELECT {_SHIP_STATE_COLUMNS} FROM ships WHERE id=?",
+        (ship_id,),
+    ).fetchone()
+    if not r:
+        raise HTTPException(status_code=404, detail="Ship not found")
+
+    my_corp_id = user.get("corp_id") if hasattr(user, "get") else None
+    ship_corp_id = r["corp_id"] or None
+    is_admin = user.get("is_admin") if hasattr(user, "get") else user["is_admin"]
+    is_own = (my_corp_id is not None and ship_corp_id == my_corp_id) or (my_corp_id is None and is_admin)
+
+    corp_name = ""
+    if ship_corp_id:
+        org_row = conn.execute("SELECT name FROM organizations WHERE id=?", (ship_corp_id,)).fetchone()
+        corp_name = org_row["name"] if org_row else ""
+
+    return {
+        "server_time": now_s,
+        "ship": _ship_payload(m, conn, r, is_own=is_own, corp_name=corp_name),
+    }
+
+
 @router.post("/api/ships/{ship_id}/transfer")
 def api_ship_transfer(ship_id: str, req: TransferReq, request: Request, conn: sqlite3.Connection = Depends(get_db)) -> Dict[str, Any]:
     m = _main()
@@ -12,7 +12,7 @@ Based on:
 """
 
 import math
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
 Vec3 = Tuple[float, float, float]
 
@@ -47,6 +47,28 @@ def _sub(a: Vec3, b: Vec3) -> Vec3:
     return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
 
 
+def _dist(a: Vec3, b: Vec3) -> float:
+    """|a - b| in one C call, without building the difference tuple."""
+    return math.dist(a, b)
+
+
+def _lagrange_velocities(
+    r1: Vec3, r2: Vec3, f: float, g: float, g_dot: float,
+) -> Tuple[Vec3, Vec3]:
+    """Terminal velocities v1 = (r2 - f·r1)/g and v2 = (ġ·r2 - r1)/g.
+
+    Written out per component: every Lambert solution ends here, and the
+    _scale/_sub form costs five calls and four temporary tuples.
+    """
+    inv_g = 1.0 / g
+    r1x, r1y, r1z = r1
+    r2x, r2y, r2z = r2
+    return (
+        (inv_g * (r2x - f * r1x), inv_g * (r2y - f * r1y), inv_g * (r2z - f * r1z)),
+        (inv_g * (g_dot * r2x - r1x), inv_g * (g_dot * r2y - r1y), inv_g * (g_dot * r2z - r1z)),
+    )
+
+
 # ─── Stumpff functions ───────────────────────────────────────
 
 def _stumpff_c2(psi: float) -> float:
@@ -71,6 +93,17 @@ def _stumpff_c3(psi: float) -> float:
     return (math.sinh(sp) - sp) / ((-psi) * sp)
 
 
+def _stumpff_c2_c3(psi: float) -> Tuple[float, float]:
+    """(c2(ψ), c3(ψ)) sharing one sqrt and one trig/hyperbolic evaluation."""
+    if abs(psi) < 1e-12:
+        return 1.0 / 2.0, 1.0 / 6.0
+    if psi > 0.0:
+        sp = math.sqrt(psi)
+        return (1.0 - math.cos(sp)) / psi, (sp - math.sin(sp)) / (psi * sp)
+    sp = math.sqrt(-psi)
+    return (math.cosh(sp) - 1.0) / (-psi), (math.sinh(sp) - sp) / ((-psi) * sp)
+
+
 # ─── Battin's method — robust for near-180° transfers ────────
 
 def _continued_fraction_eta(x: float) -> float:
@@ -309,9 +342,8 @@ def _solve_lambert_battin(
     if abs(g) < 1e-15:
         return None
 
-    v1 = _scale(1.0 / g, _sub(r2, _scale(f, r1)))
     g_dot = 1.0 - a / r2_mag * (1.0 - cos_dnu)
-    v2 = _scale(1.0 / g, _sub(_scale(g_dot, r2), r1))
+    v1, v2 = _lagrange_velocities(r1, r2, f, g, g_dot)
 
     # Sanity check: velocities should not be absurdly large
     if _norm(v1) > 200.0 or _norm(v2) > 200.0:
@@ -322,24 +354,19 @@ def _solve_lambert_battin(
 
 # ─── Core: Universal variable Lambert solver ─────────────────
 
-def _solve_lambert_uv(
-    r1: Vec3,
-    r2: Vec3,
-    tof: float,
-    mu: float,
-    clockwise: bool = False,
-) -> Optional[Tuple[Vec3, Vec3]]:
-    """Solve Lambert's problem for zero-revolution using the universal variable.
+_TransferGeometry = Tuple[Vec3, float, float, float]
 
-    Based on Curtis Algorithm 5.2.  Uses Newton–Raphson with bisection fallback
-    to find the universal variable *z*.
 
-    Returns (v1, v2) or None.
+def _transfer_geometry(r1: Vec3, r2: Vec3, clockwise: bool = False) -> Optional[_TransferGeometry]:
+    """Transfer-angle setup shared by the universal-variable solvers.
+
+    Returns (r2, |r1|, |r2|, A), where r2 is nudged off the r1 line for
+    near-180° transfers, or None for a degenerate geometry.  It depends
+    only on the positions, so solve_lambert computes it once for the
+    0-rev and every multi-rev solve.
     """
     r1_mag = _norm(r1)
     r2_mag = _norm(r2)
-    if r1_mag < 1e-10 or r2_mag < 1e-10 or tof <= 0.0 or mu <= 0.0:
-        return None
 
     # ── Transfer angle ──────────────────────────────────────
     cos_dnu = _dot(r1, r2) / (r1_mag * r2_mag)
@@ -398,6 +425,38 @@ def _solve_lambert_uv(
     if abs(A) < 1e-14:
         return None
 
+    return r2, r1_mag, r2_mag, A
+
+
+_Z_ONE_REV = 4.0 * math.pi * math.pi
+
+
+def _solve_lambert_uv(
+    r1: Vec3,
+    r2: Vec3,
+    tof: float,
+    mu: float,
+    clockwise: bool = False,
+    geometry: Optional[_TransferGeometry] = None,
+) -> Optional[Tuple[Vec3, Vec3]]:
+    """Solve Lambert's problem for zero-revolution using the universal variable.
+
+    Based on Curtis Algorithm 5.2.  Uses Newton–Raphson with bisection fallback
+    to find the universal variable *z*.  ``geometry`` is a precomputed
+    _transfer_geometry(r1, r2, clockwise).
+
+    Returns (v1, v2) or None.
+    """
+    if tof <= 0.0 or mu <= 0.0:
+        return None
+    if geometry is None:
+        if _norm(r1) < 1e-10 or _norm(r2) < 1e-10:
+            return None
+        geometry = _transfer_geometry(r1, r2, clockwise)
+        if geometry is None:
+            return None
+    r2, r1_mag, r2_mag, A = geometry
+
     # ── Newton–Raphson on z ─────────────────────────────────
     # F(z) = (χ³ · S(z) + A · √y) / √μ  − Δt = 0
     #
@@ -408,62 +467,39 @@ def _solve_lambert_uv(
     def _y(z: float, C: float, S: float) -> float:
         return r1_mag + r2_mag + A * (z * S - 1.0) / math.sqrt(C)
 
-    def _F(z: float) -> float:
-        C = _stumpff_c2(z)
-        S = _stumpff_c3(z)
-        y = _y(z, C, S)
-        if y < 0.0:
-            return float("inf")
-        chi = math.sqrt(y / C)
-        return (chi ** 3 * S + A * math.sqrt(y)) / math.sqrt(mu) - tof
-
-    def _dFdz(z: float) -> float:
-        C = _stumpff_c2(z)
-        S = _stumpff_c3(z)
-        y = _y(z, C, S)
-        if y < 0.0:
-            return 1.0  # dummy positive
-        chi = math.sqrt(y / C)
-        sqrt_mu = math.sqrt(mu)
-        if abs(z) > 1e-12:
-            return (chi ** 3 * (S - 3.0 * S / (2.0 * C) * (C - 0.5)) / (2.0 * z)
-                    + (A / 8.0) * (3.0 * S * math.sqrt(y) / C + A / chi)) / sqrt_mu
-        else:
-            # Limiting form near z = 0
-            return (math.sqrt(2.0) / 40.0 * y ** 1.5
-                    + (A / 8.0) * (math.sqrt(y) + A * math.sqrt(1.0 / (2.0 * y)))) / sqrt_mu
-
-    # Find initial bracket [z_lo, z_hi] where F changes sign.
     # For 0-rev elliptic, z > 0.  For hyperbolic, z < 0.
-    # Start with z = 0 and step until sign change, or use bisection.
+    # Newton from z = 0, kept inside a sign bracket.
     z = 0.0
-    F0 = _F(0.0)
-
-    # Try Newton first with z=0 initial guess
     converged = False
+    sqrt_mu = math.sqrt(mu)
+    f_tol = max(1e-8, 1e-12 * tof)
+    z_lo, z_hi = -math.inf, _Z_ONE_REV
     for _ in range(200):
-        C = _stumpff_c2(z)
-        S = _stumpff_c3(z)
+        C, S = _stumpff_c2_c3(z)
         y_val = _y(z, C, S)
 
         while y_val < 0.0:
             # Increase z to make y positive
             z += 0.1
-            C = _stumpff_c2(z)
-            S = _stumpff_c3(z)
+            C, S = _stumpff_c2_c3(z)
             y_val = _y(z, C, S)
 
         chi = math.sqrt(y_val / C)
-        sqrt_mu = math.sqrt(mu)
         F_val = (chi ** 3 * S + A * math.sqrt(y_val)) / sqrt_mu - tof
 
-        if abs(F_val) < 1e-8:
+        # Absolute 1e-8 s is below double resolution for interplanetary
+        # TOFs (~1e7 s), so also accept a residual at relative precision.
+        if abs(F_val) < f_tol:
             converged = True
             break
+        if F_val < 0.0:
+            z_lo = z
+        else:
+            z_hi = z
 
         # Analytic derivative
         if abs(z) > 1e-12:
-            dFdz = (chi ** 3 * (S - 3.0 * S / (2.0 * C) * (C - 0.5)) / (2.0 * z)
+            dFdz = (chi ** 3 * ((C - 1.5 * S / C) / (2.0 * z) + 0.75 * S * S / C)
                      + (A / 8.0) * (3.0 * S * math.sqrt(y_val) / C + A / chi)) / sqrt_mu
         else:
             dFdz = (math.sqrt(2.0) / 40.0 * y_val ** 1.5
@@ -478,14 +514,26 @@ def _solve_lambert_uv(
         if abs(z_new - z) > 10.0 * abs(z) + 10.0:
             z_new = z - 0.5 * F_val / dFdz
 
+        # F increases with z, and a 0-rev transfer has z < 4π² (one full
+        # revolution), so iterates bracket the root; a step leaving the
+        # bracket bisects it instead of letting Newton wander.
+        if not z_lo < z_new < z_hi:
+            if z_lo == -math.inf:
+                z_new = z_hi - 2.0 * (abs(z_hi) + 1.0)
+            else:
+                z_new = 0.5 * (z_lo + z_hi)
+        if z_hi - z_lo <= 1e-14 * (1.0 + abs(z_new)):
+            converged = True  # bracket is at double resolution
+            z = z_new
+            break
+
         z = z_new
 
     if not converged:
         return None
 
     # ── Compute velocities from z ───────────────────────────
-    C = _stumpff_c2(z)
-    S = _stumpff_c3(z)
+    C, S = _stumpff_c2_c3(z)
     y_val = _y(z, C, S)
     if y_val < 0.0:
         return None
@@ -497,8 +545,7 @@ def _solve_lambert_uv(
     if abs(g) < 1e-15:
         return None
 
-    v1 = _scale(1.0 / g, _sub(r2, _scale(f, r1)))
-    v2 = _scale(1.0 / g, _sub(_scale(g_dot, r2), r1))
+    v1, v2 = _lagrange_velocities(r1, r2, f, g, g_dot)
 
     return (v1, v2)
 
@@ -510,64 +557,28 @@ def _solve_lambert_multirev(
     mu: float,
     clockwise: bool = False,
     N: int = 1,
-    path_type: str = "short",
-) -> Optional[Tuple[Vec3, Vec3]]:
+    geometry: Optional[_TransferGeometry] = None,
+) -> List[Tuple[Vec3, Vec3]]:
     """Solve Lambert's problem for N complete revolutions.
 
     For each revolution count N ≥ 1 there can be two solutions: a "short-period"
     (low-energy) and a "long-period" (high-energy) solution, corresponding to
-    z values just above and further above the minimum z = (2πN)².
+    z values just above and further above the minimum z = (2πN)².  Both
+    share the transfer geometry and the minimum-TOF search, so one call
+    returns whichever of (short, long) converge, in that order.
 
     Uses bisection to robustly find z (Newton can diverge for multi-rev).
+    ``geometry`` is a precomputed _transfer_geometry(r1, r2, clockwise).
     """
-    r1_mag = _norm(r1)
-    r2_mag = _norm(r2)
-    if r1_mag < 1e-10 or r2_mag < 1e-10 or tof <= 0.0 or mu <= 0.0:
-        return None
-
-    # Transfer angle (same logic as 0-rev, including 180° perturbation)
-    cos_dnu = _dot(r1, r2) / (r1_mag * r2_mag)
-    cos_dnu = max(-1.0, min(1.0, cos_dnu))
-
-    c_cross = _cross(r1, r2)
-    cross_z = c_cross[2]
-
-    c_cross_mag = _norm(c_cross)
-    if c_cross_mag < 1e-6 * r1_mag * r2_mag and cos_dnu < -0.99:
-        ir1 = _scale(1.0 / r1_mag, r1)
-        if abs(ir1[2]) < 0.9:
-            perp = _cross(ir1, (0.0, 0.0, 1.0))
-        else:
-            perp = _cross(ir1, (0.0, 1.0, 0.0))
-        perp_mag = _norm(perp)
-        if perp_mag > 1e-15:
-            perp = _scale(1.0 / perp_mag, perp)
-        perturb = max(r2_mag * 1e-8, 1.0)
-        r2 = _add(r2, _scale(perturb, perp))
-        r2_mag = _norm(r2)
-        cos_dnu = _dot(r1, r2) / (r1_mag * r2_mag)
-        cos_dnu = max(-1.0, min(1.0, cos_dnu))
-        c_cross = _cross(r1, r2)
-        cross_z = c_cross[2]
-
-    if clockwise:
-        if cross_z >= 0.0:
-            dnu = 2.0 * math.pi - math.acos(cos_dnu)
-        else:
-            dnu = math.acos(cos_dnu)
-    else:
-        if cross_z >= 0.0:
-            dnu = math.acos(cos_dnu)
-        else:
-            dnu = 2.0 * math.pi - math.acos(cos_dnu)
-
-    sin_dnu = math.sin(dnu)
-    denom = 1.0 - cos_dnu
-    if abs(denom) < 1e-14:
-        return None
-    A = sin_dnu * math.sqrt(r1_mag * r2_mag / denom)
-    if abs(A) < 1e-14:
-        return None
+    if tof <= 0.0 or mu <= 0.0:
+        return []
+    if geometry is None:
+        if _norm(r1) < 1e-10 or _norm(r2) < 1e-10:
+            return []
+        geometry = _transfer_geometry(r1, r2, clockwise)
+        if geometry is None:
+            return []
+    r2, r1_mag, r2_mag, A = geometry
 
     sqrt_mu = math.sqrt(mu)
 
@@ -603,68 +614,70 @@ def _solve_lambert_multirev(
     tof_min = _tof_from_z(z_min)
 
     if tof < tof_min * 0.999:
-        return None  # TOF too short for this revolution count
+        return []  # TOF too short for this revolution count
 
     # Two solutions: one on each side of z_min
-    if path_type == "short":
-        # Short-period: z between z_lo and z_min
-        za, zb = z_lo, z_min
-    else:
-        # Long-period: z between z_min and z_hi
-        za, zb = z_min, z_hi
-
-    ta = _tof_from_z(za)
-    tb = _tof_from_z(zb)
-
-    # Bisection to find z where tof_from_z(z) = tof
-    for _ in range(100):
-        zm = (za + zb) / 2.0
-        tm = _tof_from_z(zm)
-        if abs(tm - tof) < 1e-8:
-            break
-
-        # The TOF curve is U-shaped in [z_lo, z_hi] with minimum at z_min.
-        # On the left branch (short-period), TOF decreases with z.
-        # On the right branch (long-period), TOF increases with z.
+    def _branch(path_type: str) -> Optional[Tuple[Vec3, Vec3]]:
         if path_type == "short":
-            if tm > tof:
-                za = zm  # Need larger z (lower TOF)
-            else:
-                zb = zm
+            # Short-period: z between z_lo and z_min
+            za, zb = z_lo, z_min
         else:
-            if tm > tof:
-                zb = zm  # Need smaller z (lower TOF)
+            # Long-period: z between z_min and z_hi
+            za, zb = z_min, z_hi
+
+        # Bisection to find z where tof_from_z(z) = tof
+        for _ in range(100):
+            zm = (za + zb) / 2.0
+            tm = _tof_from_z(zm)
+            if abs(tm - tof) < 1e-8:
+                break
+
+            # The TOF curve is U-shaped in [z_lo, z_hi] with minimum at z_min.
+            # On the left branch (short-period), TOF decreases with z.
+            # On the right branch (long-period), TOF increases with z.
+            if path_type == "short":
+                if tm > tof:
+                    za = zm  # Need larger z (lower TOF)
+                else:
+                    zb = zm
             else:
-                za = zm
+                if tm > tof:
+                    zb = zm  # Need smaller z (lower TOF)
+                else:
+                    za = zm
 
-        if abs(zb - za) < 1e-12:
-            break
+            if abs(zb - za) < 1e-12:
+                break
 
-    z = (za + zb) / 2.0
+        z = (za + zb) / 2.0
 
-    # Verify convergence
-    t_check = _tof_from_z(z)
-    if abs(t_check - tof) > 1.0:
-        return None
+        # Verify convergence
+        t_check = _tof_from_z(z)
+        if abs(t_check - tof) > 1.0:
+            return None
 
-    # Compute velocities
-    C = _stumpff_c2(z)
-    S = _stumpff_c3(z)
-    y_val = r1_mag + r2_mag + A * (z * S - 1.0) / math.sqrt(C)
-    if y_val < 0.0:
-        return None
+        # Compute velocities
+        C = _stumpff_c2(z)
+        S = _stumpff_c3(z)
+        y_val = r1_mag + r2_mag + A * (z * S - 1.0) / math.sqrt(C)
+        if y_val < 0.0:
+            return None
 
-    f = 1.0 - y_val / r1_mag
-    g = A * math.sqrt(y_val / mu)
-    g_dot = 1.0 - y_val / r2_mag
+        f = 1.0 - y_val / r1_mag
+        g = A * math.sqrt(y_val / mu)
+        g_dot = 1.0 - y_val / r2_mag
 
-    if abs(g) < 1e-15:
-        return None
+        if abs(g) < 1e-15:
+            return None
 
-    v1 = _scale(1.0 / g, _sub(r2, _scale(f, r1)))
-    v2 = _scale(1.0 / g, _sub(_scale(g_dot, r2), r1))
+        return _lagrange_velocities(r1, r2, f, g, g_dot)
 
-    return (v1, v2)
+    solutions: List[Tuple[Vec3, Vec3]] = []
+    for path_type in ("short", "long"):
+        result = _branch(path_type)
+        if result is not None:
+            solutions.append(result)
+    return solutions
 
 
 # ─── Public API ──────────────────────────────────────────────
@@ -709,7 +722,8 @@ def solve_lambert(
         return []
 
     # Check for degenerate same-position case
-    if _norm(_sub(r1, r2)) < 1e-10:
+    chord = _dist(r1, r2)
+    if chord < 1e-10:
         return []
 
     solutions: List[Tuple[Vec3, Vec3]] = []
@@ -719,8 +733,13 @@ def solve_lambert(
     cos_dnu = max(-1.0, min(1.0, cos_dnu))
     is_near_180 = cos_dnu < -0.95  # within ~18° of 180°
 
+    # Transfer angle and A are shared by the 0-rev and every N-rev solve
+    geometry = _transfer_geometry(r1, r2, clockwise)
+
     # 0-revolution (direct) transfer
-    result = _solve_lambert_uv(r1, r2, tof, mu, clockwise=clockwise)
+    result = None
+    if geometry is not None:
+        result = _solve_lambert_uv(r1, r2, tof, mu, clockwise=clockwise, geometry=geometry)
     if result is not None:
         solutions.append(result)
     elif is_near_180:
@@ -729,15 +748,17 @@ def solve_lambert(
         if result is not None:
             solutions.append(result)
 
-    # Multi-revolution solutions
+    # Multi-revolution solutions.  Any ellipse through r1 and r2 has
+    # a ≥ s/2, so N revolutions take at least N periods of that
+    # minimum-energy ellipse; shorter TOFs cannot have an N-rev solution.
+    a_min = 0.25 * (r1_mag + r2_mag + chord)
+    period_min = 2.0 * math.pi * math.sqrt(a_min * a_min * a_min / mu)
     for N in range(1, max_revs + 1):
-        for path_type in ("short", "long"):
-            result = _solve_lambert_multirev(
-                r1, r2, tof, mu,
-                clockwise=clockwise, N=N, path_type=path_type,
-            )
-            if result is not None:
-                solutions.append(result)
+        if geometry is None or tof < 0.999 * N * period_min:
+            break
+        solutions.extend(_solve_lambert_multirev(
+            r1, r2, tof, mu, clockwise=clockwise, N=N, geometry=geometry,
+        ))
 
     return solutions
 
@@ -772,13 +793,13 @@ def compute_transfer_dv(
     (dv_depart_m_s, dv_arrive_m_s, total_dv_m_s) — all in m/s
     """
     # Hyperbolic excess velocities
-    v_inf_depart = _norm(_sub(v1_departure, v1_body))
-    v_inf_arrive = _norm(_sub(v2_arrival, v2_body))
+    v_inf_depart = _dist(v1_departure, v1_body)
+    v_inf_arrive = _dist(v2_arrival, v2_body)
 
     # Departure burn: from parking orbit to hyperbolic escape
     if mu_departure > 0.0 and r_park_departure > 0.0:
         v_park_dep = math.sqrt(mu_departure / r_park_departure)
-        v_hyp_dep = math.sqrt(v_inf_depart ** 2 + 2.0 * mu_departure / r_park_departure)
+        v_hyp_dep = math.sqrt(v_inf_depart * v_inf_depart + 2.0 * mu_departure / r_park_departure)
         dv_depart = abs(v_hyp_dep - v_park_dep)
     else:
         dv_depart = v_inf_depart
@@ -786,7 +807,7 @@ def compute_transfer_dv(
     # Arrival burn: from hyperbolic approach to parking orbit
     if mu_arrival > 0.0 and r_park_arrival > 0.0:
         v_park_arr = math.sqrt(mu_arrival / r_park_arrival)
-        v_hyp_arr = math.sqrt(v_inf_arrive ** 2 + 2.0 * mu_arrival / r_park_arrival)
+        v_hyp_arr = math.sqrt(v_inf_arrive * v_inf_arrive + 2.0 * mu_arrival / r_park_arrival)
         dv_arrive = abs(v_hyp_arr - v_park_arr)
     else:
         dv_arrive = v_inf_arrive
@@ -799,6 +820,48 @@ def compute_transfer_dv(
     return dv_depart_m_s, dv_arrive_m_s, total_dv_m_s
 
 
+def make_transfer_dv(
+    mu_departure: float,
+    r_park_departure: float,
+    mu_arrival: float,
+    r_park_arrival: float,
+) -> Callable[[Vec3, Vec3, Vec3, Vec3], Tuple[float, float, float]]:
+    """Specialize compute_transfer_dv for fixed departure/arrival bodies.
+
+    The parking-orbit speeds and escape terms depend only on μ and r_park,
+    so they are computed once here instead of per call.  The returned
+    function takes (v1_departure, v1_body, v2_arrival, v2_body) and gives
+    the same result as compute_transfer_dv with these parameters.
+    """
+    dep_capture = mu_departure > 0.0 and r_park_departure > 0.0
+    arr_capture = mu_arrival > 0.0 and r_park_arrival > 0.0
+    v_park_dep = math.sqrt(mu_departure / r_park_departure) if dep_capture else 0.0
+    esc_dep = 2.0 * mu_departure / r_park_departure if dep_capture else 0.0
+    v_park_arr = math.sqrt(mu_arrival / r_park_arrival) if arr_capture else 0.0
+    esc_arr = 2.0 * mu_arrival / r_park_arrival if arr_capture else 0.0
+    sqrt = math.sqrt
+    dist = math.dist
+
+    def transfer_dv(
+        v1_departure: Vec3, v1_body: Vec3, v2_arrival: Vec3, v2_body: Vec3,
+    ) -> Tuple[float, float, float]:
+        v_inf_depart = dist(v1_departure, v1_body)
+        v_inf_arrive = dist(v2_arrival, v2_body)
+        if dep_capture:
+            dv_depart = abs(sqrt(v_inf_depart * v_inf_depart + esc_dep) - v_park_dep)
+        else:
+            dv_depart = v_inf_depart
+        if arr_capture:
+            dv_arrive = abs(sqrt(v_inf_arrive * v_inf_arrive + esc_arr) - v_park_arr)
+        else:
+            dv_arrive = v_inf_arrive
+        dv_depart_m_s = dv_depart * 1000.0
+        dv_arrive_m_s = dv_arrive * 1000.0
+        return dv_depart_m_s, dv_arrive_m_s, dv_depart_m_s + dv_arrive_m_s
+
+    return transfer_dv
+
+
 def compute_hohmann_dv_tof(
     mu: float,
     r1_km: float,
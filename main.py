@@ -35,6 +35,7 @@ from sim_service import (
     game_now_s,
     import_simulation_state,
 )
+import transfer_planner
 
 app = FastAPI()
 app.mount("/static", StaticFiles(directory=str(APP_DIR / "static")), name="static")
@@ -2782,6 +2783,12 @@ def _startup():
     load_thruster_main_catalog()
     load_resource_catalog()
 
+
+@app.on_event("shutdown")
+def _shutdown():
+    transfer_planner.shutdown_porkchop_pool()
+
+
 # ── Server environment info (for UI banner) ─────────────────────────
 _ENV_LABEL = os.environ.get("ENV_LABEL", "").strip().upper()
 
@@ -54,7 +54,7 @@ def orbit_for_location(
     radius_km = celestial_config.get_orbit_node_radius(cfg, location_id)
     if body_id and radius_km and radius_km > 0:
         try:
-            mu = celestial_config.get_body_mu(cfg, body_id)
+            mu = _get_mu_for_body(body_id)
         except Exception:
             return None
         return orbit_service.circular_orbit(body_id, radius_km, mu, game_time_s, angle_deg=angle_deg)
@@ -65,7 +65,7 @@ def orbit_for_location(
         body_id = site_info["body_id"]
         try:
             body_radius = celestial_config.get_body_radius(cfg, body_id)
-            mu = celestial_config.get_body_mu(cfg, body_id)
+            mu = _get_mu_for_body(body_id)
         except Exception:
             return None
         if body_radius <= 0:
@@ -79,7 +79,7 @@ def orbit_for_location(
         secondary = lp_info["secondary_body_id"]
         model = lp_info["model"]
         try:
-            mu_primary = celestial_config.get_body_mu(cfg, primary)
+            mu_primary = _get_mu_for_body(primary)
         except Exception:
             return None
 
@@ -116,8 +116,7 @@ def orbit_for_location(
 
 def _get_mu_for_body(body_id: str) -> float:
     """Get gravitational parameter for a body, raising on failure."""
-    cfg = _get_config()
-    return celestial_config.get_body_mu(cfg, body_id)
+    return transfer_planner._mu(body_id)
 
 
 def _get_soi_for_body(body_id: str) -> Optional[float]:
@@ -699,9 +698,8 @@ def _execute_soi_transition(
     transition_time = float(maneuver.get("time_s", now_s))
     current_body = orbit.get("body_id", "")
 
-    cfg = _get_config()
     try:
-        mu_current = celestial_config.get_body_mu(cfg, current_body)
+        mu_current = _get_mu_for_body(current_body)
     except Exception:
         logger.warning("Cannot get mu for %s in SOI transition", current_body)
         return orbit
@@ -713,7 +711,7 @@ def _execute_soi_transition(
         # Exiting current body → entering parent body
         try:
             body_r, body_v = _body_state_2d(current_body, transition_time)
-            mu_parent = celestial_config.get_body_mu(cfg, to_body_id)
+            mu_parent = _get_mu_for_body(to_body_id)
         except Exception:
             logger.warning("SOI exit failed: cannot resolve body states")
             return orbit
@@ -728,7 +726,7 @@ def _execute_soi_transition(
         # Entering child body from parent frame
         try:
             child_r, child_v = _body_state_2d(to_body_id, transition_time)
-            mu_child = celestial_config.get_body_mu(cfg, to_body_id)
+            mu_child = _get_mu_for_body(to_body_id)
         except Exception:
             logger.warning("SOI enter failed: cannot resolve body states")
             return orbit
@@ -56,7 +56,7 @@ LOAN_PRODUCTS: List[Dict[str, Any]] = [
 ]
 
 # Tech levels that can be boosted from Earth
-BOOSTABLE_TECH_LEVELS = {1, 1.5, 2, 2.5}
+BOOSTABLE_TECH_LEVELS = frozenset({1, 1.5, 2, 2.5})
 
 # LEO destination location — resolved at startup
 LEO_LOCATION_ID = "LEO"
@@ -11,6 +11,8 @@
 #   ./run_tests.sh -x                 # Stop on first failure
 #   ./run_tests.sh -v                 # Verbose output
 #   ./run_tests.sh --tb=short         # Short tracebacks
+#   ./run_tests.sh -n auto --dist=loadgroup   # Parallel (pytest-xdist)
+#   ./run_tests.sh --skip-slow        # Skip slow integration flows
 #
 # Run inside Docker:
 #   docker compose exec frontier-sol-2000 bash -c "./run_tests.sh"
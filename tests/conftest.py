@@ -14,6 +14,7 @@ import sqlite3
 import sys
 import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Generator, Optional
 
@@ -33,25 +34,80 @@ os.environ.setdefault("DEV_SKIP_AUTH", "1")
 _TEST_DB_DIR = tempfile.mkdtemp(prefix="frontier_test_")
 os.environ["DB_DIR"] = _TEST_DB_DIR
 
+import db as _db  # noqa: E402  (reads DB_DIR at import)
+
+_app_connect_db = _db.connect_db
+
+
+def _fast_connect_db() -> sqlite3.Connection:
+    """connect_db for the throwaway test database, without fsyncs.
+
+    Installed before any app module is imported, so `from db import
+    connect_db` (and get_db) pick it up; production connect_db is unchanged.
+    """
+    conn = _app_connect_db()
+    conn.execute("PRAGMA synchronous=OFF;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    return conn
+
+
+_db.connect_db = _fast_connect_db
+
+
+# ---------------------------------------------------------------------------
+# Command-line options
+# ---------------------------------------------------------------------------
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="skip tests marked @pytest.mark.slow (full integration flows)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="--skip-slow given")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
 
 # ---------------------------------------------------------------------------
 # Database fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def _migrated_template_db() -> Generator[sqlite3.Connection, None, None]:
+    """One in-memory database with all migrations applied, built per session."""
+    from db_migrations import apply_migrations
+
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys=ON;")
+    apply_migrations(conn)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
 @pytest.fixture()
-def db_conn() -> Generator[sqlite3.Connection, None, None]:
+def db_conn(_migrated_template_db: sqlite3.Connection) -> Generator[sqlite3.Connection, None, None]:
     """Yield an in-memory SQLite connection with all migrations applied.
 
-    The connection is rolled back / closed after the test, so tests are isolated.
+    Each test gets its own copy of the session's migrated template (via the
+    SQLite backup API, ~0.1 ms instead of rerunning every migration), so
+    tests stay isolated even when the code under test commits.
     """
-    from db_migrations import apply_migrations
-
     conn = sqlite3.connect(":memory:")
+    _migrated_template_db.backup(conn)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys=ON;")
-
-    # Apply the game migrations (same as startup)
-    apply_migrations(conn)
+    # Nothing here outlives the test, so skip durability work entirely.
+    conn.executescript("PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY;")
 
     yield conn
     conn.close()
@@ -71,19 +127,44 @@ def seeded_db(db_conn: sqlite3.Connection) -> sqlite3.Connection:
 # FastAPI TestClient
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client():
     """Return a Starlette TestClient wired to the FastAPI app.
 
-    Auth is bypassed via DEV_SKIP_AUTH=1.
+    Auth is bypassed via DEV_SKIP_AUTH=1. The client (and the app startup
+    it triggers) is shared by the whole session.
+
+    There is no per-test reset of the app database: tests delete the ships
+    they spawn (or use `mutating_client`), which is far cheaper than
+    rerunning startup.
     """
+    if os.environ.get("DEV_SKIP_AUTH") != "1":
+        # Checked before importing the app, so no startup cost is paid.
+        # The skip is cached with the session fixture; pure tests still run.
+        pytest.skip("server tests require DEV_SKIP_AUTH=1")
+
     from fastapi.testclient import TestClient
     from main import app
 
-    with TestClient(app) as c:
+    with TestClient(app, raise_server_exceptions=True) as c:
         yield c
 
 
+@pytest.fixture(scope="class")
+def mutating_client(client):
+    """Shared client for flows that create ships.
+
+    Any ship that appears in /api/state while the class runs and is still
+    there afterwards gets deconstructed, so later tests see the fleet as it
+    was before.
+    """
+    before = {s["id"] for s in client.get("/api/state").json()["ships"]}
+    yield client
+    for ship in client.get("/api/state").json()["ships"]:
+        if ship["id"] not in before:
+            client.post(f"/api/ships/{ship['id']}/deconstruct", json={"keep_ship_record": False})
+
+
 @pytest.fixture()
 def admin_client(client):
     """Alias for clarity — identical to `client` when DEV_SKIP_AUTH=1."""
@@ -150,6 +231,34 @@ def all_catalogs(
     }
 
 
+# ---------------------------------------------------------------------------
+# Static asset helpers (no server needed)
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _read_static(rel: str) -> bytes:
+    """Read a file under static/ once; repeat lookups are served from memory.
+
+    Returned undecoded — the structure tests only look for ASCII needles.
+    """
+    return (PROJECT_ROOT / "static" / rel).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def html_content() -> bytes:
+    return _read_static("shipyard.html")
+
+
+@pytest.fixture(scope="session")
+def js_content() -> bytes:
+    return _read_static("js/shipyard.js")
+
+
+@pytest.fixture(scope="session")
+def css_content() -> bytes:
+    return _read_static("styles.css")
+
+
 # ---------------------------------------------------------------------------
 # Test data helpers
 # ---------------------------------------------------------------------------
@@ -263,3 +372,30 @@ def _reset_sim_clock():
     reset_simulation_clock()
     yield
     reset_simulation_clock()
+
+
+class FakeClock:
+    """Stand-in for the ``time`` module inside sim_service.
+
+    Only ``time()`` is provided, which is all sim_service calls.  Advance it
+    with ``tick()`` instead of sleeping.
+    """
+
+    def __init__(self, start: float) -> None:
+        self.now = start
+
+    def time(self) -> float:
+        return self.now
+
+    def tick(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture()
+def fake_clock(monkeypatch) -> FakeClock:
+    """Drive the simulation clock by hand; real time is restored afterwards."""
+    import sim_service
+
+    clock = FakeClock(time.time())
+    monkeypatch.setattr(sim_service, "time", clock)
+    return clock
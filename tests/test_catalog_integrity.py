@@ -15,9 +15,6 @@ from pathlib import Path
 
 import pytest
 
-import sys, os
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-os.environ.setdefault("DEV_SKIP_AUTH", "1")
 
 ITEMS_DIR = Path(__file__).resolve().parent.parent / "items"
 
@@ -18,39 +18,36 @@ Covers:
 """
 
 import json
-import os
 import re
 import secrets
 import sqlite3
-import sys
 import time
 import uuid
-from pathlib import Path
 from typing import Any, Dict
 
 import pytest
 
-# ── Path & env setup ──────────────────────────────────────────────────────
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 
 # ── Fixtures ──────────────────────────────────────────────────────────────
 
-@pytest.fixture()
-def app_client():
-    """TestClient with DEV_SKIP_AUTH disabled — requires real auth cookies."""
-    import auth_service
-    old = auth_service.DEV_SKIP_AUTH
-    auth_service.DEV_SKIP_AUTH = False
-
+@pytest.fixture(scope="module")
+def _contracts_client():
+    """One app startup for the module, shared by every app_client test."""
     from fastapi.testclient import TestClient
     from main import app
     with TestClient(app) as c:
         yield c
-    # Restore so other test files are not affected
-    auth_service.DEV_SKIP_AUTH = old
+
+
+@pytest.fixture()
+def app_client(_contracts_client, monkeypatch):
+    """TestClient with DEV_SKIP_AUTH disabled — requires real auth cookies."""
+    import auth_service
+    # monkeypatch restores the flag so other test files are not affected
+    monkeypatch.setattr(auth_service, "DEV_SKIP_AUTH", False)
+    yield _contracts_client
+    # Drop cookies picked up from register/login so tests stay independent
+    _contracts_client.cookies.clear()
 
 
 def _register_corp(client, name: str, password: str = "test123", color: str = "#ff0000"):
@@ -10,14 +10,9 @@ Catches:
 """
 
 import sqlite3
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-import os; os.environ.setdefault("DEV_SKIP_AUTH", "1")
-
 
 # ── Migration application ─────────────────────────────────────────────────
 
@@ -109,6 +104,15 @@ class TestSchemaAfterMigrations:
         fk = db_conn.execute("PRAGMA foreign_keys;").fetchone()
         assert fk[0] == 1
 
+    def test_settle_arrivals_uses_arrives_at_index(self, db_conn: sqlite3.Connection):
+        plan = db_conn.execute(
+            "EXPLAIN QUERY PLAN UPDATE ships SET location_id = to_location_id"
+            " WHERE arrives_at IS NOT NULL AND arrives_at <= ?",
+            (0.0,),
+        ).fetchall()
+        details = " ".join(r["detail"] for r in plan)
+        assert "idx_ships_arrives_at" in details, details
+
 
 # ── Celestial config / seed data ──────────────────────────────────────────
 
@@ -11,15 +11,10 @@ Covers:
 """
 
 import math
-import sys
 import time
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-import os; os.environ.setdefault("DEV_SKIP_AUTH", "1")
-
 
 # ── Simulation clock ──────────────────────────────────────────────────────
 
@@ -30,24 +25,25 @@ class TestSimulationClock:
         assert isinstance(t, float)
         assert t > 0
 
-    def test_pause_freezes_time(self):
+    def test_pause_freezes_time(self, fake_clock):
         from sim_service import game_now_s, set_simulation_paused, simulation_paused
         set_simulation_paused(True)
         assert simulation_paused() is True
         t1 = game_now_s()
-        time.sleep(0.05)
+        fake_clock.tick(60.0)
         t2 = game_now_s()
         assert t1 == t2, "Game time should not advance while paused"
         set_simulation_paused(False)
 
-    def test_unpause_resumes_time(self):
-        from sim_service import game_now_s, set_simulation_paused
+    def test_unpause_resumes_time(self, fake_clock):
+        from sim_service import GAME_TIME_SCALE, game_now_s, set_simulation_paused
         set_simulation_paused(True)
         set_simulation_paused(False)
         t1 = game_now_s()
-        time.sleep(0.05)
+        fake_clock.tick(60.0)
         t2 = game_now_s()
         assert t2 > t1, "Game time should advance after unpausing"
+        assert t2 - t1 == pytest.approx(60.0 * GAME_TIME_SCALE)
 
     def test_reset_returns_to_epoch(self):
         from sim_service import game_now_s, reset_simulation_clock, RESET_GAME_EPOCH_S
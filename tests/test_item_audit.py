@@ -16,19 +16,13 @@ Covers:
 
 import json
 import math
-import os
 import sqlite3
-import sys
 import time
 import uuid
-from pathlib import Path
 from typing import Any, Dict, List, Set
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-os.environ.setdefault("DEV_SKIP_AUTH", "1")
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # §1  CATALOG CROSS-REFERENCE AUDIT
@@ -527,13 +521,10 @@ class TestShipyardBuildRoundTrip:
         # Stats sanity
         assert float(ship.get("dry_mass_kg", 0)) > 0, "Ship should have positive mass"
 
-        # Verify via state endpoint that ship exists
-        state_r = client.get("/api/state")
-        assert state_r.status_code == 200
-        state = state_r.json()
-        ships = state.get("ships") or []
-        found = [s for s in ships if s.get("id") == ship["id"]]
-        assert len(found) == 1, f"Ship {ship['id']} not in /api/state"
+        # Verify via the single-ship endpoint that the ship exists
+        ship_r = client.get(f"/api/ships/{ship['id']}")
+        assert ship_r.status_code == 200, f"Ship {ship['id']} not found: {ship_r.text}"
+        assert ship_r.json()["ship"]["id"] == ship["id"]
 
     def test_build_ship_name_slugification(self, client):
         """Ship names with special chars should be slugified without crashing."""
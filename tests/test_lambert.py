@@ -13,26 +13,27 @@ Verifies:
 """
 
 import math
-import sys
-from pathlib import Path
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
 
 from lambert import (
     Vec3,
     solve_lambert,
     compute_transfer_dv,
+    make_transfer_dv,
     compute_hohmann_dv_tof,
     _cross,
     _dot,
+    _dist,
+    _lagrange_velocities,
     _norm,
+    _scale,
+    _solve_lambert_uv,
     _sub,
     _stumpff_c2,
     _stumpff_c3,
+    _stumpff_c2_c3,
 )
 
 # ─── Constants ────────────────────────────────────────────────
@@ -102,6 +103,10 @@ class TestStumpffFunctions:
         expected = (math.sinh(2.0) - 2.0) / (4.0 * 2.0)
         assert abs(_stumpff_c3(psi) - expected) < 1e-10
 
+    @pytest.mark.parametrize("psi", [-40.0, -4.0, -1e-13, 0.0, 1e-13, 4.0, 39.0])
+    def test_c2_c3_pair_matches_individual(self, psi):
+        assert _stumpff_c2_c3(psi) == (_stumpff_c2(psi), _stumpff_c3(psi))
+
 
 # ─── Vector utility tests ────────────────────────────────────
 
@@ -120,6 +125,17 @@ class TestVectorUtils:
     def test_norm(self):
         assert abs(_norm((3.0, 4.0, 0.0)) - 5.0) < 1e-10
 
+    def test_dist_matches_norm_of_difference(self):
+        a, b = (4.0, 6.0, -2.0), (1.0, 2.0, 10.0)
+        assert abs(_dist(a, b) - _norm(_sub(a, b))) < 1e-12
+
+    def test_lagrange_velocities_match_vector_helpers(self):
+        r1, r2 = (1.5e8, -2.0e7, 3.0e5), (-4.0e7, 2.2e8, -1.0e6)
+        f, g, g_dot = 0.37, 1.9e7, -0.52
+        v1, v2 = _lagrange_velocities(r1, r2, f, g, g_dot)
+        assert v1 == _scale(1.0 / g, _sub(r2, _scale(f, r1)))
+        assert v2 == _scale(1.0 / g, _sub(_scale(g_dot, r2), r1))
+
 
 # ─── Core Lambert solver tests ──────────────────────────────
 
@@ -256,6 +272,33 @@ class TestSolveLambert:
             assert diff > 0.1, "Prograde and retrograde should differ"
 
 
+    @pytest.mark.parametrize("angle_deg", [60.0, 120.0, 240.0])
+    @pytest.mark.parametrize("tof_days", [100.0, 600.0, 800.0])
+    def test_uv_solver_converges_at_interplanetary_tofs(self, angle_deg, tof_days):
+        """The UV solver converges across the leg TOF search range and the
+        solution conserves angular momentum and energy between r1 and r2."""
+        r1, r2 = _make_coplanar_positions(R_EARTH, R_MARS, angle_deg)
+        result = _solve_lambert_uv(r1, r2, tof_days * 86400.0, MU_SUN)
+        assert result is not None
+        v1, v2 = result
+        h1, h2 = _cross(r1, v1), _cross(r2, v2)
+        assert _dist(h1, h2) < 1e-8 * _norm(h1)
+        e1 = _dot(v1, v1) / 2.0 - MU_SUN / _norm(r1)
+        e2 = _dot(v2, v2) / 2.0 - MU_SUN / _norm(r2)
+        assert e1 == pytest.approx(e2, rel=1e-8)
+
+    def test_uv_solver_long_tof_regression(self):
+        """Earth→Mars at 120° over 600 days used to exhaust the Newton
+        iterations (wrong dF/dz) and return None.  Pinned to the solution
+        that Kepler-propagates from r1 onto r2."""
+        r1, r2 = _make_coplanar_positions(R_EARTH, R_MARS, 120.0)
+        result = _solve_lambert_uv(r1, r2, 600.0 * 86400.0, MU_SUN)
+        assert result is not None
+        v1, v2 = result
+        assert v1 == pytest.approx((22.858985632920042, 26.426782130127684, 0.0), rel=1e-9)
+        assert v2 == pytest.approx((-6.212857691968524, -23.92712757826142, 0.0), rel=1e-9)
+
+
 class TestMultiRevolution:
     """Test multi-revolution Lambert solutions."""
 
@@ -283,6 +326,49 @@ class TestMultiRevolution:
 
         assert len(sol_0) <= len(sol_1), "More revs should give >= solutions"
 
+    def test_multi_rev_skipped_below_minimum_energy_period(self, monkeypatch):
+        """TOFs shorter than one minimum-energy period skip the N-rev search,
+        and no 1-rev solution exists below that bound."""
+        import lambert
+
+        r1, r2 = _make_coplanar_positions(R_EARTH, R_MARS, 120.0)
+        a_min = 0.25 * (R_EARTH + R_MARS + _dist(r1, r2))
+        period_min = 2.0 * math.pi * math.sqrt(a_min ** 3 / MU_SUN)
+        for frac in (0.5, 0.9, 0.99):
+            assert lambert._solve_lambert_multirev(r1, r2, frac * period_min, MU_SUN, N=1) == []
+
+        calls = []
+        real_multirev = lambert._solve_lambert_multirev
+
+        def counting_multirev(*args, **kwargs):
+            calls.append(kwargs["N"])
+            return real_multirev(*args, **kwargs)
+
+        monkeypatch.setattr(lambert, "_solve_lambert_multirev", counting_multirev)
+        assert len(solve_lambert(r1, r2, 0.9 * period_min, MU_SUN, max_revs=2)) == 1
+        assert calls == []
+        solve_lambert(r1, r2, 1.5 * period_min, MU_SUN, max_revs=2)
+        assert calls == [1]
+
+    def test_transfer_geometry_computed_once_per_solve(self, monkeypatch):
+        """The 0-rev and every N-rev solve share one transfer-geometry setup."""
+        import lambert
+
+        r1, r2 = _make_coplanar_positions(R_EARTH, R_MARS, 120.0)
+        expected = solve_lambert(r1, r2, 3000.0 * 86400.0, MU_SUN, max_revs=3)
+        calls = []
+        real_geometry = lambert._transfer_geometry
+
+        def counting_geometry(*args, **kwargs):
+            calls.append(args)
+            return real_geometry(*args, **kwargs)
+
+        monkeypatch.setattr(lambert, "_transfer_geometry", counting_geometry)
+        solutions = solve_lambert(r1, r2, 3000.0 * 86400.0, MU_SUN, max_revs=3)
+        assert len(solutions) > 3
+        assert solutions == expected
+        assert len(calls) == 1
+
 
 # ─── Patched-conic Δv helper tests ──────────────────────────
 
@@ -328,6 +414,19 @@ class TestComputeTransferDv:
         assert abs(dv_dep - 3000.0) < 1.0  # 3 km/s = 3000 m/s
         assert abs(dv_arr - 3000.0) < 1.0
 
+    @pytest.mark.parametrize("mu_dep, r_dep, mu_arr, r_arr", [
+        (MU_EARTH, R_PARK_EARTH, MU_MARS, R_PARK_MARS),
+        (MU_EARTH, R_PARK_EARTH, 0.0, 0.0),
+        (0.0, 0.0, 0.0, 0.0),
+    ])
+    def test_make_transfer_dv_matches_compute_transfer_dv(self, mu_dep, r_dep, mu_arr, r_arr):
+        transfer_dv = make_transfer_dv(mu_dep, r_dep, mu_arr, r_arr)
+        v1, v1_body = (32.7, 1.2, -0.4), (29.78, 0.0, 0.0)
+        v2, v2_body = (-21.5, 0.3, 0.9), (-24.13, 0.0, 0.0)
+        assert transfer_dv(v1, v1_body, v2, v2_body) == compute_transfer_dv(
+            v1, v1_body, v2, v2_body, mu_dep, r_dep, mu_arr, r_arr,
+        )
+
 
 # ─── Hohmann orbit-change tests ─────────────────────────────
 
@@ -7,16 +7,10 @@ Tests for Phase 4 Lambert solver enhancements:
 """
 
 import math
-import sys
-from pathlib import Path
 from typing import Dict, Any
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 
 # ─── Constants ────────────────────────────────────────────────
 
@@ -197,6 +191,15 @@ class TestTransferQualityScore:
         assert transfer_quality_score(5000.0, 0.0, 0) == 5000.0
         assert transfer_quality_score(5000.0, 0.0, 1) == 5050.0
 
+    def test_tof_penalties_match_score(self):
+        """The porkchop's hoisted TOF terms reproduce transfer_quality_score."""
+        from transfer_planner import _REV_PENALTY_M_S, _tof_penalties, transfer_quality_score
+
+        tofs = [0.0, 86400.0, 123.4 * 86400.0, 700 * 86400.0]
+        for tof, penalty in zip(tofs, _tof_penalties(tofs)):
+            for revs in range(3):
+                assert 4321.5 + penalty + revs * _REV_PENALTY_M_S == transfer_quality_score(4321.5, tof, revs)
+
 
 # ═══════════════════════════════════════════════════════════════
 # Step 11: Lambert result caching
@@ -210,33 +213,67 @@ class TestLambertCache:
         """Same departure time within bucket → same cache key."""
         from transfer_planner import _lambert_cache_key, _LAMBERT_CACHE_BUCKET_S
 
-        key1 = _lambert_cache_key("LEO", "LMO", 1000.0, 0.0)
-        key2 = _lambert_cache_key("LEO", "LMO", 1000.0 + _LAMBERT_CACHE_BUCKET_S * 0.5, 0.0)
+        key1 = _lambert_cache_key("LEO", "LMO", 1000.0)
+        key2 = _lambert_cache_key("LEO", "LMO", 1000.0 + _LAMBERT_CACHE_BUCKET_S * 0.5)
         assert key1 == key2, "Same bucket should produce same key"
 
     def test_cache_key_different_buckets(self):
         """Different departure buckets → different cache keys."""
         from transfer_planner import _lambert_cache_key, _LAMBERT_CACHE_BUCKET_S
 
-        key1 = _lambert_cache_key("LEO", "LMO", 0.0, 0.0)
-        key2 = _lambert_cache_key("LEO", "LMO", _LAMBERT_CACHE_BUCKET_S * 2.0, 0.0)
+        key1 = _lambert_cache_key("LEO", "LMO", 0.0)
+        key2 = _lambert_cache_key("LEO", "LMO", _LAMBERT_CACHE_BUCKET_S * 2.0)
         assert key1 != key2
 
     def test_cache_key_different_locations(self):
         """Different location pairs → different cache keys."""
         from transfer_planner import _lambert_cache_key
 
-        key1 = _lambert_cache_key("LEO", "LMO", 1000.0, 0.0)
-        key2 = _lambert_cache_key("LEO", "MERC_ORB", 1000.0, 0.0)
+        key1 = _lambert_cache_key("LEO", "LMO", 1000.0)
+        key2 = _lambert_cache_key("LEO", "MERC_ORB", 1000.0)
         assert key1 != key2
 
-    def test_cache_key_different_extra_dv(self):
-        """Different extra_dv_fraction → different cache keys."""
-        from transfer_planner import _lambert_cache_key
+    def test_extra_dv_shares_base_cache_entry(self):
+        """Legs differing only in extra_dv_fraction share one cached sweep."""
+        from transfer_planner import (
+            _excess_dv_time_reduction, clear_lambert_cache,
+            compute_interplanetary_leg, get_lambert_cache_stats,
+        )
 
-        key1 = _lambert_cache_key("LEO", "LMO", 1000.0, 0.0)
-        key2 = _lambert_cache_key("LEO", "LMO", 1000.0, 0.5)
-        assert key1 != key2
+        clear_lambert_cache()
+        base = compute_interplanetary_leg("LEO", "LMO", 1000.0, 0.0)
+        fast = compute_interplanetary_leg("LEO", "LMO", 1000.0, 0.5)
+        assert base is not None and fast is not None
+        stats = get_lambert_cache_stats()
+        assert stats["misses"] == 1 and stats["hits"] == 1
+
+        assert fast["base_dv_m_s"] == base["base_dv_m_s"] == base["dv_m_s"]
+        assert fast["dv_m_s"] == pytest.approx(base["dv_m_s"] * 1.5)
+        assert fast["tof_s"] == _excess_dv_time_reduction(base["tof_s"], base["dv_m_s"], 0.5)
+        assert fast["helio_chi_final"] < base["helio_chi_final"]
+
+        clear_lambert_cache()
+
+    def test_locations_around_same_bodies_share_lambert_solves(self, monkeypatch):
+        """A leg from another orbit around the same bodies re-solves nothing."""
+        import transfer_planner
+
+        transfer_planner.clear_lambert_cache()
+        transfer_planner.compute_interplanetary_leg("LEO", "LMO", 1000.0)
+        calls = []
+        real_solve = transfer_planner.solve_lambert
+
+        def counting_solve(*args, **kwargs):
+            calls.append(args)
+            return real_solve(*args, **kwargs)
+
+        monkeypatch.setattr(transfer_planner, "solve_lambert", counting_solve)
+        leg = transfer_planner.compute_interplanetary_leg("GEO", "LMO", 1000.0)
+        assert leg is not None
+        assert calls == []
+
+        transfer_planner.clear_lambert_cache()
+        assert transfer_planner._solve_lambert_cached.cache_info().currsize == 0
 
     def test_cache_put_get(self):
         """Put and get from the cache."""
@@ -246,7 +283,7 @@ class TestLambertCache:
         )
 
         clear_lambert_cache()
-        key = _lambert_cache_key("TEST_A", "TEST_B", 99999.0, 0.0)
+        key = _lambert_cache_key("TEST_A", "TEST_B", 99999.0)
         data = {"dv_m_s": 5000.0, "tof_s": 86400.0}
         _lambert_cache_put(key, data)
 
@@ -263,7 +300,7 @@ class TestLambertCache:
         from transfer_planner import _lambert_cache_get, _lambert_cache_key, clear_lambert_cache
 
         clear_lambert_cache()
-        key = _lambert_cache_key("NONEXISTENT_A", "NONEXISTENT_B", 12345.0, 0.0)
+        key = _lambert_cache_key("NONEXISTENT_A", "NONEXISTENT_B", 12345.0)
         assert _lambert_cache_get(key) is None
         clear_lambert_cache()
 
@@ -280,7 +317,7 @@ class TestLambertCache:
         assert stats["misses"] == 0
         assert stats["size"] == 0
 
-        key = _lambert_cache_key("STAT_A", "STAT_B", 0.0, 0.0)
+        key = _lambert_cache_key("STAT_A", "STAT_B", 0.0)
         _lambert_cache_put(key, {"x": 1})
         stats = get_lambert_cache_stats()
         assert stats["misses"] == 1
@@ -303,7 +340,7 @@ class TestLambertCache:
 
         # Fill cache beyond max
         for i in range(_LAMBERT_CACHE_MAX + 10):
-            key = _lambert_cache_key(f"EVICT_{i}", "B", float(i * 100000), 0.0)
+            key = _lambert_cache_key(f"EVICT_{i}", "B", float(i * 100000))
             _lambert_cache_put(key, {"idx": i})
 
         from transfer_planner import get_lambert_cache_stats
@@ -311,31 +348,157 @@ class TestLambertCache:
         assert stats["size"] <= _LAMBERT_CACHE_MAX
 
         # First entries should have been evicted
-        key0 = _lambert_cache_key("EVICT_0", "B", 0.0, 0.0)
+        key0 = _lambert_cache_key("EVICT_0", "B", 0.0)
         assert _lambert_cache_get(key0) is None
 
         clear_lambert_cache()
 
-    def test_cache_returns_copy(self):
-        """Cached values should be copies, not references."""
+    def test_cache_returns_read_only_view(self):
+        """Cached values are shared read-only views, not mutable references."""
         from transfer_planner import (
             _lambert_cache_put, _lambert_cache_get, _lambert_cache_key,
             clear_lambert_cache,
         )
 
         clear_lambert_cache()
-        key = _lambert_cache_key("COPY_A", "COPY_B", 0.0, 0.0)
+        key = _lambert_cache_key("COPY_A", "COPY_B", 0.0)
         data = {"dv_m_s": 5000.0}
         _lambert_cache_put(key, data)
 
         result1 = _lambert_cache_get(key)
-        result1["dv_m_s"] = 9999.0  # mutate the copy
+        with pytest.raises(TypeError):
+            result1["dv_m_s"] = 9999.0
 
         result2 = _lambert_cache_get(key)
-        assert result2["dv_m_s"] == 5000.0, "Cache should return independent copies"
+        assert result2["dv_m_s"] == 5000.0
 
         clear_lambert_cache()
 
+    def test_compute_leg_returns_independent_dicts(self):
+        """compute_interplanetary_leg callers may mutate their result freely."""
+        from transfer_planner import clear_lambert_cache, compute_interplanetary_leg
+
+        clear_lambert_cache()
+        first = compute_interplanetary_leg("LEO", "LMO", 0.0)
+        assert isinstance(first, dict)
+        dv = first["dv_m_s"]
+        first["dv_m_s"] = -1.0
+        second = compute_interplanetary_leg("LEO", "LMO", 0.0)
+        assert isinstance(second, dict)
+        assert second["dv_m_s"] == dv
+
+        clear_lambert_cache()
+
+
+# ═══════════════════════════════════════════════════════════════
+# Config lookup indexes
+# ═══════════════════════════════════════════════════════════════
+
+
+class TestConfigIndexes:
+    """Cached config lookups in transfer_planner must match a fresh scan."""
+
+    def test_get_body_matches_config_scan(self):
+        from transfer_planner import _get_body, _get_config, invalidate_config_cache
+
+        invalidate_config_cache()
+        bodies = _get_config().get("bodies", [])
+        assert bodies
+        for body in bodies:
+            assert _get_body(body["id"]) is body
+        assert _get_body("no_such_body") is None
+
+        # Index is rebuilt from the reloaded config after invalidation
+        invalidate_config_cache()
+        assert _get_body(bodies[0]["id"]) is _get_config()["bodies"][0]
+
+    def test_parent_chain_cache_cleared_on_invalidate(self):
+        from transfer_planner import (
+            _body_parent_id, _resolve_heliocentric_body, invalidate_config_cache,
+        )
+
+        invalidate_config_cache()
+        assert _body_parent_id("earth") == "sun"
+        assert _body_parent_id("moon") == "earth"
+        assert _resolve_heliocentric_body("moon") == "earth"
+        assert _resolve_heliocentric_body("moon") == "earth"
+        assert _resolve_heliocentric_body.cache_info().hits >= 1
+
+        invalidate_config_cache()
+        assert _body_parent_id.cache_info().currsize == 0
+        assert _resolve_heliocentric_body.cache_info().currsize == 0
+
+    def test_location_body_map_built_once_per_config(self):
+        import celestial_config
+        from transfer_planner import _get_config, _get_location_body_map, invalidate_config_cache
+
+        invalidate_config_cache()
+        loc_map = _get_location_body_map()
+        assert loc_map == celestial_config.build_location_parent_body_map(_get_config())
+        assert loc_map["LEO"] == "earth"
+        assert _get_location_body_map() is loc_map
+
+        invalidate_config_cache()
+        assert _get_location_body_map() is not loc_map
+
+    def test_body_state_cache_quantizes_time(self):
+        import celestial_config
+        from transfer_planner import (
+            _body_state_at_tick, _body_state_cached, _get_config, invalidate_config_cache,
+        )
+
+        invalidate_config_cache()
+        t = 1.0e7
+        state = _body_state_cached("mars", t + 0.3)
+        assert state == celestial_config.compute_body_state(_get_config(), "mars", t)
+        assert _body_state_cached("mars", t - 0.4) is state
+        assert _body_state_at_tick.cache_info().hits == 1
+        with pytest.raises(celestial_config.CelestialConfigError):
+            _body_state_cached("no_such_body", t)
+
+        invalidate_config_cache()
+        assert _body_state_at_tick.cache_info().currsize == 0
+
+    def test_synodic_and_parking_radius_cached_per_config(self):
+        from transfer_planner import (
+            _parking_orbit_radius_km, get_synodic_period_s, invalidate_config_cache,
+        )
+
+        invalidate_config_cache()
+        synodic = get_synodic_period_s("earth", "mars")
+        assert synodic is not None and synodic > 0
+        assert get_synodic_period_s("earth", "mars") == synodic
+        assert _parking_orbit_radius_km("earth", "LEO") == _parking_orbit_radius_km("earth", "LEO")
+        assert get_synodic_period_s.cache_info().hits == 1
+        assert _parking_orbit_radius_km.cache_info().hits == 1
+
+        invalidate_config_cache()
+        assert get_synodic_period_s.cache_info().currsize == 0
+        assert _parking_orbit_radius_km.cache_info().currsize == 0
+
+    def test_mu_table_matches_get_body_mu(self):
+        import celestial_config
+        from transfer_planner import _get_config, _mu, invalidate_config_cache
+
+        invalidate_config_cache()
+        cfg = _get_config()
+        for body in cfg["bodies"]:
+            if body.get("mu_km3_s2") is not None:
+                assert _mu(body["id"]) == celestial_config.get_body_mu(cfg, body["id"])
+        with pytest.raises(celestial_config.CelestialConfigError):
+            _mu("no_such_body")
+
+    @pytest.mark.parametrize("body_id, altitude_km", [
+        ("jupiter", 1000.0),
+        ("mars", 250.0),
+        ("ceres", 80.0),
+    ])
+    def test_parking_radius_fallback_altitude_tiers(self, body_id, altitude_km):
+        from transfer_planner import _get_body, _parking_orbit_radius_km
+
+        radius_km = float(_get_body(body_id)["radius_km"])
+        assert _parking_orbit_radius_km(body_id) == pytest.approx(radius_km + altitude_km)
+
 
 # ═══════════════════════════════════════════════════════════════
 # Step 14: Auto-generated interplanetary edges
@@ -8,16 +8,10 @@ Tests for Phase 5 Lambert solver enhancements — Trajectory rendering:
 
 import json
 import math
-import sys
-from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
 import pytest
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
 
 # ─── Constants ────────────────────────────────────────────────
 
@@ -224,6 +218,23 @@ class TestComputeTrajectoryPoints:
             assert pt[0] == pytest.approx(R_EARTH_AU, rel=1e-10)
 
 
+    def test_chi_sampling_matches_time_sampling_endpoints(self):
+        """Sampling by the solved chi should start and end where time sampling does."""
+        from transfer_planner import _kepler_solve_chi, compute_trajectory_points
+
+        a = (R_EARTH_AU + R_MARS_AU) / 2.0
+        v_dep = math.sqrt(MU_SUN * (2.0 / R_EARTH_AU - 1.0 / a))
+        r1 = (R_EARTH_AU, 0.0, 0.0)
+        v1 = (0.0, v_dep, 1.5)
+        tof = 0.8 * math.pi * math.sqrt(a ** 3 / MU_SUN)
+
+        chi = _kepler_solve_chi(r1, v1, tof, MU_SUN)
+        by_time = compute_trajectory_points(r1, v1, MU_SUN, tof, n_points=16)
+        by_chi = compute_trajectory_points(r1, v1, MU_SUN, tof, n_points=16, chi_final=chi)
+        assert len(by_chi) == 16
+        assert by_chi[0] == by_time[0]
+        assert math.dist(by_chi[-1], by_time[-1]) < R_EARTH_AU * 1e-9
+
 class TestComputeLegTrajectory:
     """Test the convenience function for computing trajectory from orbital data."""
 
@@ -327,6 +338,7 @@ class TestInterplanetaryLegHelioState:
             assert len(result["helio_r1"]) == 3
             assert len(result["helio_v1"]) == 3
             assert result["helio_mu"] > 0
+            assert "helio_chi_final" in result
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -429,6 +441,16 @@ class TestTrajectoryDataFlow:
         json_str = json.dumps(trajectory_data)
         assert len(json_str) < 10000, f"Trajectory JSON is {len(json_str)} bytes, expected < 10KB"
 
+    def test_batch_matches_single_propagation(self):
+        """Batch propagation should match propagating each time separately."""
+        from transfer_planner import _kepler_propagate_batch, _kepler_propagate_state
+
+        r0 = (R_EARTH_AU, 0.0, 0.0)
+        v0 = (0.0, 1.3 * math.sqrt(MU_SUN / R_EARTH_AU), 0.0)
+        times = [0.0, 86400.0, 30.0 * 86400.0, -10.0 * 86400.0, 400.0 * 86400.0]
+        batch = _kepler_propagate_batch(r0, v0, MU_SUN, times)
+        assert batch == [_kepler_propagate_state(r0, v0, t, MU_SUN) for t in times]
+
 
 class TestKeplerPropagatorEdgeCases:
     """Test edge cases and robustness of the Kepler propagator."""
@@ -443,6 +465,22 @@ class TestKeplerPropagatorEdgeCases:
         # Should not crash; result may be approximate
         assert len(r) == 3
 
+    def test_hyperbolic_solve_converges_from_poor_guess(self):
+        """The chi solve must satisfy Kepler's equation where the hyperbolic
+        initial guess overshoots far past the root."""
+        from lambert import _stumpff_c2_c3
+        from transfer_planner import _kepler_orbit_constants, _kepler_solve_chi
+
+        r0 = (2.6e8, 2.3e8, -8.0e6)
+        v0 = (-29.0, -23.0, 1.9)
+        for dt in (1.55e7, 3.9e7, -2.0e7):
+            chi = _kepler_solve_chi(r0, v0, dt, MU_SUN)
+            r0_mag, _vr0, alpha, sqrt_mu, k1, k2 = _kepler_orbit_constants(r0, v0, MU_SUN)
+            assert alpha < 0
+            c2, c3 = _stumpff_c2_c3(chi * chi * alpha)
+            t_chi = (k1 * chi * chi * c2 + k2 * chi ** 3 * c3 + r0_mag * chi) / sqrt_mu
+            assert t_chi == pytest.approx(dt, rel=1e-9)
+
     def test_very_large_dt(self):
         """Should handle long propagation times without crashing."""
         from transfer_planner import _kepler_propagate_state
@@ -7,158 +7,147 @@ Tests cover:
   - "Edit Ship" mode: deconstruct + rebuild flow
   - API endpoint validation for all related routes
   - Frontend HTML structure validation
+
+Classes carry xdist_group marks so the file can run in parallel:
+    pytest -n auto --dist=loadgroup tests/test_shipyard_modes.py
 """
 
 import json
-import os
 import re
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-os.environ.setdefault("DEV_SKIP_AUTH", "1")
+from org_service import (
+    BOOSTABLE_TECH_LEVELS,
+    LEO_BOOST_BASE_COST,
+    LEO_BOOST_COST_PER_KG,
+    LEO_LOCATION_ID,
+    calculate_boost_cost,
+)
 
 
-# ── HTML Structure Tests ──────────────────────────────────────────────────
+# ── Structure needles ─────────────────────────────────────────────────────
+# (needle, test id) pairs checked against the static shipyard assets, kept in
+# tests/fixtures/shipyard_structure.json. Each asset is scanned once for all
+# of its needles; see _scan_needles().
 
-class TestShipyardHTMLStructure:
-    """Verify the shipyard HTML has the mode selector and designer elements."""
+_STRUCTURE = json.loads(
+    (Path(__file__).resolve().parent / "fixtures" / "shipyard_structure.json").read_text()
+)
 
-    @pytest.fixture()
-    def html_content(self):
-        html_path = Path(__file__).resolve().parent.parent / "static" / "shipyard.html"
-        return html_path.read_text()
 
-    def test_mode_selector_exists(self, html_content):
-        assert 'id="shipyardModeSelect"' in html_content
+def _load_needles(key):
+    return [(needle.encode("ascii"), test_id) for needle, test_id in _STRUCTURE[key]]
 
-    def test_boost_mode_card_exists(self, html_content):
-        assert 'data-mode="boost"' in html_content
 
-    def test_site_mode_card_exists(self, html_content):
-        assert 'data-mode="site"' in html_content
+_HTML_NEEDLES = _load_needles("html_needles")
+_JS_NEEDLES = _load_needles("js_needles")
+_CSS_NEEDLES = _load_needles("css_needles")
 
-    def test_edit_mode_card_exists(self, html_content):
-        assert 'data-mode="edit"' in html_content
 
-    def test_designer_hidden_by_default(self, html_content):
-        assert 'id="shipyardDesigner"' in html_content
-        # Designer should start hidden
-        assert 'shipyardDesigner' in html_content
-        # Check it starts with display:none
-        idx = html_content.index('id="shipyardDesigner"')
-        surrounding = html_content[max(0, idx - 100):idx + 100]
-        assert 'display:none' in surrounding
+# An element id and a display:none within the same opening tag, either order.
+_HIDDEN_RE = re.compile(
+    rb'id="(shipyardDesigner|shipyardShipSelect)"[^>]{0,200}display:\s*none'
+    rb'|display:\s*none[^>]{0,200}id="(shipyardDesigner|shipyardShipSelect)"'
+)
 
-    def test_ship_selector_exists(self, html_content):
-        assert 'id="shipyardShipSelect"' in html_content
+# Both cache busters in one pass; the literal prefixes keep the scan cheap.
+_CACHE_BUSTER_RE = re.compile(rb"shipyard\.js\?v=sy(\d+)|styles\.css\?v=layout(\d+)")
 
-    def test_ship_selector_hidden_by_default(self, html_content):
-        idx = html_content.index('id="shipyardShipSelect"')
-        surrounding = html_content[max(0, idx - 100):idx + 100]
-        assert 'display:none' in surrounding
 
-    def test_boost_cost_element_exists(self, html_content):
-        assert 'id="shipyardBoostCost"' in html_content
+def _params(needles):
+    return [pytest.param(needle, id=test_id) for needle, test_id in needles]
 
-    def test_back_buttons_exist(self, html_content):
-        assert 'id="shipyardBackToModes"' in html_content
-        assert 'id="shipyardModeBack"' in html_content
 
-    def test_mode_card_labels(self, html_content):
-        assert "Build to Boost" in html_content
-        assert "Build from Site" in html_content
-        assert "Edit Ship" in html_content
+def _scan_needles(content, needles):
+    """Return the needles present in *content* using a single regex pass.
 
-    def test_cache_buster_updated(self, html_content):
-        # Ensure the JS cache buster is present and >= sy18
-        js_match = re.search(r"shipyard\.js\?v=sy(\d+)", html_content)
-        assert js_match is not None
-        assert int(js_match.group(1)) >= 18
+    The alternation is ordered longest-first inside a zero-width lookahead so
+    every start position reports its longest match; a needle that only occurs
+    as part of a longer one is recovered by the substring check on the hits.
+    """
+    ordered = sorted(set(needles), key=len, reverse=True)
+    pattern = re.compile(b"(?=(" + b"|".join(re.escape(n) for n in ordered) + b"))")
+    hits = set(pattern.findall(content))
+    return {n for n in ordered if n in hits or any(n in h for h in hits)}
 
-        # Ensure CSS cache buster is present and >= layout34
-        css_match = re.search(r"styles\.css\?v=layout(\d+)", html_content)
-        assert css_match is not None
-        assert int(css_match.group(1)) >= 34
 
+@pytest.fixture(scope="module")
+def html_hits(html_content):
+    return _scan_needles(html_content, [n for n, _ in _HTML_NEEDLES])
 
-# ── JavaScript Structure Tests ────────────────────────────────────────────
 
-class TestShipyardJSStructure:
-    """Verify the shipyard JS has mode-related functions and state."""
-
-    @pytest.fixture()
-    def js_content(self):
-        js_path = Path(__file__).resolve().parent.parent / "static" / "js" / "shipyard.js"
-        return js_path.read_text()
+@pytest.fixture(scope="module")
+def js_hits(js_content):
+    return _scan_needles(js_content, [n for n, _ in _JS_NEEDLES])
 
-    def test_current_mode_variable(self, js_content):
-        assert 'let currentMode = ""' in js_content
 
-    def test_enter_mode_function(self, js_content):
-        assert "async function enterMode(mode)" in js_content
+@pytest.fixture(scope="module")
+def js_index(js_content):
+    """First offset of each ordering-sensitive token in shipyard.js."""
+    index = {}
+    for token in (b'"robonauts"', b'"thrusters"'):
+        pos = js_content.find(token)
+        if pos >= 0:
+            index[token] = pos
+    return index
 
-    def test_boost_mode_handler(self, js_content):
-        assert "buildShipBoost" in js_content
 
-    def test_site_mode_handler(self, js_content):
-        assert "buildShipSite" in js_content
+@pytest.fixture(scope="module")
+def css_hits(css_content):
+    return _scan_needles(css_content, [n for n, _ in _CSS_NEEDLES])
 
-    def test_edit_mode_handler(self, js_content):
-        assert "buildShipEdit" in js_content
 
-    def test_boost_cost_rendering(self, js_content):
-        assert "renderBoostCost" in js_content
+# ── HTML Structure Tests ──────────────────────────────────────────────────
 
-    def test_org_balance_loading(self, js_content):
-        assert "loadOrgBalance" in js_content
+class TestShipyardHTMLStructure:
+    """Verify the shipyard HTML has the mode selector and designer elements."""
 
-    def test_fleet_loading(self, js_content):
-        assert "loadFleet" in js_content
+    pytestmark = pytest.mark.xdist_group("static_files")
 
-    def test_ship_selector_rendering(self, js_content):
-        assert "renderShipSelector" in js_content
+    @pytest.mark.parametrize("needle", _params(_HTML_NEEDLES))
+    def test_html_contains(self, html_hits, needle):
+        assert needle in html_hits
 
-    def test_mode_selectors_setup(self, js_content):
-        assert "setupModeSelectors" in js_content
+    def test_hidden_by_default(self, html_content):
+        """Designer and ship selector both start with display:none."""
+        hidden = {m.group(1) or m.group(2) for m in _HIDDEN_RE.finditer(html_content)}
+        assert {b"shipyardDesigner", b"shipyardShipSelect"} <= hidden
 
-    def test_boost_uses_boostable_items(self, js_content):
-        assert "/api/org/boostable-items" in js_content
+    def test_cache_buster_updated(self, html_content):
+        versions = {"js": [], "css": []}
+        for m in _CACHE_BUSTER_RE.finditer(html_content):
+            if m.group(1) is not None:
+                versions["js"].append(int(m.group(1)))
+            else:
+                versions["css"].append(int(m.group(2)))
 
-    def test_boost_uses_org_boost(self, js_content):
-        assert "/api/org/boost" in js_content
+        # Ensure the JS cache buster is present and >= sy18
+        assert versions["js"]
+        assert versions["js"][0] >= 18
 
-    def test_edit_uses_deconstruct(self, js_content):
-        # Edit mode now uses the consolidated refit endpoint.
-        assert "/api/shipyard/refit" in js_content
+        # Ensure CSS cache buster is present and >= layout34
+        assert versions["css"]
+        assert versions["css"][0] >= 34
 
-    def test_edit_uses_fleet_state(self, js_content):
-        assert "/api/state" in js_content
 
-    def test_show_screen_function(self, js_content):
-        assert "function showScreen(screen)" in js_content
+# ── JavaScript Structure Tests ────────────────────────────────────────────
 
-    def test_three_screens(self, js_content):
-        # Should have modes, shipSelect, and designer screens
-        assert '"modes"' in js_content
-        assert '"shipSelect"' in js_content
-        assert '"designer"' in js_content
+class TestShipyardJSStructure:
+    """Verify the shipyard JS has mode-related functions and state."""
 
-    def test_slot_categories_order(self, js_content):
-        """Verify category order: Robonauts at top, Thrusters at bottom."""
-        robo_idx = js_content.index('"robonauts"')
-        thrust_idx = js_content.index('"thrusters"')
-        assert robo_idx < thrust_idx
+    pytestmark = pytest.mark.xdist_group("static_files")
 
-    def test_augment_garage_with_ship_parts(self, js_content):
-        """Edit mode should augment the garage with the ship's own parts."""
-        assert "augmentGarageWithShipParts" in js_content
+    @pytest.mark.parametrize("needle", _params(_JS_NEEDLES))
+    def test_js_contains(self, js_hits, needle):
+        assert needle in js_hits
 
-    def test_fuel_hidden_in_boost_mode(self, js_content):
-        """Boost mode should hide fuel loading."""
-        assert 'currentMode === "boost"' in js_content
+    def test_slot_categories_order(self, js_index):
+        """Verify category order: Robonauts at top, Thrusters at bottom."""
+        assert b'"robonauts"' in js_index
+        assert b'"thrusters"' in js_index
+        assert js_index[b'"robonauts"'] < js_index[b'"thrusters"']
 
 
 # ── CSS Structure Tests ───────────────────────────────────────────────────
@@ -166,63 +155,60 @@ class TestShipyardJSStructure:
 class TestShipyardCSSStructure:
     """Verify the CSS has mode selector styles."""
 
-    @pytest.fixture()
-    def css_content(self):
-        css_path = Path(__file__).resolve().parent.parent / "static" / "styles.css"
-        return css_path.read_text()
+    pytestmark = pytest.mark.xdist_group("static_files")
 
-    def test_mode_select_class(self, css_content):
-        assert ".shipyardModeSelect" in css_content
+    @pytest.mark.parametrize("needle", _params(_CSS_NEEDLES))
+    def test_css_contains(self, css_hits, needle):
+        assert needle in css_hits
 
-    def test_mode_card_class(self, css_content):
-        assert ".shipyardModeCard" in css_content
 
-    def test_mode_card_hover(self, css_content):
-        assert ".shipyardModeCard:hover" in css_content
+# ── API Endpoint Tests ────────────────────────────────────────────────────
+# Read-only endpoints are fetched once per module; the fixtures assert the
+# status code and the tests below check different parts of the payload.
 
-    def test_ship_select_class(self, css_content):
-        assert ".shipyardShipSelect" in css_content
+def _get_json(client, path):
+    r = client.get(path)
+    assert r.status_code == 200, f"GET {path} failed: {r.status_code} {r.text}"
+    return r.json()
 
-    def test_ship_card_class(self, css_content):
-        assert ".shipyardShipCard" in css_content
 
-    def test_ship_card_disabled_class(self, css_content):
-        assert ".shipyardShipCardDisabled" in css_content
+@pytest.fixture(scope="module")
+def boostable_items(client):
+    return _get_json(client, "/api/org/boostable-items")
 
-    def test_boost_cost_class(self, css_content):
-        assert ".shipyardBoostCost" in css_content
 
-    def test_boost_cost_insufficient(self, css_content):
-        assert ".boostCostInsufficient" in css_content
+@pytest.fixture(scope="module")
+def shipyard_catalog(client):
+    return _get_json(client, "/api/shipyard/catalog")
 
 
-# ── API Endpoint Tests ────────────────────────────────────────────────────
+@pytest.fixture(scope="module")
+def org_data(client):
+    return _get_json(client, "/api/org")
+
+
+@pytest.fixture(scope="module")
+def fleet_state(client):
+    return _get_json(client, "/api/state")
+
 
 class TestBoostableItemsEndpoint:
     """Test /api/org/boostable-items endpoint."""
 
-    def test_returns_200(self, client):
-        r = client.get("/api/org/boostable-items")
-        assert r.status_code == 200
+    pytestmark = pytest.mark.xdist_group("api_readonly")
 
-    def test_returns_items_list(self, client):
-        r = client.get("/api/org/boostable-items")
-        data = r.json()
-        assert "items" in data
-        assert isinstance(data["items"], list)
+    def test_returns_items_list(self, boostable_items):
+        assert "items" in boostable_items
+        assert isinstance(boostable_items["items"], list)
 
-    def test_returns_cost_constants(self, client):
-        r = client.get("/api/org/boostable-items")
-        data = r.json()
-        assert "base_cost_usd" in data
-        assert "cost_per_kg_usd" in data
-        assert data["base_cost_usd"] == 100_000_000
-        assert data["cost_per_kg_usd"] == 5_000
+    def test_returns_cost_constants(self, boostable_items):
+        assert "base_cost_usd" in boostable_items
+        assert "cost_per_kg_usd" in boostable_items
+        assert boostable_items["base_cost_usd"] == 100_000_000
+        assert boostable_items["cost_per_kg_usd"] == 5_000
 
-    def test_items_have_required_fields(self, client):
-        r = client.get("/api/org/boostable-items")
-        data = r.json()
-        for item in data["items"]:
+    def test_items_have_required_fields(self, boostable_items):
+        for item in boostable_items["items"]:
             assert "item_id" in item
             assert "name" in item
             assert "type" in item
@@ -232,26 +218,22 @@ class TestBoostableItemsEndpoint:
 class TestBoostCostEndpoint:
     """Test /api/org/boost-cost endpoint."""
 
-    def test_returns_200(self, client):
-        r = client.post("/api/org/boost-cost", json={"mass_kg": 1000})
-        assert r.status_code == 200
+    pytestmark = pytest.mark.xdist_group("api_readonly")
 
-    def test_cost_formula(self, client):
-        mass_kg = 5000
+    @pytest.mark.parametrize("mass_kg", [0, 1000, 5000, 1_000_000])
+    def test_cost_formula(self, client, mass_kg):
         r = client.post("/api/org/boost-cost", json={"mass_kg": mass_kg})
-        data = r.json()
+        assert r.status_code == 200
         expected = 100_000_000 + (5_000 * mass_kg)
-        assert data["cost_usd"] == pytest.approx(expected)
-
-    def test_zero_mass(self, client):
-        r = client.post("/api/org/boost-cost", json={"mass_kg": 0})
-        data = r.json()
-        assert data["cost_usd"] == pytest.approx(100_000_000)
+        # Whole-dollar float math on the server is exact at these magnitudes.
+        assert r.json()["cost_usd"] == expected
 
 
 class TestShipyardPreviewEndpoint:
     """Test /api/shipyard/preview endpoint."""
 
+    pytestmark = pytest.mark.xdist_group("api_readonly")
+
     def test_empty_parts_returns_200(self, client):
         r = client.post("/api/shipyard/preview", json={
             "parts": [],
@@ -268,68 +250,45 @@ class TestShipyardPreviewEndpoint:
         assert "stats" in data
         assert "dry_mass_kg" in data["stats"]
 
-    def test_invalid_location(self, client):
-        r = client.post("/api/shipyard/preview", json={
-            "parts": [],
-            "source_location_id": "NONEXISTENT_LOCATION_XYZ",
-        })
-        assert r.status_code == 400
-
 
 class TestShipyardCatalogEndpoint:
     """Test /api/shipyard/catalog endpoint."""
 
-    def test_returns_200(self, client):
-        r = client.get("/api/shipyard/catalog")
-        assert r.status_code == 200
+    pytestmark = pytest.mark.xdist_group("api_readonly")
 
-    def test_returns_parts(self, client):
-        r = client.get("/api/shipyard/catalog")
-        data = r.json()
-        assert "parts" in data
-        assert isinstance(data["parts"], list)
-        assert len(data["parts"]) > 0
+    def test_returns_parts(self, shipyard_catalog):
+        assert "parts" in shipyard_catalog
+        assert isinstance(shipyard_catalog["parts"], list)
+        assert len(shipyard_catalog["parts"]) > 0
 
-    def test_returns_build_source_locations(self, client):
-        r = client.get("/api/shipyard/catalog")
-        data = r.json()
-        assert "build_source_locations" in data
-        assert isinstance(data["build_source_locations"], list)
+    def test_returns_build_source_locations(self, shipyard_catalog):
+        assert "build_source_locations" in shipyard_catalog
+        assert isinstance(shipyard_catalog["build_source_locations"], list)
 
-    def test_parts_have_item_id(self, client):
-        r = client.get("/api/shipyard/catalog")
-        data = r.json()
-        for part in data["parts"]:
+    def test_parts_have_item_id(self, shipyard_catalog):
+        for part in shipyard_catalog["parts"]:
             assert "item_id" in part, f"Part missing item_id: {part}"
 
 
 class TestOrgEndpoint:
     """Test /api/org endpoint returns balance."""
 
-    def test_returns_200(self, client):
-        r = client.get("/api/org")
-        assert r.status_code == 200
+    pytestmark = pytest.mark.xdist_group("api_readonly")
 
-    def test_returns_balance(self, client):
-        r = client.get("/api/org")
-        data = r.json()
-        assert "org" in data
-        assert "balance_usd" in data["org"]
-        assert isinstance(data["org"]["balance_usd"], (int, float))
+    def test_returns_balance(self, org_data):
+        assert "org" in org_data
+        assert "balance_usd" in org_data["org"]
+        assert isinstance(org_data["org"]["balance_usd"], (int, float))
 
 
 class TestFleetStateEndpoint:
     """Test /api/state endpoint for edit mode."""
 
-    def test_returns_200(self, client):
-        r = client.get("/api/state")
-        assert r.status_code == 200
+    pytestmark = pytest.mark.xdist_group("api_readonly")
 
-    def test_returns_ships(self, client):
-        r = client.get("/api/state")
-        data = r.json()
-        assert "ships" in data
-        assert isinstance(data["ships"], list)
+    def test_returns_ships(self, fleet_state):
+        assert "ships" in fleet_state
+        assert isinstance(fleet_state["ships"], list)
 
 
 # ── Boost Cost Calculation Tests ──────────────────────────────────────────
@@ -337,64 +296,50 @@ class TestFleetStateEndpoint:
 class TestBoostCostCalculation:
     """Unit tests for boost cost calculation."""
 
-    def test_base_cost_formula(self):
-        from org_service import calculate_boost_cost, LEO_BOOST_BASE_COST, LEO_BOOST_COST_PER_KG
-        assert calculate_boost_cost(0) == LEO_BOOST_BASE_COST
-        assert calculate_boost_cost(1000) == LEO_BOOST_BASE_COST + (LEO_BOOST_COST_PER_KG * 1000)
+    @pytest.mark.parametrize("mass_kg", [0, 1000, 5000, 1_000_000])
+    def test_base_cost_formula(self, mass_kg):
+        assert calculate_boost_cost(mass_kg) == LEO_BOOST_BASE_COST + (LEO_BOOST_COST_PER_KG * mass_kg)
 
-    def test_boostable_tech_levels(self):
-        from org_service import BOOSTABLE_TECH_LEVELS
-        assert 1 in BOOSTABLE_TECH_LEVELS
-        assert 1.5 in BOOSTABLE_TECH_LEVELS
-        assert 2 in BOOSTABLE_TECH_LEVELS
-        assert 2.5 in BOOSTABLE_TECH_LEVELS
-        assert 3 not in BOOSTABLE_TECH_LEVELS
+    @pytest.mark.parametrize("level,expected", [
+        (1, True),
+        (1.5, True),
+        (2, True),
+        (2.5, True),
+        (3, False),
+    ])
+    def test_boostable_tech_levels(self, level, expected):
+        assert (level in BOOSTABLE_TECH_LEVELS) is expected
 
     def test_leo_location_constant(self):
-        from org_service import LEO_LOCATION_ID
         assert LEO_LOCATION_ID == "LEO"
 
 
-# ── Build from Site Integration Tests ──────────────────────────────────── 
-
-class TestBuildFromSite:
-    """Integration tests for site-based ship building."""
-
-    def test_build_requires_name(self, client):
-        r = client.post("/api/shipyard/build", json={
-            "name": "",
-            "parts": ["some_part"],
-            "source_location_id": "LEO",
-        })
-        assert r.status_code == 400
-
-    def test_build_requires_parts(self, client):
-        r = client.post("/api/shipyard/build", json={
-            "name": "Test Ship",
-            "parts": [],
-            "source_location_id": "LEO",
-        })
-        assert r.status_code == 400
-
-    def test_build_invalid_location(self, client):
-        r = client.post("/api/shipyard/build", json={
-            "name": "Test Ship",
-            "parts": ["some_part"],
-            "source_location_id": "NONEXISTENT_XYZ",
-        })
-        assert r.status_code == 400
-
+# ── Endpoint Error Paths ───────────────────────────────────────────────── 
 
-# ── Ship Deconstruct Tests ────────────────────────────────────────────────
+class TestErrorPaths:
+    """Negative cases for the build, deconstruct and preview endpoints."""
 
-class TestShipDeconstruct:
-    """Test /api/ships/{id}/deconstruct endpoint for edit mode."""
+    pytestmark = pytest.mark.xdist_group("api_readonly")
 
-    def test_nonexistent_ship_returns_404(self, client):
-        r = client.post("/api/ships/nonexistent_ship_xyz/deconstruct", json={
-            "keep_ship_record": False,
-        })
-        assert r.status_code == 404
+    @pytest.mark.parametrize("path,payload,status", [
+        pytest.param("/api/shipyard/build",
+                     {"name": "", "parts": ["some_part"], "source_location_id": "LEO"},
+                     400, id="build-requires-name"),
+        pytest.param("/api/shipyard/build",
+                     {"name": "Test Ship", "parts": [], "source_location_id": "LEO"},
+                     400, id="build-requires-parts"),
+        pytest.param("/api/shipyard/build",
+                     {"name": "Test Ship", "parts": ["some_part"], "source_location_id": "NONEXISTENT_XYZ"},
+                     400, id="build-invalid-location"),
+        pytest.param("/api/ships/nonexistent_ship_xyz/deconstruct",
+                     {"keep_ship_record": False},
+                     404, id="deconstruct-nonexistent-ship"),
+        pytest.param("/api/shipyard/preview",
+                     {"parts": [], "source_location_id": "NONEXISTENT_LOCATION_XYZ"},
+                     400, id="preview-invalid-location"),
+    ])
+    def test_error_status(self, client, path, payload, status):
+        assert client.post(path, json=payload).status_code == status
 
 
 # ── Full Boost+Build Flow Test ────────────────────────────────────────────
@@ -405,22 +350,23 @@ class TestBoostBuildFlow:
     This mirrors what the "Build to Boost" mode does in the UI.
     """
 
-    def test_boost_and_build_flow(self, client):
-        """Full boost+build flow — boost a part and build a ship from it."""
-        # Get boostable items
-        r = client.get("/api/org/boostable-items")
-        assert r.status_code == 200
-        items = r.json()["items"]
-        assert len(items) > 0
+    pytestmark = [pytest.mark.xdist_group("api_mutating"), pytest.mark.slow]
 
-        # Find a non-resource part (something with mass)
+    @pytest.fixture(scope="class")
+    def chosen_boostable(self, boostable_items):
+        """First non-resource part (something with mass) from the cached list."""
+        items = boostable_items["items"]
+        assert len(items) > 0
         part_items = [i for i in items if i["type"] != "resource"]
         if not part_items:
             pytest.skip("No boostable parts available")
+        return part_items[0]
 
-        chosen = part_items[0]
-        item_id = chosen["item_id"]
-        item_mass = chosen["mass_per_unit_kg"]
+    def test_boost_and_build_flow(self, mutating_client, chosen_boostable):
+        """Full boost+build flow — boost a part and build a ship from it."""
+        client = mutating_client
+        item_id = chosen_boostable["item_id"]
+        item_mass = chosen_boostable["mass_per_unit_kg"]
 
         # Check org balance
         r = client.get("/api/org")
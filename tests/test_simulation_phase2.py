@@ -65,17 +65,26 @@ def api_world(api_db_conn: sqlite3.Connection) -> GameWorldBuilder:
     return w
 
 
+@pytest.fixture(scope="module")
+def _api_client():
+    """One app startup per module; api_client_db swaps the DB in per test."""
+    with TestClient(app) as c:
+        yield c
+
+
 @pytest.fixture()
-def api_client_db(api_db_conn: sqlite3.Connection):
-    """TestClient bound to the seeded in-memory DB via dependency override."""
+def api_client_db(_api_client: TestClient, api_db_conn: sqlite3.Connection):
+    """TestClient bound to the seeded per-test DB via dependency override."""
 
     def _override_get_db():
         yield api_db_conn
 
     app.dependency_overrides[db.get_db] = _override_get_db
-    with TestClient(app) as c:
-        yield c
-    app.dependency_overrides.clear()
+    try:
+        yield _api_client
+    finally:
+        app.dependency_overrides.clear()
+        _api_client.cookies.clear()
 
 
 def _enable_corp_auth(client: TestClient, conn: sqlite3.Connection, corp_id: str, monkeypatch) -> str:
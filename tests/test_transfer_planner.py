@@ -5,6 +5,9 @@ orbital mechanics helpers, and edge-case handling.
 
 Tests spawn real ships via the API, execute transfers, verify fuel
 consumption and transit state, and delete the ships after each test.
+API tests share the session-scoped `client`, so the app starts up and
+builds its transfer matrix once per run; the Dijkstra tests build their
+own network in a throwaway in-memory `db_conn` instead.
 
 Coverage:
   - Transfer quote (basic & advanced) for all route types
@@ -19,19 +22,177 @@ Coverage:
   - Teleport and refuel admin helpers
 """
 
+import contextlib
+import itertools
 import json
 import math
-import sys
-import time
-from pathlib import Path
+import random
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-import os
+import celestial_config
+import transfer_planner
+from catalog_service import (
+    compute_acceleration_gs,
+    compute_delta_v_remaining_m_s,
+    compute_fuel_needed_for_delta_v_kg,
+    compute_wet_mass_kg,
+)
+from fleet_router import _excess_dv_time_reduction, _is_interplanetary
+from lambert import make_transfer_dv
+from main import dijkstra_all_pairs, settle_arrivals
+
+
+# Parts list for every standard test ship; copied per request with list().
+_STD_PARTS = ({"item_id": "scn_1_pioneer"},)
+
+
+def _unique_ship_id(base: str) -> str:
+    """Ship id with a random suffix, lowercased to match the server's slugified ids.
+
+    Random rather than per-worker suffixes keep ids unique across xdist
+    workers and separate pytest processes sharing one database alike.
+    """
+    return f"{base}_{uuid.uuid4().hex[:8]}".lower()
+
+
+def _spawn_ship(client, base, *, location="LEO", fuel_kg=None, parts=_STD_PARTS):
+    """Spawn a ship with a unique id from ``base`` and return its JSON.
+
+    With ``fuel_kg=None`` the server fills the tanks to capacity, so no
+    follow-up refuel is needed.
+    """
+    ship_id = _unique_ship_id(base)
+    payload = {
+        "name": f"Test {ship_id}",
+        "location_id": location,
+        "ship_id": ship_id,
+        "parts": list(parts),
+    }
+    if fuel_kg is not None:
+        payload["fuel_kg"] = fuel_kg
+    r = client.post("/api/admin/spawn_ship", json=payload)
+    assert r.status_code == 200, f"Failed to spawn ship: {r.text}"
+    return r.json()["ship"]
+
+
+@contextlib.contextmanager
+def managed_ship(client, base, **spawn_kwargs):
+    """Spawn a ship for the duration of a ``with`` block, then delete it.
+
+    Yields the spawned ship JSON; deletion tolerates a ship the test
+    already removed.
+    """
+    ship = _spawn_ship(client, base, **spawn_kwargs)
+    try:
+        yield ship
+    finally:
+        client.delete(f"/api/admin/ships/{ship['id']}")
+
+
+def _get_ship(client, ship_id):
+    """Get ship data from /api/ships/{id}, or None if it does not exist."""
+    r = client.get(f"/api/ships/{ship_id}")
+    if r.status_code == 404:
+        return None
+    assert r.status_code == 200
+    return r.json()["ship"]
+
+
+def _delete_ships(client, ship_ids):
+    """Delete ships concurrently; the shared TestClient is safe across threads."""
+    with ThreadPoolExecutor(max_workers=max(1, len(ship_ids))) as ex:
+        list(ex.map(lambda sid: client.delete(f"/api/admin/ships/{sid}"), ship_ids))
+
+
+def _assert_status(client, method, url, code, **kwargs):
+    """Status-only check: the response body is never JSON-decoded."""
+    r = client.request(method, url, **kwargs)
+    assert r.status_code == code, f"{method} {url} → {r.status_code}: {r.text}"
+
+
+class _ShipPool:
+    """Standard LEO ships reused across tests instead of spawn/delete per test.
+
+    ``acquire()`` hands out a docked, fully fuelled ship.  On exit it is
+    teleported back to LEO (which also cancels any transit) and refuelled;
+    a ship that cannot be reset is deleted and dropped from the pool.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._free = []
+        self._owned = []
+
+    def _spawn(self):
+        ship_id = _spawn_ship(self._client, "pool_ship")["id"]
+        self._owned.append(ship_id)
+        return ship_id
+
+    def _reset(self, ship_id):
+        r = self._client.post(f"/api/admin/ships/{ship_id}/teleport", json={"to_location_id": "LEO"})
+        if r.status_code != 200:
+            return False
+        return self._client.post(f"/api/admin/ships/{ship_id}/refuel").status_code == 200
+
+    @contextlib.contextmanager
+    def acquire(self):
+        ship_id = self._free.pop() if self._free else self._spawn()
+        try:
+            yield ship_id
+        finally:
+            if self._reset(ship_id):
+                self._free.append(ship_id)
+            else:
+                self._owned.remove(ship_id)
+                self._client.delete(f"/api/admin/ships/{ship_id}")
+
+    def close(self):
+        for ship_id in self._owned:
+            self._client.delete(f"/api/admin/ships/{ship_id}")
+        self._owned.clear()
+        self._free.clear()
+
+
+@pytest.fixture(scope="module")
+def ship_pool(client):
+    pool = _ShipPool(client)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def transfer_quote(client):
+    """Fetch /api/transfer_quote JSON for (from_id, to_id), cached per session.
+
+    The cache lives in this fixture, so it goes away with ``client``.  The
+    orbit graph and transfer matrix are static once the app has started;
+    callers must treat the returned dict as read-only.
+    """
+    cache: Dict[tuple, Dict[str, Any]] = {}
+
+    def fetch(from_id, to_id):
+        key = (from_id, to_id)
+        if key not in cache:
+            r = client.get("/api/transfer_quote", params={"from_id": from_id, "to_id": to_id})
+            assert r.status_code == 200, f"quote {from_id}→{to_id} → {r.status_code}: {r.text}"
+            cache[key] = r.json()
+        return cache[key]
 
-os.environ.setdefault("DEV_SKIP_AUTH", "1")
+    return fetch
+
+
+@pytest.fixture(scope="session")
+def leaf_location_ids(client):
+    """Non-group location ids from /api/locations, fetched once per session."""
+    r = client.get("/api/locations")
+    assert r.status_code == 200
+    data = r.json()
+    locations = data if isinstance(data, list) else data.get("locations", [])
+    return [loc["id"] for loc in locations if isinstance(loc, dict) and not loc.get("is_group")]
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -43,52 +204,36 @@ class TestTsiolkovskyDeltaV:
     """Test the rocket equation implementation in catalog_service."""
 
     def test_dv_remaining_basic(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         # 5000 kg dry, 5000 kg fuel, 900s ISP → dv ≈ 900*9.81*ln(2) ≈ 6117 m/s
         dv = compute_delta_v_remaining_m_s(5000, 5000, 900)
         expected = 900 * 9.80665 * math.log(2)
         assert abs(dv - expected) < 1.0, f"Expected ~{expected:.0f}, got {dv:.0f}"
 
     def test_dv_remaining_zero_fuel(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         assert compute_delta_v_remaining_m_s(5000, 0, 900) == 0.0
 
     def test_dv_remaining_zero_isp(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         assert compute_delta_v_remaining_m_s(5000, 5000, 0) == 0.0
 
     def test_dv_remaining_zero_dry_mass(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         assert compute_delta_v_remaining_m_s(0, 5000, 900) == 0.0
 
     def test_dv_remaining_negative_values_clamped(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         # Negatives are clamped to 0.0 internally
         assert compute_delta_v_remaining_m_s(-100, 5000, 900) == 0.0
         assert compute_delta_v_remaining_m_s(5000, -100, 900) == 0.0
 
     def test_dv_remaining_none_values(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         assert compute_delta_v_remaining_m_s(None, 5000, 900) == 0.0
         assert compute_delta_v_remaining_m_s(5000, None, 900) == 0.0
         assert compute_delta_v_remaining_m_s(5000, 5000, None) == 0.0
 
     def test_dv_remaining_scales_with_fuel(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         dv_low = compute_delta_v_remaining_m_s(5000, 1000, 900)
         dv_high = compute_delta_v_remaining_m_s(5000, 5000, 900)
         assert dv_high > dv_low
 
     def test_dv_remaining_scales_with_isp(self):
-        from catalog_service import compute_delta_v_remaining_m_s
-
         dv_low = compute_delta_v_remaining_m_s(5000, 5000, 300)
         dv_high = compute_delta_v_remaining_m_s(5000, 5000, 900)
         assert dv_high > dv_low
@@ -100,31 +245,20 @@ class TestFuelConsumption:
     """Test fuel-needed-for-delta-v computation."""
 
     def test_zero_dv_uses_no_fuel(self):
-        from catalog_service import compute_fuel_needed_for_delta_v_kg
-
         assert compute_fuel_needed_for_delta_v_kg(5000, 5000, 900, 0.0) == 0.0
 
     def test_fuel_needed_basic(self):
-        from catalog_service import compute_fuel_needed_for_delta_v_kg
-
         fuel = compute_fuel_needed_for_delta_v_kg(5000, 5000, 900, 1000)
         assert fuel > 0
         assert fuel < 5000  # Shouldn't use all fuel for 1000 m/s with 900s ISP
 
     def test_fuel_never_exceeds_available(self):
-        from catalog_service import compute_fuel_needed_for_delta_v_kg
-
         # Request absurd dv — fuel used should be capped at available
         fuel = compute_fuel_needed_for_delta_v_kg(5000, 2000, 900, 999999)
         assert fuel <= 2000
 
     def test_roundtrip_dv_fuel(self):
         """Fuel consumed for X m/s should leave exactly (total_dv - X) remaining."""
-        from catalog_service import (
-            compute_delta_v_remaining_m_s,
-            compute_fuel_needed_for_delta_v_kg,
-        )
-
         dry = 5000
         fuel = 5000
         isp = 900
@@ -140,39 +274,56 @@ class TestFuelConsumption:
         assert abs(remaining_dv - (total_dv - target_dv)) < 1.0
 
     def test_fuel_needed_zero_isp_returns_more_than_available(self):
-        from catalog_service import compute_fuel_needed_for_delta_v_kg
-
         # Zero ISP means infinite fuel needed — should return fuel+1
         result = compute_fuel_needed_for_delta_v_kg(5000, 5000, 0, 1000)
         assert result > 5000
 
     def test_fuel_needed_zero_mass_returns_more_than_available(self):
-        from catalog_service import compute_fuel_needed_for_delta_v_kg
-
         result = compute_fuel_needed_for_delta_v_kg(0, 5000, 900, 1000)
         assert result > 5000
 
-    def test_fuel_consumption_monotonic(self):
+    @pytest.mark.parametrize("dv_low,dv_high", [
+        (100, 500),
+        (500, 1000),
+        (1000, 2000),
+        (2000, 5000),
+    ])
+    def test_fuel_consumption_monotonic(self, dv_low, dv_high):
         """More dv should always need more fuel."""
-        from catalog_service import compute_fuel_needed_for_delta_v_kg
+        fuel_low = compute_fuel_needed_for_delta_v_kg(5000, 5000, 900, dv_low)
+        fuel_high = compute_fuel_needed_for_delta_v_kg(5000, 5000, 900, dv_high)
+        assert fuel_high >= fuel_low
+
+
+# Grid for the rocket-equation property sweep: 10 × 10 × 8 = 800 points.
+_SWEEP_DRY_KG = [100.0 + 1100.0 * i for i in range(10)]
+_SWEEP_FUEL_KG = [50.0 + 1000.0 * i for i in range(10)]
+_SWEEP_ISP_S = [200.0 + 100.0 * i for i in range(8)]
 
-        fuels = [
-            compute_fuel_needed_for_delta_v_kg(5000, 5000, 900, dv)
-            for dv in [100, 500, 1000, 2000, 5000]
-        ]
-        for i in range(len(fuels) - 1):
-            assert fuels[i + 1] >= fuels[i], f"Fuel use not monotonic at dv step {i}"
+
+class TestRocketEquationSweep:
+    """Property checks over a dry/fuel/isp grid rather than single points."""
+
+    def test_dv_matches_closed_form(self):
+        for dry, fuel, isp in itertools.product(_SWEEP_DRY_KG, _SWEEP_FUEL_KG, _SWEEP_ISP_S):
+            expected = 9.80665 * isp * math.log1p(fuel / dry)
+            got = compute_delta_v_remaining_m_s(dry, fuel, isp)
+            assert got == pytest.approx(expected, rel=1e-9), (dry, fuel, isp)
+
+    def test_half_dv_roundtrip(self):
+        for dry, fuel, isp in itertools.product(_SWEEP_DRY_KG, _SWEEP_FUEL_KG, _SWEEP_ISP_S):
+            total_dv = compute_delta_v_remaining_m_s(dry, fuel, isp)
+            used = compute_fuel_needed_for_delta_v_kg(dry, fuel, isp, total_dv / 2)
+            assert 0.0 < used < fuel, (dry, fuel, isp)
+            remaining = compute_delta_v_remaining_m_s(dry, fuel - used, isp)
+            assert remaining == pytest.approx(total_dv / 2, rel=1e-9), (dry, fuel, isp)
 
 
 class TestWetMassAndAcceleration:
     def test_wet_mass(self):
-        from catalog_service import compute_wet_mass_kg
-
         assert compute_wet_mass_kg(5000, 3000) == pytest.approx(8000.0)
 
     def test_acceleration_gs(self):
-        from catalog_service import compute_acceleration_gs
-
         # 10 kN thrust, 10000 kg wet mass → 10000/(10000*9.81) ≈ 0.102 g
         acc = compute_acceleration_gs(5000, 5000, 10.0)
         expected = (10.0 * 1000) / (10000 * 9.80665)
@@ -184,117 +335,193 @@ class TestWetMassAndAcceleration:
 # ────────────────────────────────────────────────────────────────────
 
 
+def _swept_leg_dv(from_id, to_id, departure_time_s):
+    """Lowest base Δv over every _LEG_TOF_SWEEP_FACTORS TOF, solved directly.
+
+    Reference for compute_interplanetary_leg's TOF search: same ephemeris,
+    Lambert solver and burn model, without the golden-section refinement.
+    """
+    leg = transfer_planner._resolve_interplanetary_leg(from_id, to_id)
+    assert leg is not None
+    r1, v1_body = transfer_planner._body_state_cached(leg["from_helio"], departure_time_s)
+    r2, _ = transfer_planner._body_state_cached(leg["to_helio"], departure_time_s)
+    r_mean = (math.sqrt(sum(x * x for x in r1)) + math.sqrt(sum(x * x for x in r2))) / 2.0
+    hohmann_tof_s = math.pi * math.sqrt(r_mean ** 3 / leg["mu_sun"])
+    transfer_dv = make_transfer_dv(leg["mu_from"], leg["r_park_from"], leg["mu_to"], leg["r_park_to"])
+    best = float("inf")
+    for factor in transfer_planner._LEG_TOF_SWEEP_FACTORS:
+        tof = hohmann_tof_s * factor
+        if tof < 86400.0:
+            continue
+        r2_arr, v2_arr = transfer_planner._body_state_cached(leg["to_helio"], departure_time_s + tof)
+        for v1, v2 in transfer_planner._solve_lambert_cached(r1, r2_arr, tof, leg["mu_sun"]):
+            best = min(best, transfer_dv(v1, v1_body, v2, v2_arr)[2])
+    return best
+
+
 class TestOrbitalHelpers:
     """Test the interplanetary phase-angle and dv-time tradeoff functions."""
 
     def test_body_state_returns_3d_vector(self):
-        import celestial_config
         cfg = celestial_config.load_celestial_config()
         r, v = celestial_config.compute_body_state(cfg, "earth", 0.0)
         assert len(r) == 3
         assert len(v) == 3
-        import math
         r_mag = math.sqrt(r[0]**2 + r[1]**2 + r[2]**2)
         assert r_mag > 0
 
     def test_body_state_sun_at_origin(self):
-        import celestial_config, math
         cfg = celestial_config.load_celestial_config()
         r, v = celestial_config.compute_body_state(cfg, "sun", 0.0)
         r_mag = math.sqrt(r[0]**2 + r[1]**2 + r[2]**2)
         assert r_mag < 1.0  # Sun should be at or very near origin
 
     def test_body_state_unknown_body_raises(self):
-        import celestial_config
         cfg = celestial_config.load_celestial_config()
-        import pytest
         with pytest.raises(Exception):
             celestial_config.compute_body_state(cfg, "pluto", 0.0)
 
     def test_body_state_earth_radius_reasonable(self):
-        import celestial_config, math
         cfg = celestial_config.load_celestial_config()
         r, v = celestial_config.compute_body_state(cfg, "earth", 0.0)
         r_mag = math.sqrt(r[0]**2 + r[1]**2 + r[2]**2)
         # Earth ~149.6 million km from Sun; allow wide margin
         assert 1.3e8 < r_mag < 1.6e8
 
-    def test_is_interplanetary_same_body(self):
-        from fleet_router import _is_interplanetary
+    def test_body_states_batch_matches_single(self):
+        cfg = celestial_config.load_celestial_config()
+        times = [0.0, 1.5e6, 3.0e7]
+        batch = celestial_config.compute_body_states(cfg, "moon", times)
+        assert batch == [celestial_config.compute_body_state(cfg, "moon", t) for t in times]
+        assert celestial_config.compute_body_states(cfg, "pluto", times) == [None, None, None]
 
+    def test_is_interplanetary_same_body(self):
         assert _is_interplanetary("LEO", "HEO") is False
         assert _is_interplanetary("LEO", "GEO") is False
         assert _is_interplanetary("LLO", "HLO") is False
 
     def test_is_interplanetary_different_bodies(self):
-        from fleet_router import _is_interplanetary
-
         assert _is_interplanetary("LEO", "LMO") is True
         assert _is_interplanetary("LEO", "VEN_ORB") is True
 
     def test_is_interplanetary_same_trojan_cluster_is_local(self):
-        from fleet_router import _is_interplanetary
-
         assert _is_interplanetary("HEKTOR_LO", "AGAMEMNON_LO") is False
 
     def test_is_interplanetary_greek_to_non_greek(self):
-        from fleet_router import _is_interplanetary
-
         assert _is_interplanetary("HEKTOR_LO", "CERES_LO") is True
 
     def test_is_interplanetary_same_l5_trojan_cluster_is_local(self):
-        from fleet_router import _is_interplanetary
-
         assert _is_interplanetary("PATROCLUS_LO", "MENTOR_LO") is False
 
     def test_is_interplanetary_unknown_locations(self):
-        from fleet_router import _is_interplanetary
-
         # Unknown locations should return False (no body mapping)
         assert _is_interplanetary("NOWHERE", "LEO") is False
 
-    def test_interplanetary_leg_returns_multiplier_in_range(self):
-        import transfer_planner
-
+    @pytest.mark.parametrize("t", [0, 86400 * 100, 86400 * 365, 86400 * 730])
+    def test_interplanetary_leg_returns_multiplier_in_range(self, t):
         # At any time, multiplier should be between 1.0 and 1.4
-        for t in [0, 86400 * 100, 86400 * 365, 86400 * 730]:
-            result = transfer_planner.compute_interplanetary_leg("LEO", "LMO", t)
-            assert result is not None, f"No result at t={t}"
-            m = result["phase_multiplier"]
-            assert 1.0 <= m <= 1.401, f"Phase multiplier {m} out of range at t={t}"
+        result = transfer_planner.compute_interplanetary_leg("LEO", "LMO", t)
+        assert result is not None, f"No result at t={t}"
+        m = result["phase_multiplier"]
+        assert 1.0 <= m <= 1.401, f"Phase multiplier {m} out of range at t={t}"
+
+    def test_interplanetary_leg_memoized_within_hour_bucket(self):
+        """A second departure in the same hour is served from the Lambert cache."""
+        transfer_planner.clear_lambert_cache()
+        try:
+            first = transfer_planner.compute_interplanetary_leg("LEO", "LMO", 86400 * 100)
+            second = transfer_planner.compute_interplanetary_leg("LEO", "LMO", 86400 * 100 + 1800)
+            assert second == first
+            stats = transfer_planner.get_lambert_cache_stats()
+            assert (stats["hits"], stats["misses"]) == (1, 1)
+        finally:
+            transfer_planner.clear_lambert_cache()
+
+    @pytest.mark.parametrize("from_id, to_id", [
+        ("LEO", "LMO"), ("LMO", "MERC_ORB"), ("JUP_LO", "LEO"),
+        ("LUTETIA_LO", "MERC_ORB"), ("MERC_ORB", "JUP_LO"),
+    ])
+    @pytest.mark.parametrize("t", [0, 86400 * 365, 4.1e7, 1.23e8])
+    def test_interplanetary_leg_never_above_full_sweep(self, from_id, to_id, t):
+        """Refinement only improves on the full TOF factor sweep.
+
+        These legs have several Δv(TOF) minima, so a search that skipped
+        factors could settle in the wrong one.
+        """
+        transfer_planner.clear_lambert_cache()
+        try:
+            result = transfer_planner.compute_interplanetary_leg(from_id, to_id, t)
+        finally:
+            transfer_planner.clear_lambert_cache()
+        assert result is not None
+        assert result["base_dv_m_s"] <= _swept_leg_dv(from_id, to_id, t) * (1.0 + 1e-12)
+
+    @pytest.mark.parametrize("a, b, expected", [
+        ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), math.pi / 2),
+        ((1.0, 0.0, 0.0), (0.0, -1.0, 5.0), 3 * math.pi / 2),
+        ((0.0, 2.0, 0.0), (-3.0, 0.0, 0.0), math.pi / 2),
+        ((1.0, 1.0, 0.0), (2.0, 2.0, -1.0), 0.0),
+    ])
+    def test_angle_between_2d_counter_clockwise(self, a, b, expected):
+        assert transfer_planner._angle_between_2d(a, b) == pytest.approx(expected, abs=1e-12)
+
+    @pytest.mark.parametrize("from_id, to_id, bodies, t", [
+        ("LEO", "LMO", ("earth", "mars"), 0.0),
+        ("GANYMEDE_GILGAMESH", "ZOOZVE", ("jupiter", "zoozve"), 5.3e7),
+        ("LUTETIA_HO", "IAPETUS_TRANSITION_ZONE", ("lutetia", "saturn"), 5.3e7),
+        ("MIMAS_HO", "HYGIEA_CENTRAL", ("saturn", "hygiea"), 0.0),
+    ])
+    def test_scan_departure_windows_matches_daily_scan(self, from_id, to_id, bodies, t, monkeypatch):
+        """Coarse + refine picks the same windows as solving every day,
+        and the best window is the lowest-Δv day in the horizon."""
+        synodic = transfer_planner.get_synodic_period_s(*bodies)
+        calls = []
+        real_leg = transfer_planner._compute_interplanetary_leg_fast
+
+        def counting_leg(*args, **kwargs):
+            calls.append(args)
+            return real_leg(*args, **kwargs)
+
+        monkeypatch.setattr(transfer_planner, "_compute_interplanetary_leg_fast", counting_leg)
+        staged = transfer_planner.scan_departure_windows(from_id, to_id, t, 1.0, synodic)
+        staged_calls = len(calls)
+
+        monkeypatch.setattr(transfer_planner, "_WINDOW_SCAN_COARSE_STEPS", 10 ** 9)
+        daily = transfer_planner.scan_departure_windows(from_id, to_id, t, 1.0, synodic, max_candidates=10 ** 6)
+        assert staged == daily[:3]
+        assert staged[0]["lambert_dv_m_s"] == min(w["lambert_dv_m_s"] for w in daily)
+        assert staged_calls < (len(calls) - staged_calls) / 3
+
+    def test_scan_departure_windows_skips_local_pairs(self, monkeypatch):
+        def fail_leg(*args, **kwargs):
+            raise AssertionError("Lambert leg computed for a local pair")
+
+        monkeypatch.setattr(transfer_planner, "_compute_interplanetary_leg_fast", fail_leg)
+        for a, b in (("LEO", "GEO"), ("PATROCLUS_LO", "MENTOR_LO"), ("LEO", "NOWHERE")):
+            assert transfer_planner.scan_departure_windows(a, b, 0.0, 1.0, 86400.0 * 30) == []
 
     def test_interplanetary_leg_unknown_locations_returns_none(self):
-        import transfer_planner
-
         # Unknown location pair → None
         assert transfer_planner.compute_interplanetary_leg("LEO", "NOWHERE", 0) is None
 
     def test_excess_dv_time_reduction_zero_extra(self):
-        from fleet_router import _excess_dv_time_reduction
-
         # Zero extra dv → no reduction
         result = _excess_dv_time_reduction(86400, 1000, 0.0)
         assert result == 86400
 
     def test_excess_dv_time_reduction_positive(self):
-        from fleet_router import _excess_dv_time_reduction
-
         base_tof = 86400 * 30  # 30 days
         reduced = _excess_dv_time_reduction(base_tof, 5000, 0.5)
         assert reduced < base_tof
         assert reduced > 0
 
     def test_excess_dv_time_reduction_doubling(self):
-        from fleet_router import _excess_dv_time_reduction
-
         base_tof = 86400 * 30
         # 1x extra (doubling dv) should significantly reduce TOF
         reduced = _excess_dv_time_reduction(base_tof, 5000, 1.0)
         assert reduced < base_tof * 0.8
 
     def test_excess_dv_time_reduction_floor(self):
-        from fleet_router import _excess_dv_time_reduction
-
         # Even with extreme extra-dv, should not go below 1 hour
         reduced = _excess_dv_time_reduction(86400, 1000, 2.0)
         assert reduced >= 3600
@@ -304,8 +531,6 @@ class TestPorkchopPlot:
     """Test the porkchop plot computation."""
 
     def test_porkchop_returns_grid_for_earth_mars(self):
-        import transfer_planner
-
         result = transfer_planner.compute_porkchop(
             from_location="LEO",
             to_location="LMO",
@@ -328,8 +553,6 @@ class TestPorkchopPlot:
         assert valid_count > 0, "Porkchop grid should have valid dv entries"
 
     def test_porkchop_best_solutions_present(self):
-        import transfer_planner
-
         result = transfer_planner.compute_porkchop(
             from_location="LEO",
             to_location="LMO",
@@ -350,9 +573,43 @@ class TestPorkchopPlot:
         assert "dv_arrive_m_s" in sol
         assert sol["dv_m_s"] > 0
 
-    def test_porkchop_same_body_returns_none(self):
-        import transfer_planner
+    def test_porkchop_best_solutions_come_from_spread_grid_cells(self):
+        result = transfer_planner.compute_porkchop(
+            from_location="LEO",
+            to_location="LMO",
+            departure_start_s=0.0,
+            departure_end_s=60_000_000.0,
+            tof_min_s=60 * 86400.0,
+            tof_max_s=400 * 86400.0,
+            grid_size=12,
+        )
+        assert result is not None
+        cells = []
+        for sol in result["best_solutions"]:
+            di = result["departure_times"].index(sol["departure_time"])
+            ti = result["tof_values"].index(sol["tof_s"])
+            assert result["dv_grid"][di][ti] == sol["dv_m_s"]
+            cells.append((di, ti))
+        assert len(cells) > 1
+        for a, b in itertools.combinations(cells, 2):
+            assert max(abs(a[0] - b[0]), abs(a[1] - b[1])) > 2
+
+    def test_porkchop_arrival_states_bypass_body_state_cache(self):
+        transfer_planner._body_state_at_tick.cache_clear()
+        result = transfer_planner.compute_porkchop(
+            from_location="LEO",
+            to_location="LMO",
+            departure_start_s=0.0,
+            departure_end_s=60_000_000.0,
+            tof_min_s=60 * 86400.0,
+            tof_max_s=400 * 86400.0,
+            grid_size=10,
+        )
+        assert result is not None
+        # Only the departure column goes through the shared LRU.
+        assert transfer_planner._body_state_at_tick.cache_info().currsize <= 10
 
+    def test_porkchop_same_body_returns_none(self):
         result = transfer_planner.compute_porkchop(
             from_location="LEO",
             to_location="GEO",
@@ -365,8 +622,6 @@ class TestPorkchopPlot:
         assert result is None
 
     def test_porkchop_grid_size_clamped(self):
-        import transfer_planner
-
         result = transfer_planner.compute_porkchop(
             from_location="LEO",
             to_location="LMO",
@@ -379,6 +634,30 @@ class TestPorkchopPlot:
         assert result is not None
         assert result["grid_size"] == 5
 
+    def test_porkchop_process_pool_matches_serial(self, monkeypatch):
+        kwargs = dict(
+            from_location="LEO",
+            to_location="LMO",
+            departure_start_s=0.0,
+            departure_end_s=60_000_000.0,
+            tof_min_s=60 * 86400.0,
+            tof_max_s=400 * 86400.0,
+            grid_size=8,
+        )
+        monkeypatch.setattr(transfer_planner, "_PORKCHOP_WORKERS", 1)
+        serial = transfer_planner.compute_porkchop(**kwargs)
+
+        monkeypatch.setattr(transfer_planner, "_PORKCHOP_WORKERS", 2)
+        monkeypatch.setattr(transfer_planner, "_PORKCHOP_PARALLEL_MIN_ROWS", 1)
+        monkeypatch.setattr(transfer_planner, "_porkchop_pool", None)
+        try:
+            pooled = transfer_planner.compute_porkchop(**kwargs)
+            assert transfer_planner._porkchop_pool is not None
+        finally:
+            transfer_planner.shutdown_porkchop_pool()
+        assert transfer_planner._porkchop_pool is None
+        assert pooled == serial
+
 
 # ────────────────────────────────────────────────────────────────────
 # Dijkstra route matrix tests (in-memory DB)
@@ -389,20 +668,16 @@ class TestDijkstraRouteMatrix:
     """Test the route-finding algorithm on a controlled graph."""
 
     def _build_small_network(self, conn):
-        """Insert a minimal 3-node network: A → B → C."""
-        conn.execute("DELETE FROM locations WHERE is_group = 0")
-        conn.execute("DELETE FROM transfer_edges")
-        conn.execute("DELETE FROM transfer_matrix")
+        """Insert a minimal 3-node network: A → B → C.
 
+        Everything, including the matrix rebuild, runs in one transaction.
+        dijkstra_all_pairs clears transfer_matrix itself.
+        """
         locs = [
             ("A", "Alpha", None, 0, 10, 0, 0),
             ("B", "Bravo", None, 0, 20, 100, 0),
             ("C", "Charlie", None, 0, 30, 200, 0),
         ]
-        conn.executemany(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES (?,?,?,?,?,?,?)",
-            locs,
-        )
         edges = [
             ("A", "B", 500, 7200),
             ("B", "A", 500, 7200),
@@ -411,126 +686,146 @@ class TestDijkstraRouteMatrix:
             ("A", "C", 2000, 36000),  # Direct but expensive
             ("C", "A", 2000, 36000),
         ]
-        conn.executemany(
-            "INSERT INTO transfer_edges (from_id,to_id,dv_m_s,tof_s) VALUES (?,?,?,?)",
-            edges,
-        )
-        from main import dijkstra_all_pairs
+        with conn:
+            conn.execute("DELETE FROM locations WHERE is_group = 0")
+            conn.execute("DELETE FROM transfer_edges")
+            conn.executemany(
+                "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES (?,?,?,?,?,?,?)",
+                locs,
+            )
+            conn.executemany(
+                "INSERT INTO transfer_edges (from_id,to_id,dv_m_s,tof_s) VALUES (?,?,?,?)",
+                edges,
+            )
+            dijkstra_all_pairs(conn)
 
-        dijkstra_all_pairs(conn)
-        conn.commit()
+    @pytest.fixture()
+    def matrix_rows(self, db_conn):
+        """The small network's transfer_matrix, keyed by (from_id, to_id)."""
+        self._build_small_network(db_conn)
+        rows = db_conn.execute(
+            "SELECT from_id, to_id, dv_m_s, tof_s, path_json FROM transfer_matrix"
+        ).fetchall()
+        return {(r["from_id"], r["to_id"]): r for r in rows}
 
-    def test_self_transfer_zero(self, db_conn):
+    def test_self_transfer_zero(self, matrix_rows):
         """A→A should be 0 dv and 0 tof."""
-        self._build_small_network(db_conn)
-        row = db_conn.execute(
-            "SELECT dv_m_s, tof_s FROM transfer_matrix WHERE from_id='A' AND to_id='A'"
-        ).fetchone()
-        assert row is not None
+        row = matrix_rows[("A", "A")]
         assert float(row["dv_m_s"]) == 0.0
         assert float(row["tof_s"]) == 0.0
 
-    def test_direct_edge_used(self, db_conn):
+    def test_direct_edge_used(self, matrix_rows):
         """A→B should use the direct 500 m/s edge."""
-        self._build_small_network(db_conn)
-        row = db_conn.execute(
-            "SELECT dv_m_s, tof_s, path_json FROM transfer_matrix WHERE from_id='A' AND to_id='B'"
-        ).fetchone()
+        row = matrix_rows[("A", "B")]
         assert float(row["dv_m_s"]) == 500.0
         assert float(row["tof_s"]) == 7200.0
 
-    def test_optimal_route_chosen(self, db_conn):
+    def test_optimal_route_chosen(self, matrix_rows):
         """A→C should prefer A→B→C (1300 m/s) over direct (2000 m/s)."""
-        self._build_small_network(db_conn)
-        row = db_conn.execute(
-            "SELECT dv_m_s, tof_s, path_json FROM transfer_matrix WHERE from_id='A' AND to_id='C'"
-        ).fetchone()
+        row = matrix_rows[("A", "C")]
         assert float(row["dv_m_s"]) == 1300.0  # 500 + 800
         assert float(row["tof_s"]) == 21600.0  # 7200 + 14400
         path = json.loads(row["path_json"])
         assert path == ["A", "B", "C"]
 
-    def test_all_pairs_populated(self, db_conn):
+    def test_all_pairs_populated(self, matrix_rows):
         """All 9 pairs (3×3) should exist in the matrix."""
-        self._build_small_network(db_conn)
-        count = db_conn.execute("SELECT COUNT(*) AS c FROM transfer_matrix").fetchone()["c"]
-        assert count == 9
+        assert len(matrix_rows) == 9
 
-    def test_symmetry_check(self, db_conn):
+    def test_symmetry_check(self, matrix_rows):
         """A→B dv should equal B→A dv when edges are symmetric."""
-        self._build_small_network(db_conn)
-        ab = db_conn.execute(
-            "SELECT dv_m_s FROM transfer_matrix WHERE from_id='A' AND to_id='B'"
-        ).fetchone()
-        ba = db_conn.execute(
-            "SELECT dv_m_s FROM transfer_matrix WHERE from_id='B' AND to_id='A'"
-        ).fetchone()
-        assert float(ab["dv_m_s"]) == float(ba["dv_m_s"])
+        assert float(matrix_rows[("A", "B")]["dv_m_s"]) == float(matrix_rows[("B", "A")]["dv_m_s"])
+
+    def test_matches_floyd_warshall_on_random_graph(self, db_conn):
+        """Cross-check the whole matrix against an independent all-pairs oracle."""
+        rng = random.Random(20260417)
+        n = 40
+        ids = [f"N{i:02d}" for i in range(n)]
+        edges = {}
+        for i in range(n):
+            # Ring keeps the graph connected; random chords give shortcuts.
+            edges[(ids[i], ids[(i + 1) % n])] = float(rng.randint(100, 2000))
+            for _ in range(3):
+                j = rng.randrange(n)
+                if j != i:
+                    edges[(ids[i], ids[j])] = float(rng.randint(100, 5000))
+
+        with db_conn:
+            db_conn.execute("DELETE FROM locations WHERE is_group = 0")
+            db_conn.execute("DELETE FROM transfer_edges")
+            db_conn.executemany(
+                "INSERT INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES (?,?,NULL,0,?,0,0)",
+                [(nid, nid, k) for k, nid in enumerate(ids)],
+            )
+            db_conn.executemany(
+                "INSERT INTO transfer_edges (from_id,to_id,dv_m_s,tof_s) VALUES (?,?,?,3600)",
+                [(a, b, dv) for (a, b), dv in edges.items()],
+            )
+            dijkstra_all_pairs(db_conn)
+
+        inf = float("inf")
+        dist = {(a, b): 0.0 if a == b else inf for a in ids for b in ids}
+        for key, dv in edges.items():
+            dist[key] = min(dist[key], dv)
+        for k in ids:
+            for a in ids:
+                d_ak = dist[(a, k)]
+                if d_ak == inf:
+                    continue
+                for b in ids:
+                    alt = d_ak + dist[(k, b)]
+                    if alt < dist[(a, b)]:
+                        dist[(a, b)] = alt
+
+        got = {
+            (r["from_id"], r["to_id"]): float(r["dv_m_s"])
+            for r in db_conn.execute("SELECT from_id, to_id, dv_m_s FROM transfer_matrix")
+        }
+        assert len(got) == n * n
+        for key, expected in dist.items():
+            assert got[key] == pytest.approx(expected), f"{key[0]} → {key[1]}"
 
 
 class TestRealTransferMatrix:
     """Tests on the production transfer matrix seeded by app startup."""
 
-    def test_leo_to_heo_exists(self, client):
-        r = client.get("/api/transfer_quote", params={"from_id": "LEO", "to_id": "HEO"})
-        assert r.status_code == 200
-        data = r.json()
+    def test_leo_to_heo_exists(self, transfer_quote):
+        data = transfer_quote("LEO", "HEO")
         assert data["dv_m_s"] > 0
         assert data["tof_s"] > 0
 
-    def test_leo_to_llo_exists(self, client):
-        r = client.get("/api/transfer_quote", params={"from_id": "LEO", "to_id": "LLO"})
-        assert r.status_code == 200
-        data = r.json()
+    def test_leo_to_llo_exists(self, transfer_quote):
+        data = transfer_quote("LEO", "LLO")
         assert data["dv_m_s"] > 0
         assert data["tof_s"] > 0
 
-    def test_quote_has_route_mode(self, client):
-        r = client.get("/api/transfer_quote", params={"from_id": "LEO", "to_id": "LLO"})
-        data = r.json()
+    def test_quote_has_route_mode(self, transfer_quote):
+        data = transfer_quote("LEO", "LLO")
         assert "route_mode" in data
         assert isinstance(data["route_mode"], str)
         assert data["route_mode"] in ("direct", "direct-local", "direct-lambert", "direct-gateway", "local-multihop")
 
-    def test_self_quote_is_zero(self, client):
-        r = client.get("/api/transfer_quote", params={"from_id": "LEO", "to_id": "LEO"})
-        assert r.status_code == 200
-        data = r.json()
+    def test_self_quote_is_zero(self, transfer_quote):
+        data = transfer_quote("LEO", "LEO")
         assert data["dv_m_s"] == 0.0
         assert data["tof_s"] == 0.0
 
     def test_nonexistent_location_404(self, client):
-        r = client.get("/api/transfer_quote", params={"from_id": "LEO", "to_id": "NONEXISTENT_LOC"})
-        assert r.status_code == 404
+        _assert_status(client, "GET", "/api/transfer_quote", 404,
+                       params={"from_id": "LEO", "to_id": "NONEXISTENT_LOC"})
 
     def test_missing_params_422(self, client):
-        r = client.get("/api/transfer_quote")
-        assert r.status_code == 422
+        _assert_status(client, "GET", "/api/transfer_quote", 422)
 
-    def test_all_location_pairs_reachable(self, client):
+    def test_all_location_pairs_reachable(self, transfer_quote, leaf_location_ids):
         """Every non-group location should be reachable from LEO."""
-        r = client.get("/api/locations")
-        assert r.status_code == 200
-        locations = r.json()
-        # Flatten to get leaf location IDs
-        leaf_ids = []
-        if isinstance(locations, list):
-            for loc in locations:
-                if isinstance(loc, dict) and not loc.get("is_group"):
-                    leaf_ids.append(loc["id"])
-        elif isinstance(locations, dict) and "locations" in locations:
-            for loc in locations["locations"]:
-                if isinstance(loc, dict) and not loc.get("is_group"):
-                    leaf_ids.append(loc["id"])
-
-        if not leaf_ids:
+        if not leaf_location_ids:
             pytest.skip("No leaf locations found")
 
         # Check at least some core locations are reachable from LEO
-        core_locs = [lid for lid in leaf_ids if lid in ("LEO", "HEO", "GEO", "L1", "L2", "LLO", "HLO")]
+        core_locs = [lid for lid in leaf_location_ids if lid in ("LEO", "HEO", "GEO", "L1", "L2", "LLO", "HLO")]
         for dest in core_locs:
-            r = client.get("/api/transfer_quote", params={"from_id": "LEO", "to_id": dest})
-            assert r.status_code == 200, f"LEO → {dest} failed with {r.status_code}"
+            transfer_quote("LEO", dest)  # asserts a 200 response
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -539,13 +834,33 @@ class TestRealTransferMatrix:
 
 
 class TestAdvancedTransferQuote:
-    def test_basic_advanced_quote(self, client):
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "HEO",
-        })
-        assert r.status_code == 200
-        data = r.json()
+    # (from_id, to_id, extra_dv_fraction) for every success-path quote below.
+    _CASES = [
+        ("LEO", "HEO", 0.0),
+        ("LEO", "HEO", 2.0),
+        ("LEO", "LLO", 0.0),
+        ("LEO", "LLO", 1.0),
+        ("LEO", "LMO", 0.0),
+        ("LEO", "CERES_LO", 0.0),
+        ("HEKTOR_LO", "AGAMEMNON_LO", 0.0),
+        ("PATROCLUS_LO", "MENTOR_LO", 0.0),
+    ]
+
+    @pytest.fixture(scope="class")
+    def adv_quotes(self, client):
+        """All success-path quotes, fetched once per class."""
+        quotes = {}
+        for case in self._CASES:
+            from_id, to_id, extra = case
+            r = client.get("/api/transfer_quote_advanced", params={
+                "from_id": from_id, "to_id": to_id, "extra_dv_fraction": extra,
+            })
+            assert r.status_code == 200, f"{case}: {r.status_code} {r.text}"
+            quotes[case] = r.json()
+        return quotes
+
+    def test_basic_advanced_quote(self, adv_quotes):
+        data = adv_quotes[("LEO", "HEO", 0.0)]
         assert "base_dv_m_s" in data
         assert "base_tof_s" in data
         assert "dv_m_s" in data
@@ -553,61 +868,36 @@ class TestAdvancedTransferQuote:
         assert "phase_multiplier" in data
         assert "is_interplanetary" in data
 
-    def test_intra_system_no_phase_angle(self, client):
+    def test_intra_system_no_phase_angle(self, adv_quotes):
         """LEO→HEO is within Earth system, so phase_multiplier should be 1.0."""
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "HEO",
-        })
-        data = r.json()
+        data = adv_quotes[("LEO", "HEO", 0.0)]
         assert data["is_interplanetary"] is False
         assert data["phase_multiplier"] == 1.0
         assert data["dv_m_s"] == data["base_dv_m_s"]
 
-    def test_extra_dv_reduces_tof(self, client):
+    def test_extra_dv_reduces_tof(self, adv_quotes):
         """Supplying extra_dv_fraction > 0 should reduce TOF."""
-        r_base = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "LLO",
-            "extra_dv_fraction": 0.0,
-        })
-        r_fast = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "LLO",
-            "extra_dv_fraction": 1.0,
-        })
-        base = r_base.json()
-        fast = r_fast.json()
+        base = adv_quotes[("LEO", "LLO", 0.0)]
+        fast = adv_quotes[("LEO", "LLO", 1.0)]
         assert fast["tof_s"] < base["tof_s"]
         assert fast["dv_m_s"] > base["dv_m_s"]
 
-    def test_extra_dv_fraction_zero_matches_base(self, client):
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "HEO",
-            "extra_dv_fraction": 0.0,
-        })
-        data = r.json()
+    def test_extra_dv_fraction_zero_matches_base(self, adv_quotes):
+        data = adv_quotes[("LEO", "HEO", 0.0)]
         # With no extra dv and no interplanetary effects, final dv == base dv
         assert data["dv_m_s"] == data["base_dv_m_s"]
 
-    def test_extra_dv_boundary(self, client):
-        """extra_dv_fraction capped at 2.0."""
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "HEO",
-            "extra_dv_fraction": 2.0,
-        })
-        assert r.status_code == 200
+    def test_extra_dv_boundary(self, adv_quotes):
+        """extra_dv_fraction capped at 2.0 (still accepted)."""
+        assert ("LEO", "HEO", 2.0) in adv_quotes
 
     def test_extra_dv_over_limit(self, client):
         """extra_dv_fraction > 2.0 should be rejected."""
-        r = client.get("/api/transfer_quote_advanced", params={
+        _assert_status(client, "GET", "/api/transfer_quote_advanced", 422, params={
             "from_id": "LEO",
             "to_id": "HEO",
             "extra_dv_fraction": 3.0,
         })
-        assert r.status_code == 422
 
     def test_departure_time_parameter(self, client):
         """Custom departure time should be echoed back."""
@@ -621,19 +911,13 @@ class TestAdvancedTransferQuote:
         assert data["departure_time"] == dep
 
     def test_nonexistent_location_404(self, client):
-        r = client.get("/api/transfer_quote_advanced", params={
+        _assert_status(client, "GET", "/api/transfer_quote_advanced", 404, params={
             "from_id": "LEO",
             "to_id": "NOTAPLACE",
         })
-        assert r.status_code == 404
 
-    def test_interplanetary_quote_has_window_suggestions(self, client):
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "LMO",
-        })
-        assert r.status_code == 200
-        data = r.json()
+    def test_interplanetary_quote_has_window_suggestions(self, adv_quotes):
+        data = adv_quotes[("LEO", "LMO", 0.0)]
         if not data.get("is_interplanetary"):
             pytest.skip("Route resolved as non-interplanetary in this seed")
 
@@ -646,36 +930,21 @@ class TestAdvancedTransferQuote:
             assert "wait_s" in first
             assert "phase_multiplier" in first
 
-    def test_asteroid_belt_body_is_tracked_interplanetary(self, client):
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "LEO",
-            "to_id": "CERES_LO",
-        })
-        assert r.status_code == 200
-        data = r.json()
+    def test_asteroid_belt_body_is_tracked_interplanetary(self, adv_quotes):
+        data = adv_quotes[("LEO", "CERES_LO", 0.0)]
         assert data.get("is_interplanetary") is True
         orbital = data.get("orbital") or {}
         assert orbital.get("to_body") == "ceres"
 
-    def test_greek_cluster_quote_uses_fast_local_route(self, client):
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "HEKTOR_LO",
-            "to_id": "AGAMEMNON_LO",
-        })
-        assert r.status_code == 200
-        data = r.json()
+    def test_greek_cluster_quote_uses_fast_local_route(self, adv_quotes):
+        data = adv_quotes[("HEKTOR_LO", "AGAMEMNON_LO", 0.0)]
         assert data.get("is_interplanetary") is False
         assert data.get("route_mode") in {"direct-local", "local-multihop"}
         # Expect a short local hop via SJ_L4, not a long Lambert leg.
         assert float(data.get("tof_s") or 0.0) <= 4.0 * 86400.0
 
-    def test_l5_cluster_quote_uses_fast_local_route(self, client):
-        r = client.get("/api/transfer_quote_advanced", params={
-            "from_id": "PATROCLUS_LO",
-            "to_id": "MENTOR_LO",
-        })
-        assert r.status_code == 200
-        data = r.json()
+    def test_l5_cluster_quote_uses_fast_local_route(self, adv_quotes):
+        data = adv_quotes[("PATROCLUS_LO", "MENTOR_LO", 0.0)]
         assert data.get("is_interplanetary") is False
         assert data.get("route_mode") in {"direct-local", "local-multihop"}
         # Expect a short local hop via SJ_L5, not a long Lambert leg.
@@ -690,61 +959,25 @@ class TestAdvancedTransferQuote:
 class TestShipTransferLifecycle:
     """Full lifecycle: spawn → transfer → verify transit → settle → verify arrival → cleanup."""
 
-    def _spawn_ship(self, client, ship_id="xfer_test_ship", location="LEO", fuel_kg=None):
-        """Helper to spawn a ship at a location with default parts."""
-        payload = {
-            "name": f"Transfer Test {ship_id}",
-            "location_id": location,
-            "ship_id": ship_id,
-            "parts": [
-                {"item_id": "scn_1_pioneer"},
-            ],
-        }
-        if fuel_kg is not None:
-            payload["fuel_kg"] = fuel_kg
-        r = client.post("/api/admin/spawn_ship", json=payload)
-        assert r.status_code == 200, f"Failed to spawn ship: {r.text}"
-        return r.json()
-
-    def _delete_ship(self, client, ship_id):
-        r = client.delete(f"/api/admin/ships/{ship_id}")
-        # Tolerate already-deleted
-        return r.status_code in (200, 404)
-
     def _refuel_ship(self, client, ship_id):
         r = client.post(f"/api/admin/ships/{ship_id}/refuel")
         assert r.status_code == 200
         return r.json()
 
-    def _get_ship(self, client, ship_id):
-        """Get ship data from /api/state."""
-        r = client.get("/api/state")
-        assert r.status_code == 200
-        for ship in r.json()["ships"]:
-            if ship["id"] == ship_id:
-                return ship
-        return None
-
     def test_spawn_and_verify_docked(self, client):
         """Spawned ship should be docked at the specified location."""
-        try:
-            result = self._spawn_ship(client, "test_spawn_verify")
-            ship = result["ship"]
+        with managed_ship(client, "test_spawn_verify") as ship:
             assert ship["location_id"] == "LEO"
             assert ship["status"] == "docked"
             assert ship["fuel_kg"] > 0, f"Expected fuel > 0, got {ship['fuel_kg']}"
             assert ship["dry_mass_kg"] > 0, f"Expected dry_mass > 0, got {ship['dry_mass_kg']}"
             assert ship["isp_s"] > 0, f"Expected isp > 0, got {ship['isp_s']}"
             assert ship["delta_v_remaining_m_s"] > 0, f"Expected dv > 0, got {ship['delta_v_remaining_m_s']}"
-        finally:
-            self._delete_ship(client, "test_spawn_verify")
 
     def test_basic_transfer(self, client):
         """Ships should transit from LEO → HEO successfully."""
-        ship_id = "test_basic_xfer"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_basic_xfer") as ship:
+            ship_id = ship["id"]
 
             # Initiate transfer
             r = client.post(f"/api/ships/{ship_id}/transfer", json={
@@ -762,37 +995,29 @@ class TestShipTransferLifecycle:
             assert data["arrives_at"] > data["departed_at"]
             assert isinstance(data.get("is_interplanetary"), bool)
             assert isinstance(data.get("route_mode"), str)
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_transfer_sets_transit_state(self, client):
         """After transfer, ship should show as 'transit' with correct from/to."""
-        ship_id = "test_transit_state"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_transit_state") as ship:
+            ship_id = ship["id"]
 
             client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "HEO"})
 
-            ship = self._get_ship(client, ship_id)
+            ship = _get_ship(client, ship_id)
             assert ship is not None
             assert ship["status"] == "transit"
             assert ship["location_id"] is None
             assert ship["from_location_id"] == "LEO"
             assert ship["to_location_id"] == "HEO"
             assert ship["arrives_at"] is not None
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_transfer_consumes_fuel(self, client):
         """Fuel should decrease after transfer."""
-        ship_id = "test_fuel_use"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_fuel_use") as ship:
+            ship_id = ship["id"]
 
             # Get fuel before
-            ship_before = self._get_ship(client, ship_id)
+            ship_before = _get_ship(client, ship_id)
             fuel_before = ship_before["fuel_kg"]
 
             r = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "HEO"})
@@ -801,15 +1026,11 @@ class TestShipTransferLifecycle:
             assert data["fuel_used_kg"] > 0
             assert data["fuel_remaining_kg"] < fuel_before
             assert abs(data["fuel_remaining_kg"] - (fuel_before - data["fuel_used_kg"])) < 1.0
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_in_transit_ship_cannot_transfer(self, client):
         """A ship already in transit should be rejected for a second transfer."""
-        ship_id = "test_double_xfer"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_double_xfer") as ship:
+            ship_id = ship["id"]
 
             r1 = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "HEO"})
             assert r1.status_code == 200
@@ -818,46 +1039,47 @@ class TestShipTransferLifecycle:
             r2 = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "GEO"})
             assert r2.status_code == 400
             assert "transit" in r2.json()["detail"].lower()
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_insufficient_fuel_rejected(self, client):
         """Ship with almost no fuel should be blocked from long transfers."""
-        ship_id = "test_no_fuel"
-        try:
-            self._spawn_ship(client, ship_id, fuel_kg=0.1)
+        with managed_ship(client, "test_no_fuel", fuel_kg=0.1) as ship:
+            ship_id = ship["id"]
 
             # LEO → LLO requires significant dv
             r = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "LLO"})
             assert r.status_code == 400
             detail = r.json()["detail"].lower()
             assert "fuel" in detail or "insufficient" in detail, f"Unexpected detail: {detail}"
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_nonexistent_ship_404(self, client):
-        r = client.post("/api/ships/ghost_ship_xyz/transfer", json={"to_location_id": "HEO"})
-        assert r.status_code == 404
+        _assert_status(client, "POST", "/api/ships/ghost_ship_xyz/transfer", 404,
+                       json={"to_location_id": "HEO"})
+
+    def test_single_ship_matches_state(self, client):
+        """/api/ships/{id} should report the same ship as /api/state."""
+        with managed_ship(client, "test_single_ship") as ship:
+            ship_id = ship["id"]
+            r = client.get("/api/state")
+            assert r.status_code == 200
+            from_state = next(s for s in r.json()["ships"] if s["id"] == ship_id)
+            assert _get_ship(client, ship_id) == from_state
+
+    def test_single_ship_404(self, client):
+        _assert_status(client, "GET", "/api/ships/ghost_ship_xyz", 404)
 
     def test_nonexistent_destination(self, client):
-        ship_id = "test_bad_dest"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_bad_dest") as ship:
+            ship_id = ship["id"]
 
             r = client.post(f"/api/ships/{ship_id}/transfer", json={
                 "to_location_id": "MOON_BASE_ALPHA_NONEXISTENT"
             })
             assert r.status_code == 404
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_transfer_to_same_location(self, client):
         """Transfer to current location should succeed with 0 fuel use."""
-        ship_id = "test_self_xfer"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_self_xfer") as ship:
+            ship_id = ship["id"]
 
             r = client.post(f"/api/ships/{ship_id}/transfer", json={
                 "to_location_id": "LEO"
@@ -867,15 +1089,11 @@ class TestShipTransferLifecycle:
             data = r.json()
             assert data["dv_m_s"] == 0.0
             assert data["fuel_used_kg"] == 0.0
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_multiple_sequential_transfers(self, client):
         """Ship should be able to do LEO→HEO, arrive, then HEO→GEO."""
-        ship_id = "test_sequential_xfer"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_sequential_xfer") as ship:
+            ship_id = ship["id"]
 
             # First transfer: LEO → HEO
             r1 = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "HEO"})
@@ -894,21 +1112,14 @@ class TestShipTransferLifecycle:
             data2 = r2.json()
             assert data2["from"] == "HEO"
             assert data2["to"] == "GEO"
-        finally:
-            self._delete_ship(client, ship_id)
 
-    def test_long_range_transfer_leo_to_geo(self, client):
+    def test_long_range_transfer_leo_to_geo(self, client, transfer_quote):
         """Multi-hop LEO → GEO should work and consume appropriate fuel."""
-        ship_id = "test_long_range"
-        try:
-            self._spawn_ship(client, ship_id)
-            self._refuel_ship(client, ship_id)
+        with managed_ship(client, "test_long_range") as ship:
+            ship_id = ship["id"]
 
             # Get quote first
-            quote = client.get("/api/transfer_quote", params={
-                "from_id": "LEO",
-                "to_id": "GEO",
-            }).json()
+            quote = transfer_quote("LEO", "GEO")
 
             # Initiate transfer
             r = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "GEO"})
@@ -917,20 +1128,15 @@ class TestShipTransferLifecycle:
             # Should match the dv from the quote
             assert abs(data["dv_m_s"] - quote["dv_m_s"]) < 1.0
             assert data["fuel_used_kg"] > 0
-        finally:
-            self._delete_ship(client, ship_id)
 
     def test_long_range_transfer_needs_more_dv(self, client):
         """LEO → LLO requires high dv — a ship with minimal fuel should be rejected."""
-        ship_id = "test_long_range_reject"
-        try:
-            # Spawn with very little fuel so delta-v is insufficient for LLO
-            self._spawn_ship(client, ship_id, fuel_kg=100)
+        # Spawn with very little fuel so delta-v is insufficient for LLO
+        with managed_ship(client, "test_long_range_reject", fuel_kg=100) as ship:
+            ship_id = ship["id"]
 
             r = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "LLO"})
             assert r.status_code == 400, "Should be rejected for insufficient fuel"
-        finally:
-            self._delete_ship(client, ship_id)
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -941,123 +1147,70 @@ class TestShipTransferLifecycle:
 class TestSettleArrivals:
     """Test the settle_arrivals() function that finalizes ship transit."""
 
-    def test_ship_arrives_when_time_passes(self, db_conn):
-        """A ship with arrives_at in the past should be moved to destination."""
-        from main import settle_arrivals
-
-        # Insert a minimal location
-        db_conn.execute(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES ('X','X',NULL,0,0,0,0)"
+    _INSERT_SHIP = """INSERT INTO ships (id,name,location_id,from_location_id,to_location_id,
+        departed_at,arrives_at,parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s)
+       VALUES (?,?,?,?,?,?,?,'[]',100,200,500,900)"""
+    # Only the transit columns settle_arrivals touches; ships rows are wide.
+    _SELECT_TRANSIT = "SELECT location_id, from_location_id, to_location_id, arrives_at FROM ships WHERE id=?"
+
+    @pytest.fixture()
+    def now(self):
+        """Fixed settle time; settle_arrivals takes ``now`` explicitly."""
+        return 1_700_000_000.0
+
+    @pytest.fixture()
+    def settle_db(self, db_conn):
+        """db_conn with the X/Y/D locations the settle cases use."""
+        db_conn.executemany(
+            "INSERT INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES (?,?,NULL,0,0,0,0)"
+            " ON CONFLICT(id) DO NOTHING",
+            [("X", "X"), ("Y", "Y"), ("D", "D")],
         )
-        db_conn.execute(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES ('Y','Y',NULL,0,0,0,0)"
-        )
-
-        now = time.time()
-        db_conn.execute(
-            """INSERT INTO ships (id,name,location_id,from_location_id,to_location_id,
-                departed_at,arrives_at,parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s)
-               VALUES ('s1','Ship1',NULL,'X','Y',?,?,'[]',100,200,500,900)""",
-            (now - 1000, now - 100),
-        )
-        db_conn.commit()
-
-        settle_arrivals(db_conn, now)
         db_conn.commit()
-
-        row = db_conn.execute("SELECT * FROM ships WHERE id='s1'").fetchone()
-        assert row["location_id"] == "Y"
-        assert row["from_location_id"] is None
-        assert row["to_location_id"] is None
-        assert row["arrives_at"] is None
-
-    def test_ship_not_arrived_yet(self, db_conn):
-        """A ship with arrives_at in the future should remain in transit."""
-        from main import settle_arrivals
-
-        db_conn.execute(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES ('X','X',NULL,0,0,0,0)"
-        )
-        db_conn.execute(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES ('Y','Y',NULL,0,0,0,0)"
-        )
-
-        now = time.time()
-        future = now + 99999
-        db_conn.execute(
-            """INSERT INTO ships (id,name,location_id,from_location_id,to_location_id,
-                departed_at,arrives_at,parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s)
-               VALUES ('s2','Ship2',NULL,'X','Y',?,?,'[]',100,200,500,900)""",
-            (now, future),
+        return db_conn
+
+    # ship: (location_id, from, to, departed offset, arrives offset)
+    # expected: (location_id, from, to, arrives offset); offsets are seconds from now.
+    @pytest.mark.parametrize("ship,expected", [
+        pytest.param((None, "X", "Y", -1000, -100), ("Y", None, None, None), id="arrived"),
+        pytest.param((None, "X", "Y", 0, 99999), (None, "X", "Y", 99999), id="not-arrived-yet"),
+        pytest.param(("D", None, None, None, None), ("D", None, None, None), id="docked-unaffected"),
+    ])
+    def test_settle_single_ship(self, settle_db, now, ship, expected):
+        def at(offset):
+            return None if offset is None else now + offset
+
+        location_id, from_id, to_id, departed_off, arrives_off = ship
+        settle_db.execute(
+            self._INSERT_SHIP,
+            ("s1", "Ship1", location_id, from_id, to_id, at(departed_off), at(arrives_off)),
         )
-        db_conn.commit()
+        settle_db.commit()
 
-        settle_arrivals(db_conn, now)
-        db_conn.commit()
+        settle_arrivals(settle_db, now)
 
-        row = db_conn.execute("SELECT * FROM ships WHERE id='s2'").fetchone()
-        assert row["location_id"] is None  # Still in transit
-        assert row["to_location_id"] == "Y"
-        assert row["arrives_at"] == future
+        row = settle_db.execute(self._SELECT_TRANSIT, ("s1",)).fetchone()
+        exp_location, exp_from, exp_to, exp_arrives_off = expected
+        assert tuple(row) == (exp_location, exp_from, exp_to, at(exp_arrives_off))
 
-    def test_settle_only_affects_arrived_ships(self, db_conn):
+    def test_settle_only_affects_arrived_ships(self, settle_db, now):
         """Settling should only affect ships whose arrives_at <= now."""
-        from main import settle_arrivals
-
-        db_conn.execute(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES ('P','P',NULL,0,0,0,0)"
-        )
-        db_conn.execute(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES ('Q','Q',NULL,0,0,0,0)"
-        )
-
-        now = time.time()
-        # Ship A: already arrived
-        db_conn.execute(
-            """INSERT INTO ships (id,name,location_id,from_location_id,to_location_id,
-                departed_at,arrives_at,parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s)
-               VALUES ('sa','A',NULL,'P','Q',?,?,'[]',100,200,500,900)""",
-            (now - 200, now - 10),
-        )
-        # Ship B: still in transit
-        db_conn.execute(
-            """INSERT INTO ships (id,name,location_id,from_location_id,to_location_id,
-                departed_at,arrives_at,parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s)
-               VALUES ('sb','B',NULL,'P','Q',?,?,'[]',100,200,500,900)""",
-            (now - 100, now + 500),
-        )
-        db_conn.commit()
-
-        settle_arrivals(db_conn, now)
-        db_conn.commit()
-
-        a = db_conn.execute("SELECT location_id, arrives_at FROM ships WHERE id='sa'").fetchone()
-        b = db_conn.execute("SELECT location_id, arrives_at FROM ships WHERE id='sb'").fetchone()
-        assert a["location_id"] == "Q"
+        settle_db.executemany(self._INSERT_SHIP, [
+            # Ship A: already arrived
+            ("sa", "A", None, "X", "Y", now - 200, now - 10),
+            # Ship B: still in transit
+            ("sb", "B", None, "X", "Y", now - 100, now + 500),
+        ])
+        settle_arrivals(settle_db, now)
+        settle_db.commit()
+
+        a = settle_db.execute(self._SELECT_TRANSIT, ("sa",)).fetchone()
+        b = settle_db.execute(self._SELECT_TRANSIT, ("sb",)).fetchone()
+        assert a["location_id"] == "Y"
         assert a["arrives_at"] is None
         assert b["location_id"] is None
         assert b["arrives_at"] is not None
 
-    def test_docked_ship_unaffected(self, db_conn):
-        """A docked ship (arrives_at IS NULL) should not change."""
-        from main import settle_arrivals
-
-        db_conn.execute(
-            "INSERT OR REPLACE INTO locations (id,name,parent_id,is_group,sort_order,x,y) VALUES ('D','D',NULL,0,0,0,0)"
-        )
-        db_conn.execute(
-            """INSERT INTO ships (id,name,location_id,from_location_id,to_location_id,
-                departed_at,arrives_at,parts_json,fuel_kg,fuel_capacity_kg,dry_mass_kg,isp_s)
-               VALUES ('sd','Docked','D',NULL,NULL,NULL,NULL,'[]',100,200,500,900)"""
-        )
-        db_conn.commit()
-
-        settle_arrivals(db_conn, time.time())
-        db_conn.commit()
-
-        row = db_conn.execute("SELECT location_id FROM ships WHERE id='sd'").fetchone()
-        assert row["location_id"] == "D"
-
 
 # ────────────────────────────────────────────────────────────────────
 # Admin ship management helpers
@@ -1065,20 +1218,9 @@ class TestSettleArrivals:
 
 
 class TestAdminShipOps:
-    def test_teleport(self, client):
+    def test_teleport(self, client, ship_pool):
         """Admin teleport should instantly move a ship."""
-        ship_id = "test_teleport"
-        try:
-            r = client.post("/api/admin/spawn_ship", json={
-                "name": "Teleport Test",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-            })
-            assert r.status_code == 200
-
+        with ship_pool.acquire() as ship_id:
             # Teleport to HEO
             r = client.post(f"/api/admin/ships/{ship_id}/teleport", json={
                 "to_location_id": "HEO",
@@ -1086,32 +1228,15 @@ class TestAdminShipOps:
             assert r.status_code == 200
             data = r.json()
             assert data["ship"]["location_id"] == "HEO"
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
 
-    def test_teleport_cancels_transit(self, client):
+    def test_teleport_cancels_transit(self, client, ship_pool):
         """Teleporting a ship in transit should cancel the transit."""
-        ship_id = "test_teleport_cancel"
-        try:
-            client.post("/api/admin/spawn_ship", json={
-                "name": "Teleport Cancel",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-            })
-            client.post(f"/api/admin/ships/{ship_id}/refuel")
-
+        with ship_pool.acquire() as ship_id:
             # Put in transit
             client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": "HEO"})
 
             # Verify in transit
-            ship = None
-            for s in client.get("/api/state").json()["ships"]:
-                if s["id"] == ship_id:
-                    ship = s
-                    break
+            ship = _get_ship(client, ship_id)
             assert ship is not None
             assert ship["status"] == "transit"
 
@@ -1122,85 +1247,58 @@ class TestAdminShipOps:
             assert r.status_code == 200
 
             # Should now be docked at GEO
-            ship = None
-            for s in client.get("/api/state").json()["ships"]:
-                if s["id"] == ship_id:
-                    ship = s
-                    break
+            ship = _get_ship(client, ship_id)
             assert ship is not None
             assert ship["status"] == "docked"
             assert ship["location_id"] == "GEO"
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
 
     def test_refuel(self, client):
         """Admin refuel should restore fuel to capacity."""
-        ship_id = "test_refuel"
-        try:
-            client.post("/api/admin/spawn_ship", json={
-                "name": "Refuel Test",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-                "fuel_kg": 1.0,  # Nearly empty
-            })
+        with managed_ship(client, "test_refuel", fuel_kg=1.0) as ship:
+            ship_id = ship["id"]
 
             r = client.post(f"/api/admin/ships/{ship_id}/refuel")
             assert r.status_code == 200
             data = r.json()
             assert data["ship"]["fuel_kg"] > 1.0
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
+
+    def test_spawn_without_fuel_is_full(self, client):
+        """Spawning without fuel_kg fills the tanks, so refuel is a no-op."""
+        with managed_ship(client, "test_spawn_full") as ship:
+            spawned_fuel = ship["fuel_kg"]
+            assert spawned_fuel > 0
+
+            r = client.post(f"/api/admin/ships/{ship['id']}/refuel")
+            assert r.status_code == 200
+            assert r.json()["ship"]["fuel_kg"] == pytest.approx(spawned_fuel)
 
     def test_delete_ship(self, client):
         """Deleting a ship should remove it."""
-        ship_id = "test_delete_target"
-        client.post("/api/admin/spawn_ship", json={
-            "name": "Doomed Ship",
-            "location_id": "LEO",
-            "ship_id": ship_id,
-            "parts": [
-                {"item_id": "scn_1_pioneer"},
-            ],
-        })
+        ship_id = _spawn_ship(client, "test_delete_target")["id"]
 
         r = client.delete(f"/api/admin/ships/{ship_id}")
         assert r.status_code == 200
         assert r.json()["deleted"]["id"] == ship_id
 
         # Verify gone
-        r2 = client.delete(f"/api/admin/ships/{ship_id}")
-        assert r2.status_code == 404
-
-    def test_delete_nonexistent_ship(self, client):
-        r = client.delete("/api/admin/ships/ghost_ship_never_existed")
-        assert r.status_code == 404
-
-    def test_teleport_nonexistent_ship(self, client):
-        r = client.post("/api/admin/ships/ghost_ship_never_existed/teleport", json={
-            "to_location_id": "LEO",
-        })
-        assert r.status_code == 404
-
-    def test_teleport_to_nonexistent_location(self, client):
-        ship_id = "test_teleport_bad_loc"
-        try:
-            client.post("/api/admin/spawn_ship", json={
-                "name": "Bad Teleport",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-            })
+        _assert_status(client, "DELETE", f"/api/admin/ships/{ship_id}", 404)
+
+    @pytest.mark.parametrize("method,action,payload", [
+        pytest.param("DELETE", "", None, id="delete"),
+        pytest.param("POST", "/teleport", {"to_location_id": "LEO"}, id="teleport"),
+    ])
+    def test_nonexistent_ship_404(self, client, method, action, payload):
+        _assert_status(client, method, f"/api/admin/ships/ghost_ship_never_existed{action}", 404, json=payload)
+
+    def test_teleport_to_nonexistent_location(self, client, ship_pool):
+        # The ship is looked up before the destination, so a real (pooled)
+        # ship is needed to reach the location check.
+        with ship_pool.acquire() as ship_id:
             r = client.post(f"/api/admin/ships/{ship_id}/teleport", json={
                 "to_location_id": "NARNIA",
             })
             assert r.status_code == 404
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
+            assert "NARNIA" in r.json()["detail"]
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -1212,76 +1310,44 @@ class TestFuelDvPipelineConsistency:
     """Verify that the dv quoted by transfer_quote matches what the
     transfer endpoint actually charges, and that fuel math is consistent."""
 
-    def test_quoted_dv_matches_charged(self, client):
-        """The dv_m_s returned by /transfer should match the quote."""
-        ship_id = "test_dv_consistency"
-        try:
-            client.post("/api/admin/spawn_ship", json={
-                "name": "DV Check",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-            })
-            client.post(f"/api/admin/ships/{ship_id}/refuel")
-
-            quote = client.get("/api/transfer_quote", params={
-                "from_id": "LEO",
-                "to_id": "HEO",
-            }).json()
+    _ROUTES = [("LEO", "HEO"), ("HEO", "GEO"), ("LEO", "GEO")]
 
-            r = client.post(f"/api/ships/{ship_id}/transfer", json={
-                "to_location_id": "HEO",
-            })
-            xfer = r.json()
+    @staticmethod
+    def _transfer_from(client, ship_id, from_id, to_id):
+        """Move a pool ship to ``from_id`` (it starts docked at LEO, full) and transfer."""
+        if from_id != "LEO":
+            r = client.post(f"/api/admin/ships/{ship_id}/teleport", json={"to_location_id": from_id})
+            assert r.status_code == 200
+        ship = _get_ship(client, ship_id)
+        assert ship is not None
+        r = client.post(f"/api/ships/{ship_id}/transfer", json={"to_location_id": to_id})
+        assert r.status_code == 200, r.text
+        return ship, r.json()
+
+    @pytest.mark.parametrize("from_id,to_id", _ROUTES)
+    def test_quoted_dv_matches_charged(self, client, transfer_quote, ship_pool, from_id, to_id):
+        """The dv_m_s returned by /transfer should match the quote."""
+        with ship_pool.acquire() as ship_id:
+            quote = transfer_quote(from_id, to_id)
+            _, xfer = self._transfer_from(client, ship_id, from_id, to_id)
 
             assert abs(xfer["dv_m_s"] - quote["dv_m_s"]) < 1.0
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
 
-    def test_fuel_used_matches_tsiolkovsky(self, client):
+    @pytest.mark.parametrize("from_id,to_id", _ROUTES)
+    def test_fuel_used_matches_tsiolkovsky(self, client, ship_pool, from_id, to_id):
         """Fuel consumed should be consistent with Tsiolkovsky equation."""
-        from catalog_service import compute_fuel_needed_for_delta_v_kg
-
-        ship_id = "test_fuel_tsiol"
-        try:
-            spawn = client.post("/api/admin/spawn_ship", json={
-                "name": "Tsiolkovsky Check",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-            }).json()
-            client.post(f"/api/admin/ships/{ship_id}/refuel")
-
-            # Get ship stats
-            ship_data = None
-            for s in client.get("/api/state").json()["ships"]:
-                if s["id"] == ship_id:
-                    ship_data = s
-                    break
-            assert ship_data is not None
-
-            dry = ship_data["dry_mass_kg"]
-            fuel = ship_data["fuel_kg"]
-            isp = ship_data["isp_s"]
-
-            r = client.post(f"/api/ships/{ship_id}/transfer", json={
-                "to_location_id": "HEO",
-            })
-            xfer = r.json()
+        with ship_pool.acquire() as ship_id:
+            ship_data, xfer = self._transfer_from(client, ship_id, from_id, to_id)
             dv_used = xfer["dv_m_s"]
 
             # Compute expected fuel usage
-            expected_fuel = compute_fuel_needed_for_delta_v_kg(dry, fuel, isp, dv_used)
+            expected_fuel = compute_fuel_needed_for_delta_v_kg(
+                ship_data["dry_mass_kg"], ship_data["fuel_kg"], ship_data["isp_s"], dv_used,
+            )
 
             assert abs(xfer["fuel_used_kg"] - expected_fuel) < 1.0, (
                 f"Fuel mismatch: API={xfer['fuel_used_kg']:.1f}, expected={expected_fuel:.1f}"
             )
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -1292,141 +1358,92 @@ class TestFuelDvPipelineConsistency:
 class TestTransferEdgeCases:
     def test_ship_with_no_fuel_cannot_transfer(self, client):
         """A ship with no fuel should be blocked from transfers."""
-        ship_id = "test_no_fuel_xfer"
-        try:
-            client.post("/api/admin/spawn_ship", json={
-                "name": "Empty Ship",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-                "fuel_kg": 0.0,
-            })
+        with managed_ship(client, "test_no_fuel_xfer", fuel_kg=0.0) as ship:
+            ship_id = ship["id"]
 
             r = client.post(f"/api/ships/{ship_id}/transfer", json={
                 "to_location_id": "HEO",
             })
             # Should fail — no fuel
             assert r.status_code == 400
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
 
     def test_ship_with_no_parts_cannot_transfer(self, client):
         """A ship with empty parts should have 0 dv and fail transfers."""
-        ship_id = "test_no_parts"
-        try:
-            # Spawn with empty parts — 0 ISP, 0 dv
-            client.post("/api/admin/spawn_ship", json={
-                "name": "Empty Ship",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [],
-            })
+        # Spawn with empty parts — 0 ISP, 0 dv
+        with managed_ship(client, "test_no_parts", parts=()) as ship:
+            ship_id = ship["id"]
 
             r = client.post(f"/api/ships/{ship_id}/transfer", json={
                 "to_location_id": "HEO",
             })
             # Should fail — no ISP/thrust
             assert r.status_code == 400
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
 
-    def test_transfer_quote_symmetric_locations(self, client):
+    @pytest.mark.parametrize("a,b", [("LEO", "HEO"), ("LEO", "GEO"), ("HEO", "GEO"), ("LEO", "LLO")])
+    def test_transfer_quote_symmetric_locations(self, transfer_quote, a, b):
         """Quote A→B and B→A should both exist (connectivity check)."""
-        quote_ab = client.get("/api/transfer_quote", params={
-            "from_id": "LEO",
-            "to_id": "HEO",
-        })
-        quote_ba = client.get("/api/transfer_quote", params={
-            "from_id": "HEO",
-            "to_id": "LEO",
-        })
-        assert quote_ab.status_code == 200
-        assert quote_ba.status_code == 200
-
-        ab = quote_ab.json()
-        ba = quote_ba.json()
+        ab = transfer_quote(a, b)
+        ba = transfer_quote(b, a)
         # Both should have positive dv (not necessarily equal due to gravity)
         assert ab["dv_m_s"] > 0
         assert ba["dv_m_s"] > 0
 
     def test_many_rapid_spawn_transfer_delete(self, client):
-        """Stress test: spawn, transfer, delete 5 ships rapidly."""
-        ship_ids = [f"stress_ship_{i}" for i in range(5)]
+        """Stress test: spawn, transfer, delete 5 ships concurrently."""
+        ship_ids = [_unique_ship_id(f"stress_ship_{i}") for i in range(5)]
+
+        def spawn_and_transfer(sid):
+            client.post("/api/admin/spawn_ship", json={
+                "name": f"Stress {sid}",
+                "location_id": "LEO",
+                "ship_id": sid,
+                "parts": list(_STD_PARTS),
+            })
+            return client.post(f"/api/ships/{sid}/transfer", json={
+                "to_location_id": "HEO",
+            })
+
         try:
-            for sid in ship_ids:
-                client.post("/api/admin/spawn_ship", json={
-                    "name": f"Stress {sid}",
-                    "location_id": "LEO",
-                    "ship_id": sid,
-                    "parts": [
-                        {"item_id": "scn_1_pioneer"},
-                    ],
-                })
-                client.post(f"/api/admin/ships/{sid}/refuel")
-
-                r = client.post(f"/api/ships/{sid}/transfer", json={
-                    "to_location_id": "HEO",
-                })
+            with ThreadPoolExecutor(max_workers=len(ship_ids)) as ex:
+                responses = list(ex.map(spawn_and_transfer, ship_ids))
+            for sid, r in zip(ship_ids, responses):
                 assert r.status_code == 200, f"Ship {sid} transfer failed: {r.text}"
         finally:
-            for sid in ship_ids:
-                client.delete(f"/api/admin/ships/{sid}")
+            _delete_ships(client, ship_ids)
 
     def test_spawn_at_various_locations(self, client):
         """Ships should be spawnable at any non-group location."""
         locations = ["LEO", "HEO", "GEO", "L1", "LLO"]
-        ship_ids = [f"spawn_at_{loc}" for loc in locations]
+        ship_ids = [_unique_ship_id(f"spawn_at_{loc}") for loc in locations]
+
+        def spawn_at(sid, loc):
+            return client.post("/api/admin/spawn_ship", json={
+                "name": f"Ship at {loc}",
+                "location_id": loc,
+                "ship_id": sid,
+                "parts": list(_STD_PARTS),
+            })
+
         try:
-            for sid, loc in zip(ship_ids, locations):
-                r = client.post("/api/admin/spawn_ship", json={
-                    "name": f"Ship at {loc}",
-                    "location_id": loc,
-                    "ship_id": sid,
-                    "parts": [
-                        {"item_id": "scn_1_pioneer"},
-                    ],
-                })
+            with ThreadPoolExecutor(max_workers=len(ship_ids)) as ex:
+                responses = list(ex.map(spawn_at, ship_ids, locations))
+            for loc, r in zip(locations, responses):
                 assert r.status_code == 200, f"Failed to spawn at {loc}: {r.text}"
                 assert r.json()["ship"]["location_id"] == loc
         finally:
-            for sid in ship_ids:
-                client.delete(f"/api/admin/ships/{sid}")
+            _delete_ships(client, ship_ids)
 
-    def test_missing_transfer_body(self, client):
+    def test_missing_transfer_body(self, client, ship_pool):
         """POST to /transfer with no body should return 422."""
-        ship_id = "test_no_body"
-        try:
-            client.post("/api/admin/spawn_ship", json={
-                "name": "No Body Test",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-            })
+        with ship_pool.acquire() as ship_id:
             r = client.post(f"/api/ships/{ship_id}/transfer")
             assert r.status_code == 422
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
 
-    def test_empty_destination(self, client):
+    def test_empty_destination(self, client, ship_pool):
         """POST with empty to_location_id should fail."""
-        ship_id = "test_empty_dest"
-        try:
-            client.post("/api/admin/spawn_ship", json={
-                "name": "Empty Dest",
-                "location_id": "LEO",
-                "ship_id": ship_id,
-                "parts": [
-                    {"item_id": "scn_1_pioneer"},
-                ],
-            })
+        with ship_pool.acquire() as ship_id:
             r = client.post(f"/api/ships/{ship_id}/transfer", json={
                 "to_location_id": ""
             })
             # Should fail — no route for empty string
             assert r.status_code in (400, 404)
-        finally:
-            client.delete(f"/api/admin/ships/{ship_id}")
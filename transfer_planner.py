@@ -10,64 +10,72 @@ Also provides:
  - Location → body resolution from config
 """
 
+import heapq
 import math
+import multiprocessing
+import os
+import threading
 import time
+from bisect import bisect_left
 from collections import OrderedDict
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import celestial_config
 from lambert import (
     Vec3,
     solve_lambert,
-    compute_transfer_dv,
+    make_transfer_dv,
     compute_hohmann_dv_tof,
+    _dist,
     _norm,
-    _sub,
     _dot,
-    _add,
-    _scale,
-    _stumpff_c2,
-    _stumpff_c3,
+    _stumpff_c2_c3,
 )
 
 
 # ── Lambert result cache ───────────────────────────────────
 # Caches compute_interplanetary_leg() results bucketed by departure time
 # to avoid redundant Lambert sweeps for the same leg within a time window.
+# Entries hold the base (no extra Δv) leg; extra_dv_fraction is applied on
+# the way out, so every burn margin shares one entry.
+# Entries are read-only views, so internal readers share them without
+# copying; compute_interplanetary_leg hands callers their own dict.
 
 _LAMBERT_CACHE_BUCKET_S = 3600.0  # 1 hour game-time buckets
 _LAMBERT_CACHE_MAX = 1024
-_lambert_cache: OrderedDict[Tuple[str, str, int, int], Dict[str, Any]] = OrderedDict()
+_lambert_cache: OrderedDict[Tuple[str, str, int], Mapping[str, Any]] = OrderedDict()
 _lambert_cache_hits = 0
 _lambert_cache_misses = 0
 
 
-def _lambert_cache_key(
-    from_loc: str, to_loc: str, departure_time_s: float, extra_dv_fraction: float,
-) -> Tuple[str, str, int, int]:
+def _lambert_cache_key(from_loc: str, to_loc: str, departure_time_s: float) -> Tuple[str, str, int]:
     dep_bucket = int(departure_time_s // _LAMBERT_CACHE_BUCKET_S)
-    extra_bucket = int(round(extra_dv_fraction * 10000))
-    return (from_loc, to_loc, dep_bucket, extra_bucket)
+    return (from_loc, to_loc, dep_bucket)
 
 
-def _lambert_cache_get(key: Tuple[str, str, int, int]) -> Optional[Dict[str, Any]]:
+def _lambert_cache_get(key: Tuple[str, str, int]) -> Optional[Mapping[str, Any]]:
     global _lambert_cache_hits
     val = _lambert_cache.get(key)
     if val is not None:
         _lambert_cache.move_to_end(key)
         _lambert_cache_hits += 1
-        return dict(val)  # shallow copy
-    return None
+    return val
 
 
-def _lambert_cache_put(key: Tuple[str, str, int, int], value: Dict[str, Any]) -> None:
+def _lambert_cache_put(key: Tuple[str, str, int], value: Dict[str, Any]) -> Mapping[str, Any]:
+    """Store ``value`` (which the cache takes ownership of) and return its read-only view."""
     global _lambert_cache_misses
     _lambert_cache_misses += 1
-    _lambert_cache[key] = dict(value)
+    view = MappingProxyType(value)
+    _lambert_cache[key] = view
     _lambert_cache.move_to_end(key)
     while len(_lambert_cache) > _LAMBERT_CACHE_MAX:
         _lambert_cache.popitem(last=False)
+    return view
 
 
 def get_lambert_cache_stats() -> Dict[str, int]:
@@ -81,10 +89,23 @@ def get_lambert_cache_stats() -> Dict[str, int]:
     }
 
 
+# Zero-rev solves made by the leg TOF search.  A solve depends only on the
+# heliocentric body states (tick-quantized, so repeated epochs give equal
+# vectors) and the TOF, not on the parking orbits, so legs from different
+# locations around the same pair of bodies share entries.
+_LAMBERT_SOLVE_CACHE_MAX = 8192
+
+
+@lru_cache(maxsize=_LAMBERT_SOLVE_CACHE_MAX)
+def _solve_lambert_cached(r1: Vec3, r2: Vec3, tof_s: float, mu: float) -> Tuple[Tuple[Vec3, Vec3], ...]:
+    return tuple(solve_lambert(r1, r2, tof_s, mu, max_revs=0))
+
+
 def clear_lambert_cache() -> None:
     """Flush the Lambert result cache (e.g. after config reload)."""
     global _lambert_cache_hits, _lambert_cache_misses
     _lambert_cache.clear()
+    _solve_lambert_cached.cache_clear()
     _lambert_cache_hits = 0
     _lambert_cache_misses = 0
 
@@ -96,22 +117,40 @@ _CONFIG_CACHE: Dict[str, Any] = {}
 
 def _get_config() -> Dict[str, Any]:
     if not _CONFIG_CACHE:
-        _CONFIG_CACHE["cfg"] = celestial_config.load_celestial_config()
+        cfg = celestial_config.load_celestial_config()
+        _CONFIG_CACHE["cfg"] = cfg
+        _CONFIG_CACHE["by_id"] = celestial_config._build_bodies_by_id(cfg)
+        _CONFIG_CACHE["mu"] = {
+            body_id: float(b["mu_km3_s2"])
+            for body_id, b in _CONFIG_CACHE["by_id"].items()
+            if b.get("mu_km3_s2") is not None
+        }
     return _CONFIG_CACHE["cfg"]
 
 
 def _get_location_body_map() -> Dict[str, str]:
-    return celestial_config.build_location_parent_body_map(_get_config())
+    loc_map = _CONFIG_CACHE.get("loc_map")
+    if loc_map is None:
+        loc_map = celestial_config.build_location_parent_body_map(_get_config())
+        _CONFIG_CACHE["loc_map"] = loc_map
+    return loc_map
 
 
 def _get_body(body_id: str) -> Optional[Dict[str, Any]]:
+    _get_config()
+    return _CONFIG_CACHE["by_id"].get(body_id)
+
+
+def _mu(body_id: str) -> float:
+    """Gravitational parameter μ (km³/s²) from the cached table; raises like get_body_mu."""
     cfg = _get_config()
-    for body in cfg.get("bodies", []):
-        if body.get("id") == body_id:
-            return body
-    return None
+    mu = _CONFIG_CACHE["mu"].get(body_id)
+    if mu is None:
+        return celestial_config.get_body_mu(cfg, body_id)  # raises CelestialConfigError
+    return mu
 
 
+@lru_cache(maxsize=256)
 def _body_parent_id(body_id: str) -> str:
     """Return the heliocentric parent: planet-level bodies orbit 'sun',
     moons orbit their planet.  Used to decide what μ to use for Lambert.
@@ -124,6 +163,7 @@ def _body_parent_id(body_id: str) -> str:
     return center_id or "sun"
 
 
+@lru_cache(maxsize=256)
 def _resolve_heliocentric_body(body_id: str) -> str:
     """Walk up the parent chain to find the heliocentric body.
 
@@ -144,11 +184,44 @@ def _resolve_heliocentric_body(body_id: str) -> str:
     return body_id
 
 
+# Body states are memoized on game time rounded to this quantum, so repeated
+# sweeps over the same departure/arrival instants skip the ephemeris walk.
+_BODY_STATE_TIME_QUANTUM_S = 1.0
+
+
+@lru_cache(maxsize=8192)
+def _body_state_at_tick(body_id: str, tick: int) -> Tuple[Vec3, Vec3]:
+    # compute_body_state, minus re-indexing the config bodies on every call
+    _get_config()
+    return celestial_config._compute_body_state_recursive(
+        _CONFIG_CACHE["by_id"], body_id, tick * _BODY_STATE_TIME_QUANTUM_S,
+    )
+
+
+def _body_state_cached(body_id: str, game_time_s: float) -> Tuple[Vec3, Vec3]:
+    """Cached heliocentric (r, v) of a body; raises like compute_body_state."""
+    return _body_state_at_tick(body_id, round(game_time_s / _BODY_STATE_TIME_QUANTUM_S))
+
+
+def _body_states_cached(
+    body_id: str, game_times_s: Sequence[float],
+) -> List[Optional[Tuple[Vec3, Vec3]]]:
+    """Batch form of _body_state_cached; a failed time yields None."""
+    states: List[Optional[Tuple[Vec3, Vec3]]] = []
+    for t in game_times_s:
+        try:
+            states.append(_body_state_cached(body_id, t))
+        except Exception:
+            states.append(None)
+    return states
+
+
 def location_parent_body(location_id: str) -> str:
     """Resolve location_id → parent body_id from config (replaces _LOCATION_PARENT_BODY dict)."""
     return _get_location_body_map().get(location_id, "")
 
 
+@lru_cache(maxsize=512)
 def get_synodic_period_s(body_a: str, body_b: str) -> Optional[float]:
     """Compute synodic period between two heliocentric bodies from config."""
     a_body = _get_body(body_a)
@@ -170,6 +243,13 @@ def get_synodic_period_s(body_a: str, body_b: str) -> Optional[float]:
     return abs(1.0 / denom)
 
 
+# Fallback parking altitude by body size: radius ≤ 1000 km → 80 km,
+# ≤ 10000 km → 250 km, larger (gas giants) → 1000 km.
+_PARKING_ALT_TIER_RADII_KM = (1000.0, 10000.0)
+_PARKING_ALT_KM = (80.0, 250.0, 1000.0)
+
+
+@lru_cache(maxsize=512)
 def _parking_orbit_radius_km(body_id: str, location_id: Optional[str] = None) -> float:
     """Get parking orbit radius (km from body center) for patched-conic Δv.
 
@@ -218,13 +298,7 @@ def _parking_orbit_radius_km(body_id: str, location_id: Optional[str] = None) ->
         return 6578.0  # default LEO fallback
     radius_km = float(body.get("radius_km", 0.0))
     # Use a default parking altitude proportional to the body
-    if radius_km > 10000:
-        # Gas giant — use a larger default
-        default_alt = 1000.0
-    elif radius_km > 1000:
-        default_alt = 250.0
-    else:
-        default_alt = 80.0
+    default_alt = _PARKING_ALT_KM[bisect_left(_PARKING_ALT_TIER_RADII_KM, radius_km)]
     return radius_km + default_alt
 
 
@@ -238,9 +312,17 @@ def _kepler_propagate_state(
     Uses the universal variable (chi) formulation with Stumpff functions
     based on Curtis Algorithm 3.3.  Returns the position vector at time dt.
     """
+    return _kepler_propagate_batch(r0, v0, mu, (dt,))[0]
+
+
+def _kepler_orbit_constants(
+    r0: Vec3, v0: Vec3, mu: float,
+) -> Optional[Tuple[float, float, float, float, float, float]]:
+    """Per-orbit constants (r0_mag, vr0, alpha, sqrt_mu, k1, k2) for the
+    universal-variable solve, or None for a degenerate state."""
     r0_mag = _norm(r0)
     if r0_mag < 1e-12 or mu < 1e-12:
-        return r0
+        return None
 
     v0_mag = _norm(v0)
     vr0 = _dot(r0, v0) / r0_mag  # radial velocity component
@@ -251,6 +333,25 @@ def _kepler_propagate_state(
         alpha = 0.0  # parabolic
 
     sqrt_mu = math.sqrt(mu)
+    # f(chi) = k1 * chi^2 * c2 + k2 * chi^3 * c3 + r0_mag * chi - sqrt_mu * dt
+    k1 = r0_mag * vr0 / sqrt_mu
+    k2 = 1.0 - r0_mag * alpha
+    return r0_mag, vr0, alpha, sqrt_mu, k1, k2
+
+
+# Below this ψ = chi²·α, cosh(√−ψ) overflows a double.
+_CHI_PSI_OVERFLOW = -(700.0 ** 2)
+
+
+def _universal_chi(
+    dt: float, mu: float, r0_mag: float, vr0: float, alpha: float,
+    sqrt_mu: float, k1: float, k2: float,
+) -> float:
+    """Solve the universal Kepler equation for chi at time offset dt.
+
+    ``k1`` and ``k2`` are the per-orbit coefficients r0·v_r0/√μ and
+    1 − r0·α, precomputed by the caller.
+    """
     abs_dt = abs(dt)
 
     # Initial guess for chi
@@ -279,52 +380,109 @@ def _kepler_propagate_state(
     if dt < 0:
         chi = -abs(chi)
 
-    # Newton iteration to solve Kepler's equation in universal variables
+    # Newton iteration to solve Kepler's equation in universal variables.
+    # F(chi) increases monotonically (dF/dchi = r > 0), so every iterate
+    # narrows a bracket [lo, hi] around the root.  A Newton step that would
+    # leave the bracket, or that shrinks by less than half from the step
+    # before (the slow crawl down a hyperbolic exponential), becomes a
+    # bisection step instead.
+    target = sqrt_mu * dt
+    if dt >= 0:
+        lo, hi = 0.0, math.inf
+    else:
+        lo, hi = -math.inf, 0.0
+    if not lo <= chi <= hi:
+        chi = 0.0
+    d_chi_prev = math.inf
     for _ in range(50):
-        psi = chi * chi * alpha
-        c2 = _stumpff_c2(psi)
-        c3 = _stumpff_c3(psi)
-
         chi2 = chi * chi
+        psi = chi2 * alpha
+        if psi < _CHI_PSI_OVERFLOW:
+            # cosh/sinh would overflow: chi is far past the root, on the
+            # side away from zero, and the bound on the other side is finite.
+            if chi > 0.0:
+                hi = chi
+            else:
+                lo = chi
+            chi = 0.5 * (lo + hi)
+            continue
+        c2, c3 = _stumpff_c2_c3(psi)
         chi3 = chi2 * chi
 
-        r = chi2 * c2 + (vr0 / sqrt_mu) * chi3 * c3 * sqrt_mu + r0_mag * (1.0 - chi2 / r0_mag * alpha * c2 + chi2 * c2)
-        # Simplified: f(chi) = (r0_mag * vr0 / sqrt_mu) * chi^2 * c2 + (1 - r0_mag * alpha) * chi^3 * c3 + r0_mag * chi - sqrt_mu * dt
-        f_chi = (
-            (r0_mag * vr0 / sqrt_mu) * chi2 * c2
-            + (1.0 - r0_mag * alpha) * chi3 * c3
-            + r0_mag * chi
-            - sqrt_mu * dt
-        )
+        f_chi = k1 * chi2 * c2 + k2 * chi3 * c3 + r0_mag * chi - target
+        if f_chi < 0.0:
+            lo = chi
+        else:
+            hi = chi
 
         # r as function of chi (used as denominator in Newton step)
-        r_chi = (
-            (r0_mag * vr0 / sqrt_mu) * chi * (1.0 - chi2 * c3 * alpha)
-            + (1.0 - r0_mag * alpha) * chi2 * c2
-            + r0_mag
-        )
+        r_chi = k1 * chi * (1.0 - chi2 * c3 * alpha) + k2 * chi2 * c2 + r0_mag
 
         if abs(r_chi) < 1e-30:
             break
 
-        d_chi = -f_chi / r_chi
-        chi += d_chi
+        chi_new = chi - f_chi / r_chi
+        slow = abs(2.0 * f_chi) > abs(d_chi_prev * r_chi) and hi - lo < math.inf
+        if slow or not lo <= chi_new <= hi:
+            chi_new = 0.5 * (lo + hi)
+        d_chi = chi_new - chi
+        d_chi_prev = d_chi
+        chi = chi_new
 
         if abs(d_chi) < 1e-10 * (1.0 + abs(chi)):
             break
+    return chi
+
+
+def _kepler_solve_chi(r0: Vec3, v0: Vec3, dt: float, mu: float) -> float:
+    """Universal anomaly chi reached after propagating (r0, v0) by dt."""
+    consts = _kepler_orbit_constants(r0, v0, mu)
+    if consts is None:
+        return 0.0
+    return _universal_chi(dt, mu, *consts)
+
+
+def _kepler_propagate_batch(
+    r0: Vec3, v0: Vec3, mu: float, times: Sequence[float],
+) -> List[Vec3]:
+    """Positions of the orbit through (r0, v0) at each time offset in ``times``.
+
+    Same solve as _kepler_propagate_state, with the orbit constants computed
+    once for the whole batch; each time still gets its own Newton solve.
+    """
+    fg = _kepler_fg_batch(r0, v0, mu, times)
+    if fg is None:
+        return [r0] * len(times)
+    rx, ry, rz = r0
+    vx, vy, vz = v0
+    # Position at each time: f·r0 + g·v0
+    return [(f * rx + g * vx, f * ry + g * vy, f * rz + g * vz) for f, g in fg]
+
+
+def _kepler_fg_batch(
+    r0: Vec3, v0: Vec3, mu: float, times: Sequence[float],
+) -> Optional[List[Tuple[float, float]]]:
+    """Lagrange (f, g) at each time offset, or None for a degenerate state.
+
+    Callers form only the position components they need from f·r0 + g·v0.
+    """
+    consts = _kepler_orbit_constants(r0, v0, mu)
+    if consts is None:
+        return None
+    r0_mag, vr0, alpha, sqrt_mu, k1, k2 = consts
 
-    # Compute f, g Lagrange coefficients
-    psi = chi * chi * alpha
-    c2 = _stumpff_c2(psi)
-    c3 = _stumpff_c3(psi)
-    chi2 = chi * chi
+    coeffs: List[Tuple[float, float]] = []
+    for dt in times:
+        chi = _universal_chi(dt, mu, r0_mag, vr0, alpha, sqrt_mu, k1, k2)
 
-    f = 1.0 - (chi2 / r0_mag) * c2
-    g = dt - (chi2 * chi / sqrt_mu) * c3
+        # Compute f, g Lagrange coefficients
+        chi2 = chi * chi
+        c2, c3 = _stumpff_c2_c3(chi2 * alpha)
 
-    # Position at time dt
-    r_new = _add(_scale(f, r0), _scale(g, v0))
-    return r_new
+        f = 1.0 - (chi2 / r0_mag) * c2
+        g = dt - (chi2 * chi / sqrt_mu) * c3
+        coeffs.append((f, g))
+    return coeffs
 
 
 def compute_trajectory_points(
@@ -333,6 +491,7 @@ def compute_trajectory_points(
     mu: float,
     tof: float,
     n_points: int = 64,
+    chi_final: Optional[float] = None,
 ) -> List[Tuple[float, float]]:
     """Propagate a Keplerian orbit from (r1, v1) and return n_points (x, y) samples.
 
@@ -340,6 +499,10 @@ def compute_trajectory_points(
     orbit at evenly-spaced time intervals.  Returns heliocentric (x, y)
     coordinates in km — the z component is projected out (ecliptic plane).
 
+    When ``chi_final`` (the universal anomaly at ``tof``) is known, the arc
+    is instead sampled at evenly-spaced chi and evaluated directly from the
+    f and g coefficients, with no Kepler solve per sample.
+
     Parameters
     ----------
     r1 : Vec3  — initial position vector (km)
@@ -347,6 +510,7 @@ def compute_trajectory_points(
     mu : float — gravitational parameter of central body (km³/s²)
     tof : float — total time of flight (seconds)
     n_points : int — number of sample points (including start and end)
+    chi_final : float, optional — universal anomaly at tof
 
     Returns
     -------
@@ -357,19 +521,57 @@ def compute_trajectory_points(
     if tof <= 0 or mu <= 0:
         return [(r1[0], r1[1])] * n_points
 
-    points: List[Tuple[float, float]] = []
-    for i in range(n_points):
-        t = tof * i / (n_points - 1)
-        if i == 0:
-            points.append((r1[0], r1[1]))
-        else:
-            r_t = _kepler_propagate_state(r1, v1, t, mu)
-            points.append((r_t[0], r_t[1]))
+    if chi_final is not None:
+        return _trajectory_points_from_chi(r1, v1, mu, chi_final, n_points)
+
+    times = [tof * i / (n_points - 1) for i in range(1, n_points)]
+    fg = _kepler_fg_batch(r1, v1, mu, times)
+    if fg is None:
+        return [(r1[0], r1[1])] * n_points
+    # Only the ecliptic (x, y) components of f·r1 + g·v1 are drawn.
+    rx, ry = r1[0], r1[1]
+    vx, vy = v1[0], v1[1]
+    points: List[Tuple[float, float]] = [(rx, ry)]
+    points.extend((f * rx + g * vx, f * ry + g * vy) for f, g in fg)
+    return points
+
+
+def _trajectory_points_from_chi(
+    r1: Vec3, v1: Vec3, mu: float, chi_final: float, n_points: int,
+) -> List[Tuple[float, float]]:
+    """(x, y) samples at evenly-spaced chi in [0, chi_final].
+
+    The time at each chi follows from the universal Kepler equation itself,
+    so g = t − chi³·c3/√μ needs no Newton iteration.
+    """
+    consts = _kepler_orbit_constants(r1, v1, mu)
+    if consts is None:
+        return [(r1[0], r1[1])] * n_points
+    r0_mag, _vr0, alpha, sqrt_mu, k1, k2 = consts
+
+    points: List[Tuple[float, float]] = [(r1[0], r1[1])]
+    for i in range(1, n_points):
+        chi = chi_final * i / (n_points - 1)
+        chi2 = chi * chi
+        chi3 = chi2 * chi
+        c2, c3 = _stumpff_c2_c3(chi2 * alpha)
+        t = (k1 * chi2 * c2 + k2 * chi3 * c3 + r0_mag * chi) / sqrt_mu
+        f = 1.0 - (chi2 / r0_mag) * c2
+        g = t - (chi3 / sqrt_mu) * c3
+        points.append((f * r1[0] + g * v1[0], f * r1[1] + g * v1[1]))
     return points
 
 
 # ── Core: Lambert-based interplanetary leg ──────────────────
 
+# TOF sweep in compute_interplanetary_leg, as multiples of the Hohmann TOF.
+_LEG_TOF_SWEEP_FACTORS = (1.0, 0.9, 1.1, 0.8, 1.2, 0.7, 1.3, 0.5, 1.5, 0.4, 1.8, 2.0, 2.5, 0.3)
+# Golden-section refinement between the best sweep factor's neighbours.
+_LEG_TOF_FACTOR_TOL = 0.01
+_LEG_TOF_MAX_REFINE = 8
+_GOLDEN_SECTION = (3.0 - math.sqrt(5.0)) / 2.0  # ≈ 0.382
+
+
 def compute_interplanetary_leg(
     from_location: str,
     to_location: str,
@@ -381,7 +583,7 @@ def compute_interplanetary_leg(
     Results are cached by departure-time bucket to avoid redundant Lambert
     sweeps for the same leg within a time window.
 
-    Sweeps several TOFs around the Hohmann estimate and picks the lowest-Δv
+    Searches TOFs around the Hohmann estimate and picks the lowest-Δv
     solution for the given departure time.  Phase-angle information is returned
     for display but does NOT modify the Δv — the Lambert solver already
     accounts for actual body geometry at departure.
@@ -390,11 +592,38 @@ def compute_interplanetary_leg(
     if the transfer cannot be computed (same body, unknown body, etc.).
     """
     # ── Check cache ─────────────────────────────────────────
-    cache_key = _lambert_cache_key(from_location, to_location, departure_time_s, extra_dv_fraction)
-    cached = _lambert_cache_get(cache_key)
-    if cached is not None:
-        return cached
-    cfg = _get_config()
+    base = _lambert_cache_get(_lambert_cache_key(from_location, to_location, departure_time_s))
+    if base is None:
+        leg = _resolve_interplanetary_leg(from_location, to_location)
+        if leg is None:
+            return None
+        base = _compute_interplanetary_leg_fast(leg, departure_time_s)
+        if base is None:
+            return None
+    return _apply_extra_dv(base, extra_dv_fraction)
+
+
+def _apply_extra_dv(base: Mapping[str, Any], extra_dv_fraction: float) -> Dict[str, Any]:
+    """Copy of a base leg with ``extra_dv_fraction`` spent to shorten the TOF."""
+    result = dict(base)
+    extra = max(0.0, float(extra_dv_fraction))
+    if extra > 0.0:
+        base_dv_m_s = result["base_dv_m_s"]
+        final_tof = _excess_dv_time_reduction(result["base_tof_s"], base_dv_m_s, extra)
+        result["dv_m_s"] = float(base_dv_m_s * (1.0 + extra))
+        result["tof_s"] = float(final_tof)
+        result["helio_chi_final"] = _kepler_solve_chi(
+            tuple(result["helio_r1"]), tuple(result["helio_v1"]), final_tof, result["helio_mu"],
+        )
+    return result
+
+
+def _resolve_interplanetary_leg(from_location: str, to_location: str) -> Optional[Dict[str, Any]]:
+    """Time-independent inputs for a Lambert leg between two locations.
+
+    Returns None if the pair is not interplanetary (same body, same parent
+    planet, sun-centred or unknown location).
+    """
     loc_map = _get_location_body_map()
 
     from_body = loc_map.get(from_location, "")
@@ -410,10 +639,60 @@ def compute_interplanetary_leg(
     if from_helio == to_helio:
         return None  # Same parent planet — not interplanetary
 
+    # Get body parameters for patched-conic burns
+    try:
+        mu_from = _mu(from_helio)
+        mu_to = _mu(to_helio)
+    except Exception:
+        mu_from = 0.0
+        mu_to = 0.0
+
+    return {
+        "from_location": from_location,
+        "to_location": to_location,
+        "from_body": from_body,
+        "to_body": to_body,
+        "from_helio": from_helio,
+        "to_helio": to_helio,
+        "mu_sun": _mu("sun"),
+        "mu_from": mu_from,
+        "mu_to": mu_to,
+        "r_park_from": _parking_orbit_radius_km(from_helio, from_location),
+        "r_park_to": _parking_orbit_radius_km(to_helio, to_location),
+    }
+
+
+def _compute_interplanetary_leg_fast(
+    leg: Dict[str, Any],
+    departure_time_s: float,
+) -> Optional[Mapping[str, Any]]:
+    """Base (no extra Δv) compute_interplanetary_leg for a leg already
+    resolved by _resolve_interplanetary_leg, so repeated departures skip
+    config lookups.
+
+    Returns the cached read-only view of the result.
+    """
+    from_location = leg["from_location"]
+    to_location = leg["to_location"]
+    cache_key = _lambert_cache_key(from_location, to_location, departure_time_s)
+    cached = _lambert_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    from_body = leg["from_body"]
+    to_body = leg["to_body"]
+    from_helio = leg["from_helio"]
+    to_helio = leg["to_helio"]
+    mu_sun = leg["mu_sun"]
+    mu_from = leg["mu_from"]
+    mu_to = leg["mu_to"]
+    r_park_from = leg["r_park_from"]
+    r_park_to = leg["r_park_to"]
+
     # Get body states at departure time
     try:
-        r1_vec, v1_body = celestial_config.compute_body_state(cfg, from_helio, departure_time_s)
-        r2_vec, v2_body_dep = celestial_config.compute_body_state(cfg, to_helio, departure_time_s)
+        r1_vec, v1_body = _body_state_cached(from_helio, departure_time_s)
+        r2_vec, v2_body_dep = _body_state_cached(to_helio, departure_time_s)
     except Exception:
         return None
 
@@ -423,82 +702,91 @@ def compute_interplanetary_leg(
         return None
 
     # Hohmann TOF as baseline estimate
-    mu_sun = celestial_config.get_body_mu(cfg, "sun")
     hohmann_tof_s = math.pi * math.sqrt(((r1_km + r2_km) / 2.0) ** 3 / mu_sun)
 
-    # Get body parameters for patched-conic burns
-    try:
-        mu_from = celestial_config.get_body_mu(cfg, from_helio)
-        mu_to = celestial_config.get_body_mu(cfg, to_helio)
-    except Exception:
-        mu_from = 0.0
-        mu_to = 0.0
-
-    r_park_from = _parking_orbit_radius_km(from_helio, from_location)
-    r_park_to = _parking_orbit_radius_km(to_helio, to_location)
-
     # Sweep TOFs around the Hohmann estimate to find the best Lambert Δv
     # for this departure time.  The porkchop sweeps departure × TOF; here
-    # we fix the departure and sweep TOF only.
-    tof_factors = [1.0, 0.9, 1.1, 0.8, 1.2, 0.7, 1.3, 0.5, 1.5, 0.4, 1.8, 2.0, 2.5, 0.3]
+    # we fix the departure and sweep TOF only.  Δv(TOF) has several local
+    # minima, so every factor is evaluated; a short golden-section search then
+    # refines the TOF between the best factor's neighbours.
     best_dv_total = float("inf")
     best_v1: Optional[Vec3] = None
     best_v2: Optional[Vec3] = None
     best_tof_s = hohmann_tof_s
     best_v2_body_arr: Optional[Vec3] = None
-
-    for factor in tof_factors:
-        tof_try = hohmann_tof_s * factor
-        if tof_try < 86400.0:  # Skip < 1 day
-            continue
-        arr_time = departure_time_s + tof_try
-        try:
-            r2_arr, v2_arr = celestial_config.compute_body_state(cfg, to_helio, arr_time)
-        except Exception:
-            continue
-
-        solutions = solve_lambert(r1_vec, r2_arr, tof_try, mu_sun, max_revs=0)
-        if not solutions:
-            continue
-
-        for v1_sol, v2_sol in solutions:
-            dv_dep, dv_arr, dv_tot = compute_transfer_dv(
-                v1_departure=v1_sol,
-                v1_body=v1_body,
-                v2_arrival=v2_sol,
-                v2_body=v2_arr,
-                mu_departure=mu_from,
-                r_park_departure=r_park_from,
-                mu_arrival=mu_to,
-                r_park_arrival=r_park_to,
-            )
+    best_dv_dep = best_dv_arr = 0.0
+    transfer_dv = make_transfer_dv(mu_from, r_park_from, mu_to, r_park_to)
+
+    def _solve_at(tof_try: float, arr_state: Optional[Tuple[Vec3, Vec3]]) -> float:
+        nonlocal best_dv_total, best_v1, best_v2, best_tof_s, best_v2_body_arr
+        nonlocal best_dv_dep, best_dv_arr
+        if arr_state is None:
+            return float("inf")
+        r2_arr, v2_arr = arr_state
+
+        factor_dv = float("inf")
+        for v1_sol, v2_sol in _solve_lambert_cached(r1_vec, r2_arr, tof_try, mu_sun):
+            dv_dep, dv_arr, dv_tot = transfer_dv(v1_sol, v1_body, v2_sol, v2_arr)
+            factor_dv = min(factor_dv, dv_tot)
             if dv_tot < best_dv_total:
                 best_dv_total = dv_tot
                 best_v1 = v1_sol
                 best_v2 = v2_sol
                 best_tof_s = tof_try
                 best_v2_body_arr = v2_arr
+                best_dv_dep = dv_dep
+                best_dv_arr = dv_arr
+        return factor_dv
+
+    # Arrival states for the whole sweep come from one ephemeris call.
+    tofs = [hohmann_tof_s * f for f in _LEG_TOF_SWEEP_FACTORS]
+    tofs = [tof for tof in tofs if tof >= 86400.0]  # Skip < 1 day
+    arr_states = _body_states_cached(to_helio, [departure_time_s + tof for tof in tofs])
+    swept = sorted(
+        (tof / hohmann_tof_s, _solve_at(tof, arr_state)) for tof, arr_state in zip(tofs, arr_states)
+    )
+    if not swept:
+        return None
+
+    # The sweep has fixed the basin; bracket the best factor by its grid
+    # neighbours and refine inside that bracket only, so the result can only
+    # improve on the sweep.
+    i_best = min(range(len(swept)), key=lambda i: swept[i][1])
+    x, fx = swept[i_best]
+    lo = swept[i_best - 1][0] if i_best > 0 else x
+    hi = swept[i_best + 1][0] if i_best + 1 < len(swept) else x
+    for _ in range(_LEG_TOF_MAX_REFINE if math.isfinite(fx) else 0):
+        # Probe the wider side of the bracket at the golden split.
+        if x - lo > hi - x:
+            u = x - _GOLDEN_SECTION * (x - lo)
+        else:
+            u = x + _GOLDEN_SECTION * (hi - x)
+        if abs(u - x) < _LEG_TOF_FACTOR_TOL:
+            break
+        tof_u = hohmann_tof_s * u
+        fu = _solve_at(tof_u, _body_states_cached(to_helio, [departure_time_s + tof_u])[0])
+        if fu < fx:
+            if u < x:
+                hi = x
+            else:
+                lo = x
+            x, fx = u, fu
+        elif u < x:
+            lo = u
+        else:
+            hi = u
 
     if best_v1 is None or best_v2 is None or best_v2_body_arr is None:
         return None
 
-    # Final dv computation with the best solution
-    dv_dep, dv_arr, base_dv_m_s = compute_transfer_dv(
-        v1_departure=best_v1,
-        v1_body=v1_body,
-        v2_arrival=best_v2,
-        v2_body=best_v2_body_arr,
-        mu_departure=mu_from,
-        r_park_departure=r_park_from,
-        mu_arrival=mu_to,
-        r_park_arrival=r_park_to,
-    )
+    # The search already evaluated the winning solution's burns.
+    dv_dep, dv_arr, base_dv_m_s = best_dv_dep, best_dv_arr, best_dv_total
     base_tof_s = best_tof_s
     arrival_time_s = departure_time_s + best_tof_s
 
     # Compute v_inf values for display
-    v_inf_depart = _norm(_sub(best_v1, v1_body))
-    v_inf_arrive = _norm(_sub(best_v2, best_v2_body_arr))
+    v_inf_depart = _dist(best_v1, v1_body)
+    v_inf_arrive = _dist(best_v2, best_v2_body_arr)
 
     # Compute phase angle info for display (informational only — NOT applied to Δv)
     # Phase angle = angle between departure and arrival body positions at departure
@@ -521,16 +809,14 @@ def compute_interplanetary_leg(
     # serves as the quality indicator.
     phase_multiplier = 1.0
     phase_adjusted_dv = base_dv_m_s
-    final_dv = base_dv_m_s * (1.0 + max(0.0, float(extra_dv_fraction)))
-    final_tof = _excess_dv_time_reduction(base_tof_s, base_dv_m_s, max(0.0, float(extra_dv_fraction)))
 
     result = {
         "base_dv_m_s": float(base_dv_m_s),
         "base_tof_s": float(base_tof_s),
         "phase_multiplier": float(phase_multiplier),
         "phase_adjusted_dv_m_s": float(phase_adjusted_dv),
-        "dv_m_s": float(final_dv),
-        "tof_s": float(final_tof),
+        "dv_m_s": float(base_dv_m_s),
+        "tof_s": float(base_tof_s),
         "phase_angle_deg": float(phase_deg),
         "optimal_phase_deg": float(optimal_phase_deg),
         "alignment_pct": float(alignment_pct),
@@ -546,19 +832,23 @@ def compute_interplanetary_leg(
         "helio_r1": list(r1_vec),
         "helio_v1": list(best_v1),
         "helio_mu": float(mu_sun),
+        # Universal anomaly at tof_s, so the arc can be sampled without re-solving
+        "helio_chi_final": _kepler_solve_chi(r1_vec, best_v1, base_tof_s, mu_sun),
     }
 
     # ── Store in cache ──────────────────────────────────────
-    _lambert_cache_put(cache_key, result)
-
-    return result
+    return _lambert_cache_put(cache_key, result)
 
 
 def _angle_between_2d(a: Vec3, b: Vec3) -> float:
-    """Angle between two 3D vectors projected to the ecliptic (x, y) plane."""
-    theta_a = math.atan2(a[1], a[0])
-    theta_b = math.atan2(b[1], b[0])
-    return (theta_b - theta_a) % (2.0 * math.pi)
+    """Angle between two 3D vectors projected to the ecliptic (x, y) plane.
+
+    Measured counter-clockwise from ``a`` to ``b`` in [0, 2π), from the 2D
+    cross and dot products so only one atan2 is needed.
+    """
+    cross_z = a[0] * b[1] - a[1] * b[0]
+    dot_xy = a[0] * b[0] + a[1] * b[1]
+    return math.atan2(cross_z, dot_xy) % (2.0 * math.pi)
 
 
 def compute_leg_trajectory(
@@ -581,7 +871,11 @@ def compute_leg_trajectory(
         return None
     r1: Vec3 = (float(r1_raw[0]), float(r1_raw[1]), float(r1_raw[2]))
     v1: Vec3 = (float(v1_raw[0]), float(v1_raw[1]), float(v1_raw[2]))
-    return compute_trajectory_points(r1, v1, float(mu), float(tof), n_points=n_points)
+    chi_final = orbital.get("helio_chi_final")
+    return compute_trajectory_points(
+        r1, v1, float(mu), float(tof), n_points=n_points,
+        chi_final=None if chi_final is None else float(chi_final),
+    )
 
 
 def _excess_dv_time_reduction(base_tof_s: float, base_dv_m_s: float, extra_dv_fraction: float) -> float:
@@ -597,6 +891,14 @@ def _excess_dv_time_reduction(base_tof_s: float, base_dv_m_s: float, extra_dv_fr
 
 # ── Departure-window scanning (Lambert-based) ──────────────
 
+# scan_departure_windows: coarse stride is horizon / _WINDOW_SCAN_COARSE_STEPS
+# (at least a day); the best _WINDOW_SCAN_REFINE_TOP coarse samples are then
+# re-scanned daily within one stride either side, which reaches any minimum
+# lying between two coarse samples.
+_WINDOW_SCAN_COARSE_STEPS = 30
+_WINDOW_SCAN_REFINE_TOP = 3
+
+
 def scan_departure_windows(
     from_location: str,
     to_location: str,
@@ -608,39 +910,69 @@ def scan_departure_windows(
     """Scan future departure times for better transfer windows.
 
     Similar to the old _scan_departure_windows but uses Lambert internally
-    to compute actual Δv at each candidate time.
+    to compute actual Δv at each candidate time.  Samples a coarse grid
+    over the horizon and refines daily around the best coarse windows
+    rather than solving every day.  Windows rank by phase multiplier, then
+    Lambert Δv, then wait.
     """
     if synodic_period_s is None or synodic_period_s <= 0:
         return []
+    # Resolve the pair once; non-interplanetary pairs never reach Lambert.
+    if not is_interplanetary(from_location, to_location):
+        return []
+    leg = _resolve_interplanetary_leg(from_location, to_location)
+    if leg is None:
+        return []
 
     horizon_s = max(86400.0, min(float(synodic_period_s), 240.0 * 86400.0))
-    step_s = 86400.0  # 1-day steps
-    candidates: List[Dict[str, Any]] = []
+    step_s = 86400.0  # 1-day resolution
     samples = int(horizon_s / step_s)
+    by_idx: Dict[int, Optional[Dict[str, Any]]] = {}
 
-    for idx in range(1, samples + 1):
+    def _sample(idx: int) -> Optional[Dict[str, Any]]:
+        if idx in by_idx:
+            return by_idx[idx]
         t = float(departure_time_s) + idx * step_s
-        result = compute_interplanetary_leg(from_location, to_location, t, extra_dv_fraction=0.0)
-        if not result:
-            continue
-
-        multiplier = float(result["phase_multiplier"])
-        savings_pct = 0.0
-        if current_phase_multiplier > 1e-9:
-            savings_pct = max(0.0, (1.0 - multiplier / current_phase_multiplier) * 100.0)
-
-        candidates.append({
-            "departure_time": t,
-            "wait_s": float(t - departure_time_s),
-            "phase_multiplier": multiplier,
-            "phase_angle_deg": float(result["phase_angle_deg"]),
-            "optimal_phase_deg": float(result["optimal_phase_deg"]),
-            "alignment_pct": float(result["alignment_pct"]),
-            "dv_savings_pct": float(savings_pct),
-            "lambert_dv_m_s": float(result["base_dv_m_s"]),
-        })
-
-    candidates.sort(key=lambda item: (item["phase_multiplier"], item["wait_s"]))
+        result = _compute_interplanetary_leg_fast(leg, t)
+        candidate = None
+        if result:
+            multiplier = float(result["phase_multiplier"])
+            savings_pct = 0.0
+            if current_phase_multiplier > 1e-9:
+                savings_pct = max(0.0, (1.0 - multiplier / current_phase_multiplier) * 100.0)
+            candidate = {
+                "departure_time": t,
+                "wait_s": float(t - departure_time_s),
+                "phase_multiplier": multiplier,
+                "phase_angle_deg": float(result["phase_angle_deg"]),
+                "optimal_phase_deg": float(result["optimal_phase_deg"]),
+                "alignment_pct": float(result["alignment_pct"]),
+                "dv_savings_pct": float(savings_pct),
+                "lambert_dv_m_s": float(result["base_dv_m_s"]),
+            }
+        by_idx[idx] = candidate
+        return candidate
+
+    def _rank(item: Dict[str, Any]) -> Tuple[float, float, float]:
+        # The phase multiplier is fixed at 1.0 for Lambert legs, so the leg
+        # Δv is what actually separates windows.
+        return (item["phase_multiplier"], item["lambert_dv_m_s"], item["wait_s"])
+
+    # Coarse pass over the horizon (starting at day 1 so the earliest
+    # departure is always sampled), then a daily re-scan spanning one stride
+    # either side of the best coarse windows.
+    stride = max(1, int(horizon_s / _WINDOW_SCAN_COARSE_STEPS / step_s))
+    coarse = [c for c in map(_sample, range(1, samples + 1, stride)) if c]
+    coarse.sort(key=_rank)
+    for winner in coarse[:_WINDOW_SCAN_REFINE_TOP]:
+        center = int(round(winner["wait_s"] / step_s))
+        lo = max(1, center - stride)
+        hi = min(samples, center + stride)
+        for idx in range(lo, hi + 1):
+            _sample(idx)
+
+    candidates = [c for c in by_idx.values() if c]
+    candidates.sort(key=_rank)
     return candidates[:max_candidates]
 
 
@@ -706,6 +1038,7 @@ def is_interplanetary(from_location: str, to_location: str) -> bool:
 # but taking 200 extra days (~200 * 1.0 = 200 m/s penalty) is still
 # preferred over a shorter 0-rev transfer.
 _TOF_PENALTY_M_S_PER_DAY = 1.0
+_REV_PENALTY_M_S = 50.0
 
 
 def transfer_quality_score(
@@ -726,12 +1059,130 @@ def transfer_quality_score(
     savings are marginal (50 m/s per additional revolution).
     """
     tof_days = max(0.0, tof_s) / 86400.0
-    rev_penalty = revolutions * 50.0  # 50 m/s per extra revolution
+    rev_penalty = revolutions * _REV_PENALTY_M_S
     return dv_m_s + tof_penalty_per_day * tof_days + rev_penalty
 
 
+def _tof_penalties(tof_values: Sequence[float]) -> List[float]:
+    """transfer_quality_score's TOF term for each TOF on a porkchop axis.
+
+    The term depends only on the TOF, so the grid sweep adds it per cell
+    instead of calling transfer_quality_score per solution.
+    """
+    return [_TOF_PENALTY_M_S_PER_DAY * (max(0.0, tof) / 86400.0) for tof in tof_values]
+
+
 # ── Porkchop plot computation ──────────────────────────────
 
+# PORKCHOP_WORKERS > 1 opts in to a process pool for large porkchop grids.
+# Unset (or 1) keeps the sweep in-process, so the API server does not spawn
+# workers unless the deployment asks for them.
+_PORKCHOP_WORKERS = max(1, int(os.environ.get("PORKCHOP_WORKERS", "1") or 1))
+_PORKCHOP_PARALLEL_MIN_ROWS = 16
+_PORKCHOP_TOP_CANDIDATES = 50
+_porkchop_pool: Optional[ProcessPoolExecutor] = None
+_porkchop_pool_lock = threading.Lock()
+
+# Winning solution for one grid cell:
+# (v1, v2, dv_depart_m_s, dv_arrive_m_s, dv_total_m_s, solution_index, score)
+_PorkchopCell = Tuple[Vec3, Vec3, float, float, float, int, float]
+_PorkchopRowArgs = Tuple[Vec3, Vec3, List[Optional[Tuple[Vec3, Vec3]]]]
+_PorkchopRow = Tuple[List[Optional[float]], List[Optional[_PorkchopCell]]]
+
+
+def _get_porkchop_pool() -> ProcessPoolExecutor:
+    global _porkchop_pool
+    with _porkchop_pool_lock:
+        if _porkchop_pool is None:
+            _porkchop_pool = ProcessPoolExecutor(
+                max_workers=_PORKCHOP_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _porkchop_pool
+
+
+def shutdown_porkchop_pool() -> None:
+    """Stop the porkchop worker pool, if one was started (app shutdown)."""
+    global _porkchop_pool
+    with _porkchop_pool_lock:
+        if _porkchop_pool is not None:
+            _porkchop_pool.shutdown()
+            _porkchop_pool = None
+
+
+def _map_porkchop_rows(
+    row_fn: Callable[[_PorkchopRowArgs], _PorkchopRow],
+    row_args: List[_PorkchopRowArgs],
+) -> Iterator[_PorkchopRow]:
+    """Evaluate porkchop rows, in worker processes when the grid is large."""
+    if _PORKCHOP_WORKERS > 1 and len(row_args) >= _PORKCHOP_PARALLEL_MIN_ROWS:
+        try:
+            # A few chunks per worker: row_fn (with its TOF axis) is pickled
+            # once per chunk rather than once per row.
+            chunksize = max(1, len(row_args) // (_PORKCHOP_WORKERS * 4))
+            return iter(list(_get_porkchop_pool().map(row_fn, row_args, chunksize=chunksize)))
+        except (OSError, BrokenProcessPool):
+            pass  # fall back to the in-process sweep
+    return map(row_fn, row_args)
+
+
+def _solution_rev_type(sol_idx: int) -> Tuple[int, str]:
+    """Revolution count and path type for a solve_lambert solution index.
+
+    Index 0 = 0-rev, then pairs: (1=1-rev short, 2=1-rev long),
+    (3=2-rev short, 4=2-rev long), etc.
+    """
+    if sol_idx == 0:
+        return 0, "short"
+    return (sol_idx - 1) // 2 + 1, "short" if (sol_idx - 1) % 2 == 0 else "long"
+
+
+def _porkchop_row(
+    row: _PorkchopRowArgs,
+    tof_values: List[float],
+    tof_penalties: List[float],
+    mu_sun: float,
+    mu_from: float,
+    r_park_from: float,
+    mu_to: float,
+    r_park_to: float,
+    max_revs: int,
+) -> _PorkchopRow:
+    """Best Δv for each TOF from one porkchop departure time.
+
+    ``row`` is (r1, v1_body, arrival states per TOF).  Returns the rounded Δv
+    row (m/s) and the winning solution per cell, so the best-solution pass
+    can read it back instead of re-solving Lambert.  A missing arrival state
+    or failed solve yields None for that cell.
+    """
+    r1_vec, v1_body, arr_row = row
+    transfer_dv = make_transfer_dv(mu_from, r_park_from, mu_to, r_park_to)
+    dv_row: List[Optional[float]] = []
+    cell_row: List[Optional[_PorkchopCell]] = []
+    for tof, tof_penalty, arr_state in zip(tof_values, tof_penalties, arr_row):
+        if tof <= 0 or arr_state is None:
+            dv_row.append(None)
+            cell_row.append(None)
+            continue
+        r2_vec, v2_body = arr_state
+
+        solutions = solve_lambert(r1_vec, r2_vec, tof, mu_sun, max_revs=max_revs)
+
+        # Find best solution across all revolutions using quality score
+        best_cell: Optional[_PorkchopCell] = None
+        for sol_idx, (v1_sol, v2_sol) in enumerate(solutions):
+            # Runs once per grid cell and solution.  transfer_quality_score
+            # inlined, with rev_count = _solution_rev_type(sol_idx)[0].
+            dv_dep, dv_arr, dv_tot = transfer_dv(v1_sol, v1_body, v2_sol, v2_body)
+            score = dv_tot + tof_penalty + ((sol_idx + 1) // 2) * _REV_PENALTY_M_S
+            if best_cell is None or score < best_cell[6]:
+                best_cell = (v1_sol, v2_sol, dv_dep, dv_arr, dv_tot, sol_idx, score)
+
+        dv_row.append(None if best_cell is None else round(best_cell[4], 1))
+        cell_row.append(best_cell)
+    return dv_row, cell_row
+
+
 def compute_porkchop(
     from_location: str,
     to_location: str,
@@ -750,7 +1201,6 @@ def compute_porkchop(
 
     Returns None if locations are not interplanetary.
     """
-    cfg = _get_config()
     loc_map = _get_location_body_map()
 
     from_body = loc_map.get(from_location, "")
@@ -763,10 +1213,10 @@ def compute_porkchop(
     if from_helio == to_helio:
         return None
 
-    mu_sun = celestial_config.get_body_mu(cfg, "sun")
+    mu_sun = _mu("sun")
     try:
-        mu_from = celestial_config.get_body_mu(cfg, from_helio)
-        mu_to = celestial_config.get_body_mu(cfg, to_helio)
+        mu_from = _mu(from_helio)
+        mu_to = _mu(to_helio)
     except Exception:
         mu_from = 0.0
         mu_to = 0.0
@@ -778,101 +1228,63 @@ def compute_porkchop(
     dep_step = (departure_end_s - departure_start_s) / max(1, grid_size - 1)
     tof_step = (tof_max_s - tof_min_s) / max(1, grid_size - 1)
 
-    departure_times: List[float] = []
-    tof_values: List[float] = []
-    for i in range(grid_size):
-        departure_times.append(departure_start_s + i * dep_step)
-        tof_values.append(tof_min_s + i * tof_step)
-
-    # Pre-compute departure body states (one per departure time)
-    dep_states: List[Optional[Tuple[Vec3, Vec3]]] = []
-    for dep_t in departure_times:
-        try:
-            r1, v1 = celestial_config.compute_body_state(cfg, from_helio, dep_t)
-            dep_states.append((r1, v1))
-        except Exception:
-            dep_states.append(None)
-
-    # Sentinel for failed solves
-    FAIL_DV = float("inf")
+    departure_times = [departure_start_s + i * dep_step for i in range(grid_size)]
+    tof_values = [tof_min_s + i * tof_step for i in range(grid_size)]
+    tof_penalties = _tof_penalties(tof_values)
+
+    # Pre-compute departure body states (one per departure time) and the
+    # arrival body state for every distinct arrival time on the grid, each
+    # in one batched pass instead of a config walk per cell.  Arrival states
+    # are then laid out once as arr_grid[dep_idx][tof_idx], so no later pass
+    # re-hashes arrival times.  Up to grid_size² arrival times are used only
+    # here, so they bypass the body-state LRU (same quantized epochs) rather
+    # than evicting every entry the leg planner relies on.
+    dep_states = _body_states_cached(from_helio, departure_times)
+    arr_index: Dict[int, int] = {}
+    arr_slots = [
+        [
+            arr_index.setdefault(round((dep_t + tof) / _BODY_STATE_TIME_QUANTUM_S), len(arr_index))
+            for tof in tof_values
+        ]
+        for dep_t in departure_times
+    ]
+    arr_states = celestial_config.compute_body_states(
+        _get_config(), to_helio, [tick * _BODY_STATE_TIME_QUANTUM_S for tick in arr_index],
+    )
+    arr_grid = [[arr_states[k] for k in slots] for slots in arr_slots]
 
-    # Build the grid: dv_grid[dep_idx][tof_idx]
+    # Build the grid: dv_grid[dep_idx][tof_idx].  Rows are independent once
+    # the body states are tabulated, so large grids fan out across processes.
+    row_args: List[_PorkchopRowArgs] = []
+    for dep_state, arr_row in zip(dep_states, arr_grid):
+        if dep_state is None:
+            continue
+        r1_vec, v1_body = dep_state
+        row_args.append((r1_vec, v1_body, arr_row))
+
+    row_fn = partial(
+        _porkchop_row,
+        tof_values=tof_values,
+        tof_penalties=tof_penalties,
+        mu_sun=mu_sun,
+        mu_from=mu_from,
+        r_park_from=r_park_from,
+        mu_to=mu_to,
+        r_park_to=r_park_to,
+        max_revs=max_revs,
+    )
+    computed_rows = _map_porkchop_rows(row_fn, row_args)
     dv_grid: List[List[Optional[float]]] = []
+    cell_grid: List[List[Optional[_PorkchopCell]]] = []
+    for dep_state in dep_states:
+        if dep_state is None:
+            dv_grid.append([None] * grid_size)
+            cell_grid.append([None] * grid_size)
+        else:
+            dv_row, cell_row = next(computed_rows)
+            dv_grid.append(dv_row)
+            cell_grid.append(cell_row)
     best_solutions: List[Dict[str, Any]] = []
-    global_best_dv = FAIL_DV
-
-    for dep_idx, dep_t in enumerate(departure_times):
-        row: List[Optional[float]] = []
-        dep_state = dep_states[dep_idx]
-
-        for tof_idx, tof in enumerate(tof_values):
-            if dep_state is None or tof <= 0:
-                row.append(None)
-                continue
-
-            r1_vec, v1_body = dep_state
-            arr_t = dep_t + tof
-
-            try:
-                r2_vec, v2_body = celestial_config.compute_body_state(cfg, to_helio, arr_t)
-            except Exception:
-                row.append(None)
-                continue
-
-            solutions = solve_lambert(r1_vec, r2_vec, tof, mu_sun, max_revs=max_revs)
-            if not solutions:
-                row.append(None)
-                continue
-
-            # Find best solution across all revolutions using quality score
-            best_score_this = FAIL_DV
-            best_dv_this = FAIL_DV
-            best_v1_this = None
-            best_v2_this = None
-            best_rev = 0
-            best_type = "short"
-
-            for sol_idx, (v1_sol, v2_sol) in enumerate(solutions):
-                dv_dep, dv_arr, dv_tot = compute_transfer_dv(
-                    v1_departure=v1_sol,
-                    v1_body=v1_body,
-                    v2_arrival=v2_sol,
-                    v2_body=v2_body,
-                    mu_departure=mu_from,
-                    r_park_departure=r_park_from,
-                    mu_arrival=mu_to,
-                    r_park_arrival=r_park_to,
-                )
-                # Determine revolution count and type from solution index
-                # Index 0 = 0-rev, then pairs: (1=1-rev short, 2=1-rev long),
-                # (3=2-rev short, 4=2-rev long), etc.
-                if sol_idx == 0:
-                    rev_count = 0
-                    sol_type = "short"
-                else:
-                    rev_count = (sol_idx - 1) // 2 + 1
-                    sol_type = "short" if (sol_idx - 1) % 2 == 0 else "long"
-
-                score = transfer_quality_score(dv_tot, tof, rev_count)
-                if score < best_score_this:
-                    best_score_this = score
-                    best_dv_this = dv_tot
-                    best_v1_this = v1_sol
-                    best_v2_this = v2_sol
-                    best_rev = rev_count
-                    best_type = sol_type
-
-            if best_dv_this < FAIL_DV:
-                row.append(round(best_dv_this, 1))
-
-                if best_dv_this < global_best_dv:
-                    global_best_dv = best_dv_this
-            else:
-                row.append(None)
-
-            continue
-
-        dv_grid.append(row)
 
     # Find top-N best solutions from the grid, ranked by quality score
     candidates: List[Tuple[float, float, int, int]] = []  # (score, dv, dep_idx, tof_idx)
@@ -880,81 +1292,46 @@ def compute_porkchop(
         for ti in range(grid_size):
             val = dv_grid[di][ti]
             if val is not None:
-                tof_val = tof_values[ti]
-                score = transfer_quality_score(val, tof_val, revolutions=0)
-                candidates.append((score, val, di, ti))
-
-    candidates.sort(key=lambda x: x[0])
-
-    # De-duplicate: keep solutions that are spread apart in the grid
-    seen_cells: set = set()
-    for score_val, dv_val, di, ti in candidates[:50]:
-        # Skip if too close to an already-picked solution
-        close = False
-        for sdi, sti in seen_cells:
-            if abs(di - sdi) <= 2 and abs(ti - sti) <= 2:
-                close = True
-                break
-        if close:
-            continue
+                candidates.append((val + tof_penalties[ti], val, di, ti))
 
-        dep_t = departure_times[di]
-        tof = tof_values[ti]
-        dep_state = dep_states[di]
-        if dep_state is None:
-            continue
+    # Only the best _PORKCHOP_TOP_CANDIDATES are ever examined; a bounded
+    # heap selects them (ties in grid order, like a stable sort).
+    top_candidates = heapq.nsmallest(_PORKCHOP_TOP_CANDIDATES, candidates, key=lambda x: x[0])
 
-        r1_vec, v1_body = dep_state
-        arr_t = dep_t + tof
-
-        try:
-            r2_vec, v2_body = celestial_config.compute_body_state(cfg, to_helio, arr_t)
-        except Exception:
+    # De-duplicate: keep solutions that are spread apart in the grid.  Each
+    # pick blocks its ±2-cell neighbourhood, so the check is a set lookup.
+    blocked_cells: set = set()
+    for score_val, dv_val, di, ti in top_candidates:
+        if (di, ti) in blocked_cells:
             continue
 
-        solutions = solve_lambert(r1_vec, r2_vec, tof, mu_sun, max_revs=max_revs)
-        if not solutions:
+        cell = cell_grid[di][ti]
+        if cell is None:
             continue
+        v1_sol, v2_sol, dv_dep, dv_arr, dv_tot, sol_idx, score = cell
+        rev_count, sol_type = _solution_rev_type(sol_idx)
 
-        # Re-evaluate for detailed output with quality scoring
-        best_sol_detail = None
-        best_sol_score = FAIL_DV
-        for sol_idx, (v1_sol, v2_sol) in enumerate(solutions):
-            dv_dep, dv_arr, dv_tot = compute_transfer_dv(
-                v1_departure=v1_sol, v1_body=v1_body,
-                v2_arrival=v2_sol, v2_body=v2_body,
-                mu_departure=mu_from, r_park_departure=r_park_from,
-                mu_arrival=mu_to, r_park_arrival=r_park_to,
-            )
-            if sol_idx == 0:
-                rev_count = 0
-                sol_type = "short"
-            else:
-                rev_count = (sol_idx - 1) // 2 + 1
-                sol_type = "short" if (sol_idx - 1) % 2 == 0 else "long"
-
-            score = transfer_quality_score(dv_tot, tof, rev_count)
-            if score < best_sol_score:
-                best_sol_score = score
-                v_inf_dep = _norm(_sub(v1_sol, v1_body))
-                v_inf_arr = _norm(_sub(v2_sol, v2_body))
-                best_sol_detail = {
-                    "departure_time": round(dep_t, 1),
-                    "arrival_time": round(arr_t, 1),
-                    "tof_s": round(tof, 1),
-                    "dv_m_s": round(dv_tot, 1),
-                    "dv_depart_m_s": round(dv_dep, 1),
-                    "dv_arrive_m_s": round(dv_arr, 1),
-                    "v_inf_depart_km_s": round(v_inf_dep, 3),
-                    "v_inf_arrive_km_s": round(v_inf_arr, 3),
-                    "revolutions": rev_count,
-                    "type": sol_type,
-                    "quality_score": round(score, 1),
-                }
-
-        if best_sol_detail is not None:
-            best_solutions.append(best_sol_detail)
-            seen_cells.add((di, ti))
+        dep_t = departure_times[di]
+        tof = tof_values[ti]
+        arr_t = dep_t + tof
+        v1_body = dep_states[di][1]
+        v2_body = arr_grid[di][ti][1]
+        best_solutions.append({
+            "departure_time": round(dep_t, 1),
+            "arrival_time": round(arr_t, 1),
+            "tof_s": round(tof, 1),
+            "dv_m_s": round(dv_tot, 1),
+            "dv_depart_m_s": round(dv_dep, 1),
+            "dv_arrive_m_s": round(dv_arr, 1),
+            "v_inf_depart_km_s": round(_dist(v1_sol, v1_body), 3),
+            "v_inf_arrive_km_s": round(_dist(v2_sol, v2_body), 3),
+            "revolutions": rev_count,
+            "type": sol_type,
+            "quality_score": round(score, 1),
+        })
+        for bdi in range(di - 2, di + 3):
+            for bti in range(ti - 2, ti + 3):
+                blocked_cells.add((bdi, bti))
 
         if len(best_solutions) >= 5:
             break
@@ -1046,7 +1423,6 @@ def compute_soi_transfer_trajectory(
          "points": [[x_km, y_km], ...]}
     or None if this is not an SOI transfer.
     """
-    cfg = _get_config()
     loc_map = _get_location_body_map()
 
     from_body = loc_map.get(from_location, "")
@@ -1064,8 +1440,8 @@ def compute_soi_transfer_trajectory(
     def _body_pos_in_parent_frame(body_id: str, time_s: float) -> Vec3:
         if body_id == parent_body:
             return (0.0, 0.0, 0.0)
-        body_r, _ = celestial_config.compute_body_state(cfg, body_id, time_s)
-        parent_r, _ = celestial_config.compute_body_state(cfg, parent_body, time_s)
+        body_r, _ = _body_state_cached(body_id, time_s)
+        parent_r, _ = _body_state_cached(parent_body, time_s)
         return (body_r[0] - parent_r[0], body_r[1] - parent_r[1], body_r[2] - parent_r[2])
 
     # Determine departure and arrival radii + target direction
@@ -1180,6 +1556,11 @@ def compute_soi_transfer_trajectory(
 
 
 def invalidate_config_cache() -> None:
-    """Clear the cached config and Lambert result cache (call after config reload)."""
+    """Clear the cached config, derived lookups and Lambert result cache (call after config reload)."""
     _CONFIG_CACHE.clear()
+    _body_parent_id.cache_clear()
+    _resolve_heliocentric_body.cache_clear()
+    _body_state_at_tick.cache_clear()
+    get_synodic_period_s.cache_clear()
+    _parking_orbit_radius_km.cache_clear()
     clear_lambert_cache()